@@ -191,3 +191,71 @@ BEGIN
     RETURN result;
 END;
 $$ LANGUAGE plpgsql;
+
+-- Function to export every isochrone as a single GeoJSON FeatureCollection
+-- Geometries are simplified and rounded in PostGIS so the client does no decoding
+-- p_property_fields limits which metadata keys are copied into properties (NULL keeps all)
+CREATE OR REPLACE FUNCTION get_isochrones_geojson(
+    p_tolerance FLOAT DEFAULT 0.0001,
+    p_precision INTEGER DEFAULT 5,
+    p_property_fields TEXT[] DEFAULT NULL
+)
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'type',     'FeatureCollection',
+        'features', COALESCE(jsonb_agg(features.feature ORDER BY features.id), '[]'::jsonb)
+    )
+    FROM (
+        SELECT
+            id,
+            jsonb_build_object(
+                'type',       'Feature',
+                'geometry',   ST_AsGeoJSON(
+                    ST_SimplifyPreserveTopology(geometry, p_tolerance), p_precision
+                )::jsonb,
+                'properties', jsonb_build_object('name', name, 'value', value)
+                              || COALESCE(
+                                  (
+                                      SELECT jsonb_object_agg(m.key, m.value)
+                                      FROM jsonb_each(metadata) AS m
+                                      WHERE p_property_fields IS NULL
+                                         OR m.key = ANY(p_property_fields)
+                                  ),
+                                  '{}'::jsonb
+                              )
+            ) AS feature
+        FROM isochrones
+    ) features;
+$$ LANGUAGE sql STABLE;
+
+-- Function to write geocoding results for many rows in one statement
+-- p_rows is a JSON array of {"id", "latitude", "longitude", "error"} objects;
+-- column names default to the application's table configuration
+CREATE OR REPLACE FUNCTION update_geocoded_rows(
+    p_table TEXT,
+    p_rows JSONB,
+    p_id_column TEXT DEFAULT 'id',
+    p_latitude_column TEXT DEFAULT 'latitude',
+    p_longitude_column TEXT DEFAULT 'longitude'
+)
+RETURNS INTEGER AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    EXECUTE format(
+        'UPDATE %1$I AS t
+         SET %3$I = r.latitude, %4$I = r.longitude, error = r.error
+         FROM jsonb_to_recordset($1) AS r(
+             id BIGINT,
+             latitude DOUBLE PRECISION,
+             longitude DOUBLE PRECISION,
+             error TEXT
+         )
+         WHERE t.%2$I = r.id',
+        p_table, p_id_column, p_latitude_column, p_longitude_column
+    ) USING p_rows;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$ LANGUAGE plpgsql;
@@ -77,7 +77,7 @@ from src.utils.error_utils import (
 from src.utils.geojson_utils import validate_geojson
 from src.routes.api import api_bp
 from src.config import IMAGES, MAPS, TABLES
-from src.config import get_public_api_tables
+from src.config import get_public_api_tables, get_public_api_fields
 from src.config.database import get_db_client
 from src.maps import generate_maps
 
@@ -88,6 +88,7 @@ setup_structured_logging(log_file="app.log", level=logging.INFO)
 app.config["TABLES"] = None
 app.config["SUPABASE_CLIENT"] = None
 app.config["ALLOWED_PUBLIC_TABLES"] = get_public_api_tables()
+app.config["PUBLIC_API_FIELDS"] = get_public_api_fields()
 
 
 # 2. ERROR HANDLING & MIDDLEWARE
@@ -13,6 +13,7 @@ Key Components:
    - DATA: Directory for data storage
    - ISOCHRONES: Directory for isochrone GeoJSON files
    - LOCATIONS: Directory for location CSV files
+   - GEOCODE_CACHE: On-disk cache of geocoder results (shelve)
    - MAPS: Directory for generated HTML maps
    - STATIC: Directory for static assets (CSS, JS, images)
 
@@ -23,6 +24,10 @@ Key Components:
    - colors: Color palette for map features
    - tiles: Tile provider configuration with preferred formats
 
+   Geometry Settings (GEOMETRY_SETTINGS):
+   - tolerance: Simplification tolerance for isochrone polygons
+   - precision: Decimal places kept per coordinate
+
 3. Table Configurations (TABLES):
    - Schema definitions for database tables and related CSV files
    - Field mappings between database and application
@@ -50,6 +55,10 @@ centers_file = Path(LOCATIONS, "geocoded_chapters.csv")
 # Get public API tables
 from src.config import get_public_api_tables
 public_tables = get_public_api_tables()
+
+# Get the columns each public table exposes through ?fields=
+from src.config import get_public_api_fields
+public_fields = get_public_api_fields()
 """
 
 # Standard library imports
@@ -70,6 +79,15 @@ CSS = Path(STATIC, "css")
 JS = Path(STATIC, "js")
 IMAGES = Path(STATIC, "images")
 
+# Persistent geocoder results keyed by normalized query (shelve base name)
+GEOCODE_CACHE = Path(DATA, "geocode_cache")
+
+# Precomputed isochrone GeoJSON served by /api/isochrones while fresh (seconds)
+# and built from the table version recorded in its sidecar file
+ISOCHRONES_ASSET = Path(STATIC, "isochrones.geojson.gz")
+ISOCHRONES_ASSET_VERSION = Path(STATIC, "isochrones.geojson.gz.version")
+ISOCHRONES_ASSET_TTL = 3600
+
 # Define Map settings
 MAP_SETTINGS = {
     "zoom": 8,
@@ -131,6 +149,12 @@ MAP_SETTINGS = {
     ],
 }
 
+# Geometry settings applied to isochrones before they are emitted as GeoJSON
+GEOMETRY_SETTINGS = {
+    "tolerance": 1e-4,  # Douglas-Peucker tolerance in degrees (~10 m)
+    "precision": 5,  # Decimal places kept per coordinate (~1 m)
+}
+
 # Reserved for future use
 MODES = {
     "use-local": {},
@@ -142,6 +166,7 @@ TABLES = {
     "centers": {
         "table_name": "city_centers",
         "needs_geocoding": True,
+        "update_rpc": "update_geocoded_rows",  # Bulk geocoding write-back
         "public_api_visible": True,
         "generate_map": True,
         "columns": {
@@ -157,6 +182,7 @@ TABLES = {
     "locations": {
         "table_name": "locations",
         "needs_geocoding": True,
+        "update_rpc": "update_geocoded_rows",  # Bulk geocoding write-back
         "public_api_visible": True,
         "generate_map": True,
         "columns": {
@@ -172,6 +198,9 @@ TABLES = {
     },
     "isochrones": {
         "table_name": "isochrones",
+        "geojson_rpc": "get_isochrones_geojson",  # PostGIS FeatureCollection export
+        # Metadata keys copied into feature properties (omit the key to keep all)
+        "property_fields": [],
         "needs_geocoding": False,  # This table doesn't need geocoding
         "public_api_visible": True,
         "generate_map": False,
@@ -185,6 +214,7 @@ TABLES = {
             "center": "center",
             "geometry": "geometry",
             "metadata": "metadata",
+            "updated_at": "updated_at",
         },
     },
     "health_check": {
@@ -211,6 +241,15 @@ def get_public_api_tables():
     ]
 
 
+def get_public_api_fields():
+    """Map each public table name to the set of columns the API may project."""
+    return {
+        config["table_name"]: set(config.get("columns", {}).values())
+        for _, config in TABLES.items()
+        if config.get("public_api_visible", False)
+    }
+
+
 # Ensure directories exist
 directories_to_ensure = [DATA, LOGS, MAPS, IMAGES, ISOCHRONES, LOCATIONS]
 ensure_dirs_exist(directories_to_ensure)
@@ -17,7 +17,11 @@ Key Features:
   - Local CSV files
 * Efficient processing:
   - Only geocodes records with missing or erroneous coordinates
-  - Tracks which records need updating
+  - Geocodes records concurrently and deduplicates repeated queries
+  - Caches successful lookups on disk across runs (disable with --no-cache)
+  - Throttles requests to the service rate limit and retries transient errors
+  - Tracks which records changed and writes their coordinates back in bulk
+  - Streams large CSV files in bounded-memory chunks (--chunksize)
 * Comprehensive error handling and structured logging
 
 Operating Modes:
@@ -29,6 +33,8 @@ Functions:
 ---------
 * initialize_geolocator: Initialize a secure geolocator with SSL context
 * geocode: Geocode a single address with multi-stage fallback
+* geocode_batch: Geocode many records concurrently, issuing each distinct query once
+* build_queries: Build the geocoder query strings for whole columns at once
 * geocode_dataset: Process any DataFrame regardless of source
 * process_csv_source: Process a CSV file source
 * process_db_source: Process a table from the database
@@ -46,6 +52,7 @@ Dependencies:
   - pandas: Data manipulation and CSV handling
   - geopy: Geocoding functionality (Nominatim service)
   - certifi: SSL certificate validation
+  - pyarrow (optional): Faster CSV parsing when installed
 
 * Project Components:
   - src.utils: Logging, error handling, and client utilities
@@ -68,6 +75,9 @@ Usage Examples:
 
    # Process local CSV files
    $ python -m src.geocode --mode use-local
+
+   # Ignore the on-disk geocoder cache
+   $ python -m src.geocode --mode use-local --no-cache
 """
 
 # Standard Library Imports
@@ -76,6 +86,12 @@ import sys
 import ssl
 import logging
 import argparse
+import shelve
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 
 # Add the project root to the Python path before other project imports
@@ -83,8 +99,16 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Third-party Imports
 import certifi
+from geopy.exc import GeocoderRateLimited, GeocoderTimedOut, GeocoderUnavailable
 from geopy.geocoders import Nominatim
 
+try:
+    import pyarrow  # noqa: F401
+
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
 # Local Imports
 from src.utils.logging_utils import (
     setup_structured_logging,
@@ -99,12 +123,31 @@ from src.utils.error_utils import (
     DataProcessingError,
 )
 from src.utils.data_utils import load_data
+from src.utils.retry_util import backoff_delay
 from src.utils.client_utils import get_supabase_client
-from src.config import TABLES, LOCATIONS
+from src.config import TABLES, LOCATIONS, GEOCODE_CACHE
 
 # Configure structured logging
 setup_structured_logging(log_file="geocode.log")
 
+# Concurrent geocoding requests issued by geocode_batch
+GEOCODE_MAX_WORKERS = 4
+
+# Nominatim allows at most one request per second across all workers
+GEOCODE_MIN_DELAY = 1.0
+
+# Transient service errors are retried with jittered, doubling waits up to the cap
+GEOCODE_MAX_RETRIES = 3
+GEOCODE_RETRY_WAIT = 2.0
+GEOCODE_MAX_RETRY_WAIT = 60.0
+RETRYABLE_GEOCODER_ERRORS = (GeocoderTimedOut, GeocoderUnavailable, GeocoderRateLimited)
+
+# Changed rows written back per database request
+DB_UPDATE_BATCH_SIZE = 200
+
+# Location restored from the on-disk cache; mirrors the geopy attributes used here
+CachedLocation = namedtuple("CachedLocation", ["latitude", "longitude", "raw"])
+
 
 @handle_exception(
     custom_mapping={
@@ -130,7 +173,15 @@ def initialize_geolocator():
 
 @handle_exception(custom_mapping={Exception: APIConnectionError})
 @with_log_context(module="geocode", operation="geocode_address")
-def geocode(address, city, state, zip_code, geolocator=None, location_name=None):
+def geocode(
+    address,
+    city,
+    state,
+    zip_code,
+    geolocator=None,
+    location_name=None,
+    queries=None,
+):
     """
     Geocode an address and return latitude, longitude, and error.
     If address geocoding fails but location_name is provided, will attempt to geocode using the location name.
@@ -142,6 +193,8 @@ def geocode(address, city, state, zip_code, geolocator=None, location_name=None)
         zip_code: ZIP code
         geolocator: Optional geolocator instance (creates one if None)
         location_name: Optional name of a location (like a park, landmark, etc.)
+        queries: Optional prebuilt (full_address, city_state_zip) query strings,
+            as produced by build_queries; built from the components if None
 
     Returns:
         tuple: (latitude, longitude, error_message)
@@ -157,11 +210,16 @@ def geocode(address, city, state, zip_code, geolocator=None, location_name=None)
     if address is None or (isinstance(address, float) and pd.isna(address)):
         address = ""
 
+    if queries is None:
+        parts = [str(city), str(state), str(zip_code)]
+        queries = (
+            ", ".join(filter(None, [str(address)] + parts)),
+            ", ".join(filter(None, parts)),
+        )
+    full_address, city_state_zip = queries
+
     # Try with address first
     if address and str(address).strip() != "":
-        full_address = ", ".join(
-            filter(None, [str(address), str(city), str(state), str(zip_code)])
-        )
 
         with LogContext(address=full_address):
             logging.info(f"Geocoding address: {full_address}")
@@ -223,8 +281,6 @@ def geocode(address, city, state, zip_code, geolocator=None, location_name=None)
 
     # Try with city, state, zip_code as a fallback when neither address nor location_name worked
     if city or state or zip_code:
-        city_state_zip = ", ".join(filter(None, [str(city), str(state), str(zip_code)]))
-
         with LogContext(city_state_zip=city_state_zip):
             logging.info(
                 f"Fallback geocoding with city, state, zip_code: {city_state_zip}"
@@ -267,6 +323,215 @@ def geocode(address, city, state, zip_code, geolocator=None, location_name=None)
     return None, None, "Location not found"
 
 
+class _DedupingGeolocator:
+    """
+    Geolocator wrapper that sends each distinct query string only once.
+
+    Concurrent callers asking for a query that is already in flight wait for
+    the same result (or exception) instead of issuing a second request. Empty
+    results are kept too, so a miss is not retried within the run.
+    """
+
+    def __init__(self, geolocator, results=None):
+        self._geolocator = geolocator
+        self._results = {} if results is None else results
+        self._lock = threading.Lock()
+
+    def geocode(self, query):
+        with self._lock:
+            result = self._results.get(query)
+            is_owner = result is None
+            if is_owner:
+                result = self._results[query] = Future()
+
+        if is_owner:
+            try:
+                result.set_result(self._geolocator.geocode(query))
+            except Exception as e:
+                result.set_exception(e)
+        return result.result()
+
+
+class _ThrottledGeolocator:
+    """
+    Geolocator wrapper that spaces requests out and retries transient errors.
+
+    Requests from all threads share one schedule, so no two start less than
+    min_delay_seconds apart; timeouts, unavailability and HTTP 429 responses
+    are retried with exponential backoff.
+    """
+
+    def __init__(self, geolocator, min_delay_seconds):
+        self._geolocator = geolocator
+        self._min_delay = min_delay_seconds
+        self._next_request = 0.0
+        self._lock = threading.Lock()
+
+    def _wait_turn(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_request)
+            self._next_request = start + self._min_delay
+        if start > now:
+            time.sleep(start - now)
+
+    def geocode(self, query):
+        for attempt in range(GEOCODE_MAX_RETRIES + 1):
+            self._wait_turn()
+            try:
+                return self._geolocator.geocode(query)
+            except RETRYABLE_GEOCODER_ERRORS as e:
+                if attempt == GEOCODE_MAX_RETRIES:
+                    raise
+                wait = backoff_delay(
+                    attempt, GEOCODE_RETRY_WAIT, GEOCODE_MAX_RETRY_WAIT
+                )
+                logging.warning(
+                    "Retrying geocode for %r in %.1fs after: %s", query, wait, e
+                )
+                time.sleep(wait)
+
+
+class _PersistentGeolocator:
+    """
+    Geolocator wrapper that keeps successful lookups in a shelve file.
+
+    Keys are the query strings lowercased with whitespace collapsed, so
+    repeated runs over the same records do not hit the network again.
+    """
+
+    def __init__(self, geolocator, cache_path):
+        self._geolocator = geolocator
+        self._shelf = shelve.open(str(cache_path))
+        self._lock = threading.Lock()
+
+    def geocode(self, query):
+        key = " ".join(query.lower().split())
+        with self._lock:
+            cached = self._shelf.get(key)
+        if cached is not None:
+            return CachedLocation(*cached)
+
+        location = self._geolocator.geocode(query)
+        if location:
+            with self._lock:
+                self._shelf[key] = (
+                    location.latitude,
+                    location.longitude,
+                    location.raw,
+                )
+        return location
+
+    def close(self):
+        with self._lock:
+            self._shelf.close()
+
+
+@with_log_context(module="geocode", operation="geocode_batch")
+def geocode_batch(
+    records,
+    geolocator=None,
+    max_workers=GEOCODE_MAX_WORKERS,
+    cache_path=None,
+    queries=None,
+    query_results=None,
+):
+    """
+    Geocode many records concurrently, sharing results for repeated queries.
+
+    Args:
+        records: Iterable of (address, city, state, zip_code, location_name) tuples
+        geolocator: Optional geolocator instance (creates one if None)
+        max_workers: Number of records geocoded in parallel
+        cache_path: Optional shelve file of earlier lookups to read and extend
+        queries: Optional prebuilt query pairs per record (see build_queries)
+        query_results: Optional dict reused across sequential calls so repeated
+            queries are answered once per run rather than once per call
+
+    Returns:
+        list: (latitude, longitude, error_message) per record, in input order
+    """
+    if geolocator is None:
+        geolocator = initialize_geolocator()
+    geolocator = _ThrottledGeolocator(geolocator, GEOCODE_MIN_DELAY)
+
+    # Cache hits are answered before the throttle is consulted
+    persistent_geolocator = None
+    if cache_path is not None:
+        geolocator = persistent_geolocator = _PersistentGeolocator(
+            geolocator, cache_path
+        )
+    shared_geolocator = _DedupingGeolocator(geolocator, query_results)
+
+    def geocode_record(record, record_queries=None):
+        address, city, state, zip_code, location_name = record
+        return geocode(
+            address,
+            city,
+            state,
+            zip_code,
+            geolocator=shared_geolocator,
+            location_name=location_name,
+            queries=record_queries,
+        )
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            if queries is None:
+                return list(executor.map(geocode_record, records))
+            return list(executor.map(geocode_record, records, queries))
+    finally:
+        if persistent_geolocator is not None:
+            persistent_geolocator.close()
+
+
+def build_queries(address, city, state, zip_code):
+    """
+    Build the geocoder query strings for whole columns at once.
+
+    Each component is formatted with str() and empty ones are skipped, exactly
+    as geocode does for a single record.
+
+    Args:
+        address, city, state, zip_code: Equal-length sequences of components
+
+    Returns:
+        list: (full_address, city_state_zip) pairs, one per row
+    """
+
+    def join(*columns):
+        # Every non-empty part contributes ", part"; the leading separator is cut
+        pieces = [", " + pd.Series(col, dtype=object).astype(str) for col in columns]
+        pieces = [p.where(p != ", ", "") for p in pieces]
+        return sum(pieces[1:], pieces[0]).str[2:]
+
+    city_state_zip = join(city, state, zip_code)
+    full_address = join(address, city, state, zip_code)
+    return list(zip(full_address.tolist(), city_state_zip.tolist()))
+
+
+def _column_values(data, column, default=""):
+    """Return a column as a list, or default for every row if it is missing."""
+    if column in data.columns:
+        return data[column].tolist()
+    return [default] * len(data)
+
+
+def _changed(old, new):
+    """Elementwise "value differs" for two arrays, treating missing as equal."""
+    return ~((old == new) | (pd.isna(old) & pd.isna(new)))
+
+
+def _assign_column(data, index, column, values, numeric=False):
+    """Write values into one column for the given rows in a single assignment."""
+    if numeric:
+        # None becomes NaN, keeping the column float64
+        values = np.array(values, dtype="float64")
+    elif data[column].dtype != object:
+        data[column] = data[column].astype(object)
+    data.loc[index, column] = values
+
+
 @handle_exception(
     custom_mapping={
         DataAccessError: DataAccessError,
@@ -275,7 +540,9 @@ def geocode(address, city, state, zip_code, geolocator=None, location_name=None)
     }
 )
 @with_log_context(module="geocode", operation="geocode_dataset")
-def geocode_dataset(data, columns_config, geolocator=None):
+def geocode_dataset(
+    data, columns_config, geolocator=None, cache_path=None, query_results=None
+):
     """
     Generic function to geocode any dataset (DataFrame) regardless of source.
 
@@ -283,6 +550,8 @@ def geocode_dataset(data, columns_config, geolocator=None):
         data: DataFrame containing records to geocode
         columns_config: Dictionary mapping column roles to column names
         geolocator: Optional geolocator instance (creates one if None)
+        cache_path: Optional on-disk geocoder cache (see geocode_batch)
+        query_results: Optional per-run query results (see geocode_batch)
 
     Returns:
         DataFrame with geocoded records, success_count, error_count
@@ -290,21 +559,33 @@ def geocode_dataset(data, columns_config, geolocator=None):
     if geolocator is None:
         geolocator = initialize_geolocator()
 
-    # Ensure required columns exist
+    # Ensure required columns exist; coordinates are float64 with NaN for missing
     for col in ["latitude", "longitude", "error"]:
         col_name = columns_config.get(col, col)
         if col_name not in data.columns:
             data[col_name] = None
+        if col != "error":
+            data[col_name] = pd.to_numeric(data[col_name], errors="coerce").astype(
+                "float64"
+            )
 
     # Add a flag to track which rows need updates
     data["_needs_update"] = False
 
-    # Filter rows that need geocoding
-    rows_to_process = data[
-        data[columns_config["latitude"]].isna()
-        | data[columns_config["longitude"]].isna()
+    # Filter rows that need geocoding; only the address columns are copied
+    lat_col, lon_col = columns_config["latitude"], columns_config["longitude"]
+    mask = (
+        data[lat_col].isna()
+        | data[lon_col].isna()
         | (data["error"].notna() & (data["error"] != ""))
+    )
+    address_keys = ("address", "city", "state", "zip_code")
+    address_cols = [
+        col
+        for col in [columns_config.get(key, key) for key in address_keys] + ["name"]
+        if col in data.columns
     ]
+    rows_to_process = data.loc[mask, address_cols]
 
     if rows_to_process.empty:
         logging.info("All records are already geocoded")
@@ -315,44 +596,52 @@ def geocode_dataset(data, columns_config, geolocator=None):
     success_count = 0
     error_count = 0
 
-    # Process each row
-    for index, row in rows_to_process.iterrows():
-        # Get location name if available
-        location_name = row.get("name", None) if "name" in columns_config else None
-
-        # Extract address components
-        address = row.get(columns_config.get("address", ""), "")
-        city = row.get(columns_config["city"], "")
-        state = row.get(columns_config["state"], "")
-        zip_code = row.get(columns_config["zip_code"], "")
-
-        # Geocode
-        with LogContext(record_id=index):
-            lat, lon, error = geocode(
-                address,
-                city,
-                state,
-                zip_code,
-                geolocator=geolocator,
-                location_name=location_name,
-            )
+    # Pull the address components out as plain lists once, rather than building
+    # a Series per row with iterrows()
+    use_name = "name" in columns_config
+    names = _column_values(rows_to_process, "name", default=None)
+    components = (
+        _column_values(rows_to_process, columns_config.get("address", "")),
+        _column_values(rows_to_process, columns_config["city"]),
+        _column_values(rows_to_process, columns_config["state"]),
+        _column_values(rows_to_process, columns_config["zip_code"]),
+    )
+    records = zip(*components, names if use_name else [None] * len(rows_to_process))
+    results = geocode_batch(
+        records,
+        geolocator=geolocator,
+        cache_path=cache_path,
+        queries=build_queries(*components),
+        query_results=query_results,
+    )
 
-            # Update the row
-            data.at[index, columns_config["latitude"]] = lat
-            data.at[index, columns_config["longitude"]] = lon
-            data.at[index, "error"] = error
-            data.at[index, "_needs_update"] = True
-
-            # Count success/failure
-            if lat is not None and lon is not None:
-                success_count += 1
-                # Only clear error if there isn't one from geocode function
-                if not error:
-                    data.at[index, "error"] = None
-                logging.info(f"Successfully geocoded record {index}")
-            else:
-                error_count += 1
-                logging.warning(f"Failed to geocode record {index}: {error}")
+    # Collect the results per column, then write each column once
+    lats, lons, errors = [], [], []
+    for index, (lat, lon, error) in zip(rows_to_process.index, results):
+        # Count success/failure
+        if lat is not None and lon is not None:
+            success_count += 1
+            # Only clear error if there isn't one from geocode function
+            error = error or None
+            logging.info(f"Successfully geocoded record {index}")
+        else:
+            error_count += 1
+            logging.warning(f"Failed to geocode record {index}: {error}")
+        lats.append(lat)
+        lons.append(lon)
+        errors.append(error)
+
+    # Update the processed rows, flagging only those whose values changed
+    processed = rows_to_process.index
+    needs_update = np.zeros(len(processed), dtype=bool)
+    for column, values, numeric in (
+        (lat_col, np.array(lats, dtype="float64"), True),
+        (lon_col, np.array(lons, dtype="float64"), True),
+        ("error", np.array(errors, dtype=object), False),
+    ):
+        needs_update |= _changed(data.loc[processed, column].to_numpy(), values)
+        _assign_column(data, processed, column, values, numeric)
+    data.loc[processed, "_needs_update"] = needs_update
 
     logging.info(f"Geocoding complete. {success_count} succeeded, {error_count} failed")
     return data, success_count, error_count
@@ -360,16 +649,21 @@ def geocode_dataset(data, columns_config, geolocator=None):
 
 @handle_exception(custom_mapping={Exception: DataAccessError})
 @with_log_context(module="geocode", operation="load_csv_data")
-def load_csv_data(file_path, dtype=None):
+def load_csv_data(file_path, dtype=None, usecols=None, chunksize=None):
     """
     Load data from a CSV file.
 
+    Whole files are parsed with the multithreaded pyarrow engine when pyarrow
+    is installed; chunked reads always use the C engine, which supports them.
+
     Args:
         file_path: Path to CSV file
         dtype: Data types for columns (optional)
+        usecols: Subset of columns to parse (optional, default all)
+        chunksize: Rows per chunk; when set, an iterator of DataFrames is returned
 
     Returns:
-        pandas.DataFrame with loaded data
+        pandas.DataFrame with loaded data, or a chunk iterator if chunksize is set
 
     Raises:
         DataAccessError: If file cannot be loaded
@@ -379,7 +673,15 @@ def load_csv_data(file_path, dtype=None):
 
         if os.path.exists(file_path):
             try:
-                df = pd.read_csv(file_path, dtype=dtype)
+                if chunksize:
+                    logging.info(f"Streaming {file_path} in chunks of {chunksize} rows")
+                    return pd.read_csv(
+                        file_path, dtype=dtype, usecols=usecols, chunksize=chunksize
+                    )
+
+                df = pd.read_csv(
+                    file_path, dtype=dtype, usecols=usecols, engine=CSV_ENGINE
+                )
                 logging.info(f"Successfully loaded {len(df)} rows from {file_path}")
                 return df
             except Exception as e:
@@ -390,26 +692,54 @@ def load_csv_data(file_path, dtype=None):
             raise FileNotFoundError(f"{file_path} not found.")
 
 
+def _csv_dtypes(columns_config):
+    """Column types for geocoding inputs: text ZIP codes and categorical states."""
+    return {
+        columns_config.get("zip_code", "zip_code"): str,
+        columns_config.get("state", "state"): "category",
+    }
+
+
 @handle_exception(custom_mapping={Exception: DataProcessingError})
 @with_log_context(module="geocode", operation="process_csv_source")
-def process_csv_source(input_file, output_file, columns_config):
-    """Process a single CSV data source."""
+def process_csv_source(
+    input_file, output_file, columns_config, cache_path=GEOCODE_CACHE, chunksize=None
+):
+    """
+    Process a single CSV data source.
+
+    With chunksize set, the file is geocoded chunksize rows at a time so that
+    only one chunk is held in memory.
+    """
     with LogContext(input=input_file, output=output_file):
+        if chunksize:
+            _process_csv_chunks(
+                input_file, output_file, columns_config, cache_path, chunksize
+            )
+            return
+
         # Load data
-        data = load_csv_data(input_file, dtype={"zip_code": str})
+        # Every column is kept because the whole frame is written back out
+        data = load_csv_data(input_file, dtype=_csv_dtypes(columns_config))
         logging.info(f"Loaded {len(data)} rows from {input_file}")
 
         # Process geocoding
         geolocator = initialize_geolocator()
         processed_data, success_count, error_count = geocode_dataset(
-            data, columns_config, geolocator
+            data, columns_config, geolocator, cache_path=cache_path
         )
 
-        # Save results if any changes were made
-        if success_count > 0 or error_count > 0:
-            # Remove the temporary tracking column
+        # Save results if any changes were made. Rewriting the input in place
+        # is skipped when every processed row came back unchanged
+        changed = success_count > 0 or error_count > 0
+        in_place = os.path.abspath(input_file) == os.path.abspath(output_file)
+        if changed and in_place and "_needs_update" in processed_data.columns:
+            changed = bool(processed_data["_needs_update"].any())
+
+        if changed:
+            # Remove the temporary tracking column in place rather than copying
             if "_needs_update" in processed_data.columns:
-                processed_data = processed_data.drop(columns=["_needs_update"])
+                del processed_data["_needs_update"]
 
             processed_data.to_csv(output_file, index=False)
             logging.info(f"Saved {len(processed_data)} rows to {output_file}")
@@ -417,6 +747,48 @@ def process_csv_source(input_file, output_file, columns_config):
             logging.info(f"No changes needed for {input_file}")
 
 
+def _process_csv_chunks(input_file, output_file, columns_config, cache_path, chunksize):
+    """Geocode a CSV chunk by chunk, replacing the output only if a row changed."""
+    chunks = load_csv_data(
+        input_file, dtype=_csv_dtypes(columns_config), chunksize=chunksize
+    )
+    geolocator = initialize_geolocator()
+    in_place = os.path.abspath(input_file) == os.path.abspath(output_file)
+
+    # Chunks go to a temporary file, since the output may be the file being read
+    temp_file = f"{output_file}.tmp"
+    query_results = {}
+    changed = False
+    total_rows = 0
+    try:
+        for i, chunk in enumerate(chunks):
+            processed_data, success_count, error_count = geocode_dataset(
+                chunk,
+                columns_config,
+                geolocator,
+                cache_path=cache_path,
+                query_results=query_results,
+            )
+            if success_count > 0 or error_count > 0:
+                changed = changed or not in_place
+                changed = changed or bool(processed_data["_needs_update"].any())
+
+            del processed_data["_needs_update"]
+            processed_data.to_csv(
+                temp_file, mode="w" if i == 0 else "a", header=i == 0, index=False
+            )
+            total_rows += len(processed_data)
+
+        if changed:
+            os.replace(temp_file, output_file)
+            logging.info(f"Saved {total_rows} rows to {output_file}")
+        else:
+            logging.info(f"No changes needed for {input_file}")
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+
 @handle_exception(
     custom_mapping={
         DataAccessError: DataAccessError,
@@ -425,7 +797,7 @@ def process_csv_source(input_file, output_file, columns_config):
     }
 )
 @with_log_context(module="geocode", operation="process_csv_mode")
-def process_csv_mode():
+def process_csv_mode(cache_path=GEOCODE_CACHE, chunksize=None):
     """Process geocoding in CSV mode with structured error handling."""
     logging.info("Starting CSV-based geocoding process...")
 
@@ -454,6 +826,8 @@ def process_csv_mode():
                         input_file,
                         geocoded_file,
                         table_config["columns"],
+                        cache_path=cache_path,
+                        chunksize=chunksize,
                     )
             except Exception as e:
                 logging.error(f"Failed processing {table_name} CSV: {e}")
@@ -469,13 +843,14 @@ def process_csv_mode():
     }
 )
 @with_log_context(module="geocode", operation="process_db_source")
-def process_db_source(table_config, supabase_client):
+def process_db_source(table_config, supabase_client, cache_path=GEOCODE_CACHE):
     """
     Process a table to geocode missing or erroneous latitude/longitude.
 
     Args:
         table_config: Configuration dictionary for the table
         supabase_client: Initialized Supabase client
+        cache_path: On-disk geocoder cache, or None to always query the service
 
     Raises:
         DataAccessError: If database access fails
@@ -494,35 +869,93 @@ def process_db_source(table_config, supabase_client):
         # Process geocoding
         geolocator = initialize_geolocator()
         processed_data, success_count, error_count = geocode_dataset(
-            data, columns, geolocator
+            data, columns, geolocator, cache_path=cache_path
         )
 
         # Update records in database
         if success_count > 0 or error_count > 0:
             rows_updated = 0
-            for _, row in processed_data[processed_data["_needs_update"]].iterrows():
-                row_id = row[columns["id"]]
-
-                try:
-                    supabase_client.table(table_name).update(
-                        {
-                            columns["latitude"]: row[columns["latitude"]],
-                            columns["longitude"]: row[columns["longitude"]],
-                            "error": row["error"],
-                        }
-                    ).eq(columns["id"], row_id).execute()
-
-                    rows_updated += 1
-                    logging.info(f"Updated row ID {row_id} in table: {table_name}")
-
-                except Exception as e:
-                    logging.error(f"Failed to update row ID {row_id}: {e}")
+            # Only the written columns of changed rows are copied; the flag
+            # column is removed in place
+            needs_update = processed_data.pop("_needs_update")
+            changed = processed_data.loc[
+                needs_update,
+                [columns["id"], columns["latitude"], columns["longitude"], "error"],
+            ]
+            # NaN becomes None and numpy scalars become Python types
+            changed = changed.astype(object).where(changed.notna(), None)
+
+            records = [
+                {"id": row_id, "latitude": lat, "longitude": lon, "error": error}
+                for row_id, lat, lon, error in changed.itertuples(
+                    index=False, name=None
+                )
+            ]
+
+            update_rpc = table_config.get("update_rpc")
+            for start in range(0, len(records), DB_UPDATE_BATCH_SIZE):
+                batch = records[start : start + DB_UPDATE_BATCH_SIZE]
+                if update_rpc:
+                    try:
+                        supabase_client.rpc(
+                            update_rpc,
+                            {
+                                "p_table": table_name,
+                                "p_rows": batch,
+                                "p_id_column": columns["id"],
+                                "p_latitude_column": columns["latitude"],
+                                "p_longitude_column": columns["longitude"],
+                            },
+                        ).execute()
+
+                        rows_updated += len(batch)
+                        logging.info(
+                            f"Updated {len(batch)} rows in table: {table_name}"
+                        )
+                        continue
+
+                    except Exception as e:
+                        logging.warning(
+                            f"RPC {update_rpc} failed, "
+                            f"updating rows by payload instead: {e}"
+                        )
+                        update_rpc = None
+
+                rows_updated += _update_rows_by_payload(
+                    supabase_client, table_name, columns, batch
+                )
 
             logging.info(f"Updated {rows_updated} rows in database table {table_name}")
         else:
             logging.info(f"No updates needed for table {table_name}")
 
 
+def _update_rows_by_payload(supabase_client, table_name, columns, records):
+    """Update rows one request per distinct (latitude, longitude, error) payload.
+
+    Used when no bulk update RPC is available; rows given the same result,
+    such as duplicate addresses or a shared failure, share one request.
+    """
+    ids_by_payload = {}
+    for record in records:
+        payload = (record["latitude"], record["longitude"], record["error"])
+        ids_by_payload.setdefault(payload, []).append(record["id"])
+
+    rows_updated = 0
+    for (lat, lon, error), row_ids in ids_by_payload.items():
+        try:
+            supabase_client.table(table_name).update(
+                {columns["latitude"]: lat, columns["longitude"]: lon, "error": error}
+            ).in_(columns["id"], row_ids).execute()
+
+            rows_updated += len(row_ids)
+            logging.info(f"Updated row IDs {row_ids} in table: {table_name}")
+
+        except Exception as e:
+            logging.error(f"Failed to update row IDs {row_ids}: {e}")
+    return rows_updated
+
+
 @handle_exception(
     custom_mapping={
         DataAccessError: DataAccessError,
@@ -531,7 +964,7 @@ def process_db_source(table_config, supabase_client):
     }
 )
 @with_log_context(module="geocode", operation="process_db_mode")
-def process_db_mode():
+def process_db_mode(cache_path=GEOCODE_CACHE):
     """Process geocoding in DB mode with structured error handling."""
     logging.info("Starting database-based geocoding process...")
 
@@ -548,7 +981,9 @@ def process_db_mode():
             with ExceptionContext(
                 f"Processing {table_name} table", DataProcessingError
             ):
-                process_db_source(table_config, supabase_client)
+                process_db_source(
+                    table_config, supabase_client, cache_path=cache_path
+                )
         else:
             logging.debug(f"Skipping table {table_name} (does not need geocoding)")
 
@@ -587,14 +1022,28 @@ For more information, see the module documentation.
         help="Processing mode: 'use-db' to fetch and update records in the database, 'use-local' to process CSV files in the locations directory (default: use-db)",
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Query the geocoding service for every record instead of reusing cached results",
+    )
+
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="In use-local mode, geocode CSV files this many rows at a time to bound memory use",
+    )
+
     args = parser.parse_args()
+    cache_path = None if args.no_cache else GEOCODE_CACHE
 
     logging.info(f"Starting geocoding process in {args.mode} mode...")
 
     if args.mode == "use-local":
-        process_csv_mode()
+        process_csv_mode(cache_path=cache_path, chunksize=args.chunksize)
     else:
-        process_db_mode()
+        process_db_mode(cache_path=cache_path)
 
     logging.info(f"Geocoding process in {args.mode} mode completed successfully")
 
@@ -21,6 +21,7 @@ Main Functions:
 * load_center_data: Load center coordinates from Supabase or local CSV files
 * generate_isochrone: Generate isochrones for a single center using OpenRouteService
 * upsert_isochrones: Save isochrone data to the Supabase database
+* upsert_isochrones_bulk: Save isochrones for many centers with one existence lookup
 * save_geojson_file: Save GeoJSON isochrone data to local files
 * check_existing_isochrones: Check for existing isochrones in the database
 * main: Command-line entry point with argument parsing
@@ -40,7 +41,8 @@ Dependencies:
 ------------
 * OpenRouteService API client (requires API key)
 * Supabase client for database operations (in 'use-db' mode)
-* pandas for data processing
+* pandas and numpy for data processing
+* orjson for writing GeoJSON files
 * Local files: centers CSV file in the LOCATIONS directory (for 'use-local' mode)
 
 Example:
@@ -56,7 +58,6 @@ Example:
 # Standard Library Imports
 import os
 import sys
-import json
 import logging
 import re
 import argparse
@@ -68,7 +69,10 @@ from time import sleep
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Third-party Imports
+from openrouteservice.exceptions import ApiError, HTTPError, Timeout
 from openrouteservice.isochrones import isochrones
+import numpy as np
+import orjson
 import pandas as pd
 
 # Local Imports
@@ -86,13 +90,21 @@ from src.utils.error_utils import (
     DataValidationError,
     GeoJSONError,
 )
-from src.utils.data_utils import load_data
+from src.utils.data_utils import ISOCHRONE_PAGE_SIZE, load_data
 from src.utils.client_utils import get_supabase_client, get_ors_client
+from src.utils.retry_util import retry
 from src.config import ISOCHRONES, TABLES, LOCATIONS
 
 # Configure structured logging
 setup_structured_logging(log_file="isochrone.log")
 
+# Transient OpenRouteService failures are retried with jittered exponential
+# backoff. The client already retries 429 and 503 responses for up to a minute
+# before raising Timeout, so the budget caps the total time spent per center.
+ORS_MAX_ATTEMPTS = 3
+ORS_RETRY_DELAY = 2.0
+ORS_RETRY_BUDGET = 90.0
+
 
 @handle_exception(
     custom_mapping={ValueError: DataValidationError, Exception: DataProcessingError}
@@ -149,25 +161,24 @@ def load_center_data(supabase=None, mode="use-db"):
         logging.error("Center data is empty")
         raise DataValidationError("Center data is empty")
 
-    # Extract coordinates for each center
-    coords_list = []
-    for i, center in centers_df.iterrows():
-        center_name = center[columns["city"]]
-
-        with LogContext(center_name=center_name, center_id=i):
-            latitude = center[columns["latitude"]]
-            longitude = center[columns["longitude"]]
-
-            if pd.isna(latitude) or pd.isna(longitude):
-                logging.error(f"Center '{center_name}' has missing coordinates")
-                raise DataValidationError(
-                    f"Center '{center_name}' has missing coordinates"
-                )
+    # Gather all coordinates in one pass; OpenRouteService expects [longitude, latitude]
+    coords = centers_df[[columns["longitude"], columns["latitude"]]].to_numpy(
+        dtype=np.float64
+    )
 
-            coords_list.append(
-                [longitude, latitude]  # OpenRouteService expects [longitude, latitude]
+    # One mask over both columns; only a failing frame is inspected further
+    missing = np.isnan(coords).any(axis=1)
+    if missing.any():
+        first = int(missing.argmax())
+        center_name = centers_df[columns["city"]].iloc[first]
+        with LogContext(center_name=center_name, center_id=centers_df.index[first]):
+            logging.error(
+                f"Center '{center_name}' has missing coordinates "
+                f"({int(missing.sum())} centers affected)"
             )
-            logging.debug(f"Added center coordinates: [{longitude}, {latitude}]")
+        raise DataValidationError(f"Center '{center_name}' has missing coordinates")
+
+    coords_list = coords.tolist()
 
     logging.info(f"Successfully loaded {len(coords_list)} centers with coordinates")
     return centers_df, coords_list
@@ -194,15 +205,26 @@ def generate_isochrone(client, longitude, latitude, center_name):
     with LogContext(center=center_name, coords=[longitude, latitude]):
         logging.info(f"Generating isochrones for {center_name}")
 
+        def request_isochrones():
+            return isochrones(
+                client,
+                locations=[[longitude, latitude]],
+                profile="driving-car",
+                range=[3600, 1800],  # 60 and 30 minutes
+                range_type="time",
+                smoothing=25,
+            )
+
         try:
             with ExceptionContext("OpenRouteService API call", APIConnectionError):
-                isochrone_result = isochrones(
-                    client,
-                    locations=[[longitude, latitude]],
-                    profile="driving-car",
-                    range=[3600, 1800],  # 60 and 30 minutes
-                    range_type="time",
-                    smoothing=25,
+                isochrone_result = retry(
+                    request_isochrones,
+                    retries=ORS_MAX_ATTEMPTS,
+                    delay=ORS_RETRY_DELAY,
+                    error_type=APIConnectionError,
+                    jitter=True,
+                    max_elapsed=ORS_RETRY_BUDGET,
+                    retry_on=_is_transient_ors_error,
                 )
 
             logging.info(f"Generated isochrones for {center_name} successfully")
@@ -217,22 +239,38 @@ def generate_isochrone(client, longitude, latitude, center_name):
             sleep(1.5)
 
 
+def _is_transient_ors_error(error):
+    """Whether an OpenRouteService failure may succeed if the request is repeated."""
+    if isinstance(error, ApiError):
+        return isinstance(error.status, int) and error.status >= 500
+    return isinstance(error, (Timeout, HTTPError))
+
+
 @handle_exception(
     custom_mapping={ValueError: DataValidationError, Exception: DataProcessingError}
 )
 @with_log_context(module="isochrone", operation="upsert_isochrones")
 def upsert_isochrones(
-    supabase_client, center_name, isochrone_result, dry_run=False, centers_df=None
+    supabase_client,
+    center_name,
+    isochrone_result,
+    dry_run=False,
+    centers_df=None,
+    existing_ids=None,
 ):
     """
     Save isochrone data to the Supabase database using upsert operations.
 
+    Existing rows are updated by ID; new rows are sent in one batched insert.
+
     Args:
         supabase_client: The Supabase client instance
         center_name: The name of the center associated with the isochrones
         isochrone_result: GeoJSON result from OpenRouteService
         dry_run: Whether to simulate the operation without writing to the database
         centers_df: DataFrame containing center information
+        existing_ids: Optional {(name, group_index, value): id} map of stored
+            isochrones; looked up for this center in one query if None
 
     Raises:
         DataValidationError: If input data is invalid
@@ -310,114 +348,192 @@ def upsert_isochrones(
                 f"Zip code information missing for center '{center_name}'"
             )
 
-        for i, feature in enumerate(isochrone_result["features"]):
-            with LogContext(feature_idx=i):
-                group_index = feature["properties"]["group_index"]
-                value = feature["properties"]["value"]
-                center = feature["properties"]["center"]
-                geometry = feature["geometry"]
-
-                # Convert center and geometry to WKT format for PostGIS
-                center_wkt = f"POINT({center[0]} {center[1]})"
+        if existing_ids is None:
+            existing_ids = _existing_isochrone_ids(supabase_client, [center_name])
 
-                # Use GeoJSONError for geometry-specific validation errors
-                try:
-                    if geometry["type"] != "Polygon":
-                        logging.error(
-                            f"Expected Polygon geometry, got {geometry['type']}"
-                        )
-                        raise GeoJSONError(
-                            f"Expected Polygon geometry, got {geometry['type']}"
-                        )
+        new_rows = []
+        for i, feature in enumerate(isochrone_result["features"]):
+            group_index = feature["properties"]["group_index"]
+            value = feature["properties"]["value"]
+            center = feature["properties"]["center"]
+            geometry = feature["geometry"]
+
+            # Convert center and geometry to WKT format for PostGIS
+            center_wkt = f"POINT({center[0]} {center[1]})"
+
+            # Use GeoJSONError for geometry-specific validation errors; the
+            # per-feature log context is only built on these failure paths
+            try:
+                if geometry["type"] != "Polygon":
+                    raise GeoJSONError(
+                        f"Expected Polygon geometry, got {geometry['type']}"
+                    )
 
-                    coordinates = geometry["coordinates"][0]
-                    if not coordinates or len(coordinates) < 4:
-                        logging.error("Invalid polygon: insufficient coordinates")
-                        raise GeoJSONError("Invalid polygon: insufficient coordinates")
+                coordinates = geometry["coordinates"][0]
+                if not coordinates or len(coordinates) < 4:
+                    raise GeoJSONError("Invalid polygon: insufficient coordinates")
 
-                    polygon_wkt = (
-                        "POLYGON(("
-                        + ", ".join(f"{x[0]} {x[1]}" for x in coordinates)
-                        + "))"
-                    )
-                except (KeyError, IndexError) as e:
+                polygon_wkt = (
+                    "POLYGON(("
+                    + ", ".join(f"{x[0]} {x[1]}" for x in coordinates)
+                    + "))"
+                )
+            except GeoJSONError as e:
+                with LogContext(feature_idx=i):
+                    logging.error(str(e))
+                raise
+            except (KeyError, IndexError) as e:
+                with LogContext(feature_idx=i):
                     logging.error(f"Invalid GeoJSON geometry structure: {e}")
-                    raise GeoJSONError(f"Invalid GeoJSON geometry structure: {e}")
-                except Exception as e:
+                raise GeoJSONError(f"Invalid GeoJSON geometry structure: {e}")
+            except Exception as e:
+                with LogContext(feature_idx=i):
                     logging.error(f"Unexpected geometry error: {e}")
-                    raise GeoJSONError(f"Unexpected geometry error: {e}")
+                raise GeoJSONError(f"Unexpected geometry error: {e}")
+
+            # Combine feature properties with the full metadata
+            metadata = {**full_metadata}
+
+            # ID of the stored row for this feature, if any
+            row_id = existing_ids.get((center_name, group_index, value))
+
+            # Prepare upsert data
+            upsert_data = {
+                isochrones_columns["name"]: center_name,
+                isochrones_columns["state"]: state,
+                isochrones_columns["zip_code"]: zip_code,
+                isochrones_columns["group_index"]: group_index,
+                isochrones_columns["value"]: value,
+                isochrones_columns["center"]: center_wkt,
+                isochrones_columns["geometry"]: polygon_wkt,
+                isochrones_columns["metadata"]: metadata,
+            }
 
-                # Combine feature properties with the full metadata
-                metadata = {**full_metadata}
+            if dry_run:
+                # Log the data instead of upserting
+                logging.info(
+                    f"Dry run: would upsert isochrone for {center_name}, state={state}, zip_code={zip_code}, value={value}"
+                )
+            elif row_id is not None:
+                logging.debug(f"Found existing isochrone with ID: {row_id}")
 
-                # Check if the row already exists and retrieve its ID
-                with ExceptionContext("Querying existing isochrones", DataAccessError):
-                    existing_row = (
+                # Update existing record by ID
+                with ExceptionContext("Updating isochrone data", DataProcessingError):
+                    response = (
                         supabase_client.table(isochrones_table["table_name"])
-                        .select(isochrones_columns["id"])
-                        .eq(isochrones_columns["name"], center_name)
-                        .eq(isochrones_columns["group_index"], group_index)
-                        .eq(isochrones_columns["value"], value)
+                        .update(upsert_data)
+                        .eq(isochrones_columns["id"], row_id)
                         .execute()
                     )
+                _check_upsert_response(response, f"{center_name}, value={value}")
+            else:
+                # New records are inserted together after the loop
+                logging.debug("No existing isochrone found, will insert new record")
+                new_rows.append(upsert_data)
+
+        if new_rows:
+            with ExceptionContext("Inserting isochrone data", DataProcessingError):
+                response = (
+                    supabase_client.table(isochrones_table["table_name"])
+                    .insert(new_rows)
+                    .execute()
+                )
+            _check_upsert_response(
+                response, f"{center_name} ({len(new_rows)} new isochrones)"
+            )
 
-                # Prepare upsert data
-                upsert_data = {
-                    isochrones_columns["name"]: center_name,
-                    isochrones_columns["state"]: state,
-                    isochrones_columns["zip_code"]: zip_code,
-                    isochrones_columns["group_index"]: group_index,
-                    isochrones_columns["value"]: value,
-                    isochrones_columns["center"]: center_wkt,
-                    isochrones_columns["geometry"]: polygon_wkt,
-                    isochrones_columns["metadata"]: metadata,
-                }
-
-                if dry_run:
-                    # Log the data instead of upserting
-                    logging.info(
-                        f"Dry run: would upsert isochrone for {center_name}, state={state}, zip_code={zip_code}, value={value}"
-                    )
-                else:
-                    # Determine if we should insert or update based on existing data
-                    if existing_row.data:
-                        row_id = existing_row.data[0][isochrones_columns["id"]]
-                        logging.debug(f"Found existing isochrone with ID: {row_id}")
-
-                        # Update existing record by ID
-                        with ExceptionContext(
-                            "Updating isochrone data", DataProcessingError
-                        ):
-                            response = (
-                                supabase_client.table(isochrones_table["table_name"])
-                                .update(upsert_data)
-                                .eq(isochrones_columns["id"], row_id)
-                                .execute()
-                            )
-                    else:
-                        # Insert new record
-                        logging.debug(
-                            "No existing isochrone found, will insert new record"
-                        )
-                        with ExceptionContext(
-                            "Inserting isochrone data", DataProcessingError
-                        ):
-                            response = (
-                                supabase_client.table(isochrones_table["table_name"])
-                                .insert(upsert_data)
-                                .execute()
-                            )
-
-                    # Check if the response contains an error
-                    if hasattr(response, "error") and response.error:
-                        logging.error(f"Failed to upsert isochrone: {response.error}")
-                        raise DataProcessingError(
-                            f"Failed to upsert isochrone: {response.error}"
-                        )
-                    elif hasattr(response, "data") and response.data:
-                        logging.info("Upserted isochrone successfully")
-                    else:
-                        logging.warning(f"Unexpected response format: {response}")
+
+@handle_exception(
+    custom_mapping={ValueError: DataValidationError, Exception: DataProcessingError}
+)
+@with_log_context(module="isochrone", operation="upsert_isochrones_bulk")
+def upsert_isochrones_bulk(
+    supabase_client, isochrones_data, dry_run=False, centers_df=None
+):
+    """
+    Save isochrones for many centers, looking up existing rows in one query.
+
+    Args:
+        supabase_client: The Supabase client instance
+        isochrones_data: Dictionary mapping center names to ORS GeoJSON results
+        dry_run: Whether to simulate the operation without writing to the database
+        centers_df: DataFrame containing center information
+
+    Raises:
+        DataValidationError: If input data is invalid
+        DataProcessingError: If the upsert operation fails
+        GeoJSONError: If there are issues with GeoJSON geometry
+    """
+    if not isochrones_data:
+        return
+
+    existing_ids = _existing_isochrone_ids(supabase_client, list(isochrones_data))
+    logging.info(
+        f"Found {len(existing_ids)} stored isochrones for "
+        f"{len(isochrones_data)} centers"
+    )
+
+    for center_name, isochrone_result in isochrones_data.items():
+        upsert_isochrones(
+            supabase_client,
+            center_name,
+            isochrone_result,
+            dry_run,
+            centers_df,
+            existing_ids=existing_ids,
+        )
+
+
+def _existing_isochrone_ids(
+    supabase_client, center_names, page_size=ISOCHRONE_PAGE_SIZE
+):
+    """
+    Map (name, group_index, value) to row ID for the given centers' isochrones.
+
+    Rows are read in id-ordered pages, since PostgREST caps how many rows a
+    single response returns and a truncated map would turn updates into
+    duplicate inserts.
+    """
+    isochrones_table = TABLES["isochrones"]
+    columns = isochrones_table["columns"]
+    id_col, name_col, group_col, value_col = (
+        columns[key] for key in ("id", "name", "group_index", "value")
+    )
+
+    existing_ids = {}
+    start = 0
+    with ExceptionContext("Querying existing isochrones", DataAccessError):
+        while True:
+            rows = (
+                supabase_client.table(isochrones_table["table_name"])
+                .select(f"{id_col}, {name_col}, {group_col}, {value_col}")
+                .in_(name_col, center_names)
+                .order(id_col)
+                .range(start, start + page_size - 1)
+                .execute()
+                .data
+                or []
+            )
+            existing_ids.update(
+                ((row[name_col], row[group_col], row[value_col]), row[id_col])
+                for row in rows
+            )
+            if len(rows) < page_size:
+                break
+            start += page_size
+
+    return existing_ids
+
+
+def _check_upsert_response(response, description):
+    """Raise if a Supabase write reported an error; log its outcome otherwise."""
+    if hasattr(response, "error") and response.error:
+        logging.error(f"Failed to upsert isochrone: {response.error}")
+        raise DataProcessingError(f"Failed to upsert isochrone: {response.error}")
+    elif hasattr(response, "data") and response.data:
+        logging.info(f"Upserted isochrone for {description}")
+    else:
+        logging.warning(f"Unexpected response format: {response}")
 
 
 @handle_exception(custom_mapping={Exception: DataAccessError})
@@ -468,13 +584,16 @@ def check_existing_isochrones(supabase_client):
 
 
 @handle_exception(
-    custom_mapping={Exception: DataProcessingError, json.JSONDecodeError: GeoJSONError}
+    custom_mapping={Exception: DataProcessingError, orjson.JSONEncodeError: GeoJSONError}
 )
 @with_log_context(module="isochrone", operation="save_geojson")
 def save_geojson_file(file_path, data):
     """
     Save GeoJSON data to a file.
 
+    The document is serialized by orjson (numpy values included) and written
+    as bytes in a single call.
+
     Args:
         file_path: Path to save the file
         data: GeoJSON data to save
@@ -484,10 +603,11 @@ def save_geojson_file(file_path, data):
         GeoJSONError: If JSON serialization fails
     """
     try:
-        with file_path.open("w") as f:
-            json.dump(data, f)
+        payload = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+        with file_path.open("wb") as f:
+            f.write(payload)
         logging.info(f"Saved GeoJSON to {file_path}")
-    except json.JSONDecodeError as e:
+    except orjson.JSONEncodeError as e:
         logging.error(f"GeoJSON serialization error: {e}")
         raise GeoJSONError(f"GeoJSON serialization error: {e}")
     except Exception as e:
@@ -658,8 +778,9 @@ For more information, see the module documentation.
     else:  # use-db mode
         # Save individual isochrones to Supabase
         with LogContext(action="save_to_database", dry_run=args.dry_run):
-            for center_name, isochrone_result in isochrones_data.items():
-                upsert_isochrones(supabase, center_name, isochrone_result, args.dry_run)
+            upsert_isochrones_bulk(
+                supabase, isochrones_data, args.dry_run, centers_df=centers_df
+            )
 
         logging.info("Isochrones saved successfully to database")
 
@@ -31,6 +31,8 @@ Main Functions:
 * load_data_local: Load data from local files
 * load_isochrones_local: Load isochrone data from local GeoJSON files
 * minify_html: Optimize generated HTML files
+* save_minified_map: Save and minify a map, skipping unchanged output
+* write_isochrones_asset: Precompute the gzipped isochrone GeoJSON served by the API
 * validate_map_config: Ensure map configuration is valid
 
 Command-line Usage:
@@ -73,6 +75,7 @@ Dependencies:
 -----------
 * Folium for map generation
 * pandas for data processing
+* orjson for compact location marker payloads
 * Supabase client (in database mode)
 * htmlmin, csscompressor and jsmin for optimizing output
 """
@@ -80,9 +83,14 @@ Dependencies:
 # Standard Library Imports
 import os
 import sys
+import functools
+import gzip
+import hashlib
+import io
 import logging
+import mmap
 import re
-import json
+import shutil
 from pathlib import Path
 import argparse
 
@@ -93,6 +101,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Third-party Imports
 import folium
 import htmlmin
+import orjson
 import pandas as pd
 from csscompressor import compress
 from folium import MacroElement
@@ -106,7 +115,7 @@ from src.utils.logging_utils import (
     with_log_context,
     LogContext,
 )
-from src.utils.data_utils import load_data, load_isochrones
+from src.utils.data_utils import get_table_version, load_data, load_isochrones
 from src.utils.math_utils import calculate_geographic_midpoint
 from src.utils.client_utils import get_supabase_client
 from src.utils.error_utils import (
@@ -117,12 +126,69 @@ from src.utils.error_utils import (
 )
 
 
-from src.config import CSS, JS, MAPS, DATA, TABLES, MAP_SETTINGS
+from src.config import (
+    CSS,
+    JS,
+    MAPS,
+    DATA,
+    TABLES,
+    MAP_SETTINGS,
+    ISOCHRONES_ASSET,
+    ISOCHRONES_ASSET_VERSION,
+)
 
 
 # Configure logging with structured logging
 setup_structured_logging(log_file="maps.log")
 
+# Marker icon styles, shared by every marker of the same class
+CENTER_ICON = {"color": "red", "icon": "tower"}
+LOCATION_ICON = {"color": "blue", "icon": "camera"}
+
+
+class LocationMarkers(MacroElement):
+    """Render location markers from a single compact JS array.
+
+    Each row is ``[latitude, longitude, name, full_address, city]``. Emitting one
+    array and a small render loop avoids building a ``folium.Marker`` (plus its
+    Icon, Popup and Tooltip) per location, which dominates both Python runtime
+    and HTML size for large location sets.
+    """
+
+    _template = Template(
+        """
+        {% macro script(this, kwargs) %}
+            var {{ this.get_name() }}_icon = L.AwesomeMarkers.icon(
+                {{ this.icon_options|tojson }}
+            );
+            {{ this.payload }}.forEach(function (r) {
+                L.marker([r[0], r[1]], {icon: {{ this.get_name() }}_icon})
+                    .bindPopup("<b>" + r[2] + "</b><br>" + r[3], {maxWidth: 300})
+                    .bindTooltip("<b>" + r[2] + "</b><br>City:&nbsp;" + r[4], {
+                        sticky: true,
+                        direction: "top",
+                    })
+                    .addTo({{ this._parent.get_name() }});
+            });
+        {% endmacro %}
+        """
+    )
+
+    def __init__(self, rows, icon_options=None):
+        super().__init__()
+        self._name = "LocationMarkers"
+        self.rows = rows
+        icon_options = icon_options or LOCATION_ICON
+        self.icon_options = {
+            "markerColor": icon_options["color"],
+            "iconColor": "white",
+            "icon": icon_options["icon"],
+            "prefix": "glyphicon",
+            "extraClasses": "fa-rotate-0",
+        }
+        # Escape closing tags so the payload cannot terminate the <script> block
+        self.payload = orjson.dumps(rows).decode().replace("</", "<\\/")
+
 
 @handle_exception(custom_mapping={ValueError: DataAccessError, Exception: GeoJSONError})
 @with_log_context(module="maps", operation="generate")
@@ -153,6 +219,7 @@ def generate_maps(
             centers_df = load_data_local("centers")
             locations_df = load_data_local("locations")
             isochrones_df = load_isochrones_local()
+            isochrones_version = None
     else:
         # Initialize Supabase client and load from database
         with LogContext(action="initialize_client"):
@@ -166,6 +233,9 @@ def generate_maps(
             logging.info("Loading data from Supabase")
             centers_df = load_data(supabase, TABLES["centers"]["table_name"])
             locations_df = load_data(supabase, TABLES["locations"]["table_name"])
+            # Read the version before the rows, so a concurrent edit leaves
+            # the asset with an older token rather than a newer one
+            isochrones_version = get_table_version(supabase, TABLES, "isochrones")
             isochrones_df = load_isochrones(supabase, TABLES)
 
     # Ensure data is valid
@@ -184,19 +254,22 @@ def generate_maps(
             center_coords = centers_df.dropna(subset=["latitude", "longitude"])
             if center_coords.empty:
                 raise DataAccessError("No valid Center coordinates found.")
-            coords = list(zip(center_coords["latitude"], center_coords["longitude"]))
-            map_center = calculate_geographic_midpoint(coords)
+            coords = tuple(
+                zip(center_coords["latitude"], center_coords["longitude"])
+            )
+            map_center = list(_cached_midpoint(coords))
         else:
             raise DataAccessError(
                 "Centers data must contain 'latitude' and 'longitude' columns."
             )
 
     # Create a dictionary to map feature names to colors
+    # (first-seen order keeps colors stable across runs, unlike set iteration)
     feature_colors = {}
-    features = {
+    features = dict.fromkeys(
         feature["properties"].get("name", "Unknown")
         for feature in isochrones_df["features"]
-    }
+    )
     for idx, name in enumerate(features):
         feature_colors[name] = MAP_SETTINGS["colors"][idx % len(MAP_SETTINGS["colors"])]
 
@@ -240,8 +313,7 @@ def generate_maps(
             locations_df=None,
             tile_provider=tile_provider,
         )
-        without_locations.save(str(centers_map))
-        minify_html(centers_map)
+        save_minified_map(without_locations, centers_map)
         logging.info("Map without locations saved to: %s", centers_map)
 
         # Generate the map with locations
@@ -257,13 +329,27 @@ def generate_maps(
             tile_provider=tile_provider,
             include_all_tiles=True,  # Include all tile providers as additional layers
         )
-        with_locations.save(str(locations_map))
-        minify_html(locations_map)
+        save_minified_map(with_locations, locations_map)
         logging.info("Map with locations saved to: %s", locations_map)
 
+        # Precompute the isochrones payload so the API can serve it from disk;
+        # only database data has a version the API can check it against
+        if isochrones_version is not None:
+            write_isochrones_asset(isochrones_df, isochrones_version)
+
     return {"centers_map": str(centers_map), "locations_map": str(locations_map)}
 
 
+@functools.lru_cache(maxsize=16)
+def _cached_midpoint(coords):
+    """Return the geographic midpoint for a tuple of (lat, lon) pairs.
+
+    Centers rarely change between requests, so dynamic map serving reuses the
+    previous result instead of repeating the trigonometry on every call.
+    """
+    return tuple(calculate_geographic_midpoint(list(coords)))
+
+
 # Create a map with the specified layers and features
 # This function is used in both static and dynamic map generation
 def create_map(
@@ -339,57 +425,29 @@ def create_map(
 
     # Optionally add additional tile layers that users can switch between
     if include_all_tiles:
-        tiles_config = MAP_SETTINGS.get("tiles", {})
-        providers = tiles_config.get("providers", {})
+        all_providers = tiles_config.get("providers", {})
+        active_provider = tile_provider or tiles_config.get("default")
 
         # Use CartoDB as the preferred provider by default, or get from config
         preferred_provider = tiles_config.get("preferred", "CartoDB")
 
-        # First, process all non-preferred providers
-        for name, provider_config in providers.items():
-            # Skip both the already added provider and the preferred provider
-            if (
-                (tile_provider and name == tile_provider)
-                or (not tile_provider and name == tiles_config.get("default"))
-                or name == preferred_provider
-            ):
-                continue
-
-            # Process non-preferred providers as before
-            provider_name = provider_config.get("name", name)
-            try:
-                # Try adding the tile layer with minimal parameters
-                folium.TileLayer(
-                    tiles=provider_name,
-                    name=name,
-                ).add_to(m)
-            except ValueError:
-                # If that fails, provide attribution
-                folium.TileLayer(
-                    tiles=provider_config.get("tiles", provider_name),
-                    attr=provider_config.get("attr", "© Map contributors"),
-                    name=name,
-                ).add_to(m)
-
-        # Finally add the preferred provider last so it becomes active
-        if preferred_provider in providers and not (
-            (tile_provider and preferred_provider == tile_provider)
-            or (not tile_provider and preferred_provider == tiles_config.get("default"))
+        # Skip the already added provider; the preferred provider goes last so it becomes active
+        skip = {active_provider, preferred_provider}
+        extra_providers = [
+            (name, config)
+            for name, config in all_providers.items()
+            if name not in skip
+        ]
+        if (
+            preferred_provider in all_providers
+            and preferred_provider != active_provider
         ):
-            provider_config = providers.get(preferred_provider, {})
-            provider_name = provider_config.get("name", preferred_provider)
-
-            try:
-                folium.TileLayer(
-                    tiles=provider_name,
-                    name=preferred_provider,
-                ).add_to(m)
-            except ValueError:
-                folium.TileLayer(
-                    tiles=provider_config.get("tiles", provider_name),
-                    attr=provider_config.get("attr", "© Map contributors"),
-                    name=preferred_provider,
-                ).add_to(m)
+            extra_providers.append(
+                (preferred_provider, all_providers[preferred_provider])
+            )
+
+        for name, provider_config in extra_providers:
+            _add_tile_layer(m, name, provider_config)
 
     # Define layers using the configuration
     layers_config = MAP_SETTINGS.get("layers", {})
@@ -456,6 +514,9 @@ def create_map(
 
     # Add Center markers and labels to the Centers layer
     with LogContext(layer="centers"):
+        # One Icon is rendered once and reused by every center marker
+        center_icon = folium.Icon(**CENTER_ICON)
+
         for _, row in center_coords.iterrows():
             center_name = row.get(TABLES["centers"]["columns"]["city"], "Unknown")
             center_city = row.get("city", "Unknown")
@@ -463,7 +524,6 @@ def create_map(
             latitude = row["latitude"]
             longitude = row["longitude"]
 
-            center_icon = folium.Icon(color="red", icon="tower")
             center_popup = folium.Popup(
                 f"<b>{center_name}</b> <br>{center_city}", max_width=300
             )
@@ -487,41 +547,36 @@ def create_map(
     # Add Location markers to the Locations layer (if enabled)
     if include_locations and locations_df is not None:
         with LogContext(layer="locations"):
-            for _, row in locations_df.iterrows():
-                location_id = row.get(TABLES["locations"]["columns"]["name"], "Unknown")
-                location_address = row.get("address", "Unknown")
-                location_city = row.get("city", "Unknown")
-                location_state = row.get("state", "Unknown")
-                location_zip = row.get("zip_code", "Unknown")
-                location_full_address = f"{location_address}, {location_city}, {location_state} {location_zip}"
-                latitude = row.get("latitude")
-                longitude = row.get("longitude")
-
-                # Validate coordinates
-                if pd.isna(latitude) or pd.isna(longitude):
-                    logging.warning(
-                        f"Error: Invalid coordinates for location '{location_id}' (latitude: {latitude}, longitude: {longitude}). Skipping..."
-                    )
-                    continue
-
-                location_icon = folium.Icon(color="blue", icon="camera")
-                location_popup = folium.Popup(
-                    f"<b>{location_id}</b><br>{location_full_address}",
-                    max_width=300,
+            # Project to the columns used by the markers and drop rows without coordinates
+            name_column = TABLES["locations"]["columns"]["name"]
+            text_columns = [name_column, "address", "city", "state", "zip_code"]
+            markers_df = locations_df.reindex(
+                columns=text_columns + ["latitude", "longitude"]
+            ).dropna(subset=["latitude", "longitude"])
+
+            skipped = len(locations_df) - len(markers_df)
+            if skipped:
+                logging.warning(
+                    f"Skipping {skipped} locations with invalid coordinates"
                 )
-                location_tooltip = folium.Tooltip(
-                    f"<b>{location_id}</b><br>City:&nbsp;{location_city}",
-                    sticky=True,
-                    direction="top",
-                    show=True,
+
+            markers_df[text_columns] = markers_df[text_columns].fillna("Unknown")
+
+            rows = [
+                [
+                    float(latitude),
+                    float(longitude),
+                    str(location_id),
+                    f"{address}, {city}, {state} {zip_code}",
+                    str(city),
+                ]
+                for location_id, address, city, state, zip_code, latitude, longitude in markers_df.itertuples(
+                    index=False, name=None
                 )
+            ]
 
-                folium.Marker(
-                    location=[latitude, longitude],
-                    popup=location_popup,
-                    icon=location_icon,
-                    tooltip=location_tooltip,
-                ).add_to(locations_layer)
+            LocationMarkers(rows, icon_options=LOCATION_ICON).add_to(locations_layer)
+            logging.info(f"Added {len(rows)} location markers")
 
     # Add layers to the map
     draw_layer.add_to(m)
@@ -592,45 +647,152 @@ def create_map(
     return m
 
 
-@with_log_context(module="maps", operation="minify_html")
-def minify_html(file_path):
-    """Minify HTML file with structured logging."""
-    logging.info(f"Minifying HTML file: {file_path}")
+def _add_tile_layer(m, name, provider_config):
+    """Add a switchable tile layer, supplying attribution for custom tile URLs."""
+    provider_name = provider_config.get("name", name)
+    try:
+        # Try adding the tile layer with minimal parameters
+        folium.TileLayer(tiles=provider_name, name=name).add_to(m)
+    except ValueError:
+        # If that fails, provide attribution
+        folium.TileLayer(
+            tiles=provider_config.get("tiles", provider_name),
+            attr=provider_config.get("attr", "© Map contributors"),
+            name=name,
+        ).add_to(m)
 
-    with Path(file_path).open("r") as file:
-        html_content = file.read()
 
-    # Minify <script> tags
-    def minify_script(match):
-        script_content = match.group(1)
-        minified_script = jsmin(script_content, quote_chars="'\"")
-        return f"<script>{minified_script}</script>"
+# Folium element names carry a random 32-character hex suffix on every render
+ELEMENT_ID_PATTERN = re.compile(rb"_[0-9a-f]{32}")
 
-    html_content = re.sub(
-        r"<script>(.*?)</script>", minify_script, html_content, flags=re.DOTALL
-    )
 
-    # Minify <style> tags
-    def minify_style(match):
-        style_content = match.group(1)
-        minified_style = compress(style_content)
-        return f"<style>{minified_style}</style>"
+def save_minified_map(map_object, map_path):
+    """Save a map and minify it, reusing the previous output when nothing changed.
 
-    html_content = re.sub(
-        r"<style>(.*?)</style>", minify_style, html_content, flags=re.DOTALL
-    )
+    The saved HTML is hashed with Folium's random element IDs stripped. When the
+    digest matches the ``.sha1`` sidecar from the previous run, the cached
+    ``.min.html`` snapshot is copied over instead of minifying again.
+    """
+    map_path = Path(map_path)
+    map_object.save(str(map_path))
+
+    digest = hashlib.sha1(
+        ELEMENT_ID_PATTERN.sub(b"", map_path.read_bytes())
+    ).hexdigest()
+    digest_path = map_path.with_suffix(".sha1")
+    minified_path = map_path.with_suffix(".min.html")
+
+    if (
+        digest_path.exists()
+        and minified_path.exists()
+        and digest_path.read_text() == digest
+    ):
+        logging.info(f"Map unchanged, reusing minified output for {map_path}")
+        shutil.copyfile(minified_path, map_path)
+        return
+
+    minify_html(map_path)
+    shutil.copyfile(map_path, minified_path)
+    digest_path.write_text(digest)
+
+
+def write_isochrones_asset(
+    isochrones,
+    version,
+    asset_path=ISOCHRONES_ASSET,
+    version_path=ISOCHRONES_ASSET_VERSION,
+):
+    """Write the isochrone FeatureCollection as a gzipped static asset.
 
-    # Minify the entire HTML, but avoid removing spaces in strings
-    minified_html = htmlmin.minify(
-        html_content,
-        remove_comments=True,
-        remove_empty_space=True,
-        reduce_boolean_attributes=True,
-        remove_optional_attribute_quotes=False,
-    )
+    The file is written to a temporary sibling and swapped into place, so the
+    API never serves a partially written asset. The table version token it was
+    built from goes in a sidecar file; the old token is removed first, so the
+    API never pairs it with the new file.
+    """
+    asset_path = Path(asset_path)
+    version_path = Path(version_path)
+    asset_path.parent.mkdir(parents=True, exist_ok=True)
+    version_path.unlink(missing_ok=True)
+
+    tmp_path = asset_path.with_name(f"{asset_path.name}.tmp")
+    tmp_path.write_bytes(gzip.compress(orjson.dumps(isochrones), compresslevel=6))
+    os.replace(tmp_path, asset_path)
+    version_path.write_text(version)
+    logging.info(f"Isochrones asset written to: {asset_path} (version {version})")
+
+
+# Inline blocks minified by minify_html: (opening tag, closing tag, minifier)
+MINIFY_BLOCKS = (
+    (b"<script>", b"</script>", lambda body: jsmin(body, quote_chars="'\"")),
+    (b"<style>", b"</style>", compress),
+)
+
+# Folium output below this size gains little from htmlmin's whitespace pass
+HTMLMIN_THRESHOLD = 256 * 1024
 
-    with Path(file_path).open("w") as file:
-        file.write(minified_html)
+
+def _minify_inline_blocks(html):
+    """Minify every inline <script>/<style> body in a single scan over the bytes.
+
+    Text outside the blocks is copied verbatim; only the current block body is
+    decoded and handed to its minifier.
+    """
+    output = io.BytesIO()
+    position = 0
+
+    while True:
+        # Find the nearest opening tag of any block type
+        matches = [
+            (html.find(open_tag, position), open_tag, close_tag, minifier)
+            for open_tag, close_tag, minifier in MINIFY_BLOCKS
+        ]
+        matches = [match for match in matches if match[0] != -1]
+        if not matches:
+            break
+
+        start, open_tag, close_tag, minifier = min(matches, key=lambda m: m[0])
+        body_start = start + len(open_tag)
+        body_end = html.find(close_tag, body_start)
+        if body_end == -1:
+            break
+
+        output.write(html[position:body_start])
+        output.write(minifier(html[body_start:body_end].decode()).encode())
+        position = body_end
+
+    output.write(html[position:])
+    return output.getvalue()
+
+
+@with_log_context(module="maps", operation="minify_html")
+def minify_html(file_path):
+    """Minify HTML file with structured logging."""
+    logging.info(f"Minifying HTML file: {file_path}")
+
+    file_path = Path(file_path)
+    if file_path.stat().st_size == 0:
+        logging.info(f"Nothing to minify in empty file {file_path}")
+        return
+
+    # Minify <script> and <style> bodies straight from the mapped file
+    with file_path.open("rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as html:
+        minified = _minify_inline_blocks(html)
+
+    # Minify the entire HTML only when it is large enough to be worth the pass,
+    # avoiding removal of spaces in strings
+    if len(minified) >= HTMLMIN_THRESHOLD:
+        minified = htmlmin.minify(
+            minified.decode(),
+            remove_comments=True,
+            remove_empty_space=True,
+            reduce_boolean_attributes=True,
+            remove_optional_attribute_quotes=False,
+        ).encode()
+
+    with file_path.open("wb") as file:
+        file.write(minified)
 
     logging.info(f"HTML minification complete for {file_path}")
 
@@ -712,8 +874,7 @@ def load_isochrones_local():
     if combined_path.exists():
         logging.info(f"Loading combined isochrones from {combined_path}")
         try:
-            with open(combined_path, "r") as f:
-                return json.load(f)
+            return orjson.loads(combined_path.read_bytes())
         except Exception as e:
             raise DataAccessError(f"Failed to load combined isochrones file: {str(e)}")
 
@@ -733,27 +894,22 @@ def load_isochrones_local():
             f"No isochrone files matching '{file_pattern}' found in {isochrones_dir}"
         )
 
-    # Start with an empty feature collection
-    combined_isochrones = {"type": "FeatureCollection", "features": []}
-
     # Use the name field from TABLES if available
     name_field = isochrones_config.get("columns", {}).get("name", "name")
 
     # Load and combine each file
+    all_features = []
     for file_path in individual_files:
         # Extract isochrone name from filename using configured pattern
-        isochrone_name = file_path.stem
-        if "_isochrones" in isochrone_name:
-            isochrone_name = isochrone_name.replace("_isochrones", "")
+        isochrone_name = file_path.stem.replace("_isochrones", "")
 
         logging.info(f"Loading isochrones for {isochrone_name} from {file_path}")
 
         try:
-            with open(file_path, "r") as f:
-                isochrone_data = json.load(f)
+            isochrone_data = orjson.loads(file_path.read_bytes())
         except FileNotFoundError:
             raise DataAccessError(f"Isochrone file not found: {file_path}")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise GeoJSONError(f"Invalid GeoJSON in {file_path}: {str(e)}")
         except Exception as e:
             raise DataAccessError(
@@ -761,12 +917,13 @@ def load_isochrones_local():
             )
 
         # Add city name to properties if not already present
-        for feature in isochrone_data.get("features", []):
-            if "properties" in feature and name_field not in feature["properties"]:
-                feature["properties"][name_field] = isochrone_name
+        features = isochrone_data.get("features", ())
+        for feature in features:
+            feature.setdefault("properties", {}).setdefault(name_field, isochrone_name)
+
+        all_features.extend(features)
 
-        # Add features to combined collection
-        combined_isochrones["features"].extend(isochrone_data.get("features", []))
+    combined_isochrones = {"type": "FeatureCollection", "features": all_features}
 
     if not combined_isochrones["features"]:
         raise DataAccessError("No valid isochrone features found in any file")
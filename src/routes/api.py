@@ -10,15 +10,21 @@ Key Components:
 -------------
 1. Generic Data Access:
    - /data/<table_name>: Paginated access to database tables
+   - Optional ?fields= column projection pushed down to Supabase
+   - /data/<table_name>/stream: Whole-table export as newline-delimited JSON
    - Security validation against allowed public tables
    - Consistent error handling and response formatting
+   - Gzip compression of JSON and HTML responses
 
 2. Specialized Data Endpoints:
    - /isochrones: Access to isochrone GeoJSON data
    - Optimized for map visualization
+   - Serialized and gzipped output cached per data version, served with an ETag
+   - Precomputed gzipped asset served from disk while it matches the table version
 
 3. Visualization Endpoints:
    - /maps/<table_key>: Dynamic Folium map generation
+   - Rendered and gzipped HTML cached per data version, served with an ETag
    - Supports different map types based on table configuration
 
 4. Security & Error Handling:
@@ -31,6 +37,12 @@ Usage:
 # Accessing data with pagination
 GET /api/data/centers?page=1&page_size=20
 
+# Fetching only selected columns
+GET /api/data/locations?fields=name,latitude,longitude
+
+# Streaming every row as NDJSON
+GET /api/data/locations/stream
+
 # Retrieving GeoJSON isochrones for all centers
 GET /api/isochrones
 
@@ -50,10 +62,24 @@ All API responses include appropriate status codes and JSON error messages.
 """
 
 # Standard Library Imports
+import functools
+import gzip
+import hashlib
 import logging
+import threading
+import time
 
 # Third-party Imports
-from flask import Blueprint, jsonify, request, current_app, g
+import orjson
+from flask import (
+    Blueprint,
+    Response,
+    request,
+    current_app,
+    g,
+    send_file,
+    stream_with_context,
+)
 
 # Local Imports
 from src.utils.logging_utils import LogContext, with_log_context
@@ -66,12 +92,99 @@ from src.utils.error_utils import (
     DataValidationError,
     ConfigError,
 )
-from src.utils.data_utils import load_isochrones
+from src.utils.client_utils import get_supabase_client
+from src.utils.data_utils import (
+    get_table_version,
+    iter_isochrone_features,
+    iter_table_pages,
+)
 from src.maps import generate_maps
-from src.config import TABLES
+from src.config import (
+    TABLES,
+    ISOCHRONES_ASSET,
+    ISOCHRONES_ASSET_TTL,
+    ISOCHRONES_ASSET_VERSION,
+)
 
 api_bp = Blueprint("api", __name__)
 
+# How long clients may reuse isochrones before revalidating with If-None-Match
+ISOCHRONES_MAX_AGE = 60
+
+# Rendered map HTML is cached per data version of these tables
+MAP_SOURCE_TABLES = ("centers", "locations", "isochrones")
+MAP_MAX_AGE = 300
+_map_html_lock = threading.Lock()
+
+# Gzip settings for JSON and HTML responses (see compress_response)
+COMPRESS_MIMETYPES = {"application/json", "text/html"}
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_LEVEL = 5
+
+# Rows per Supabase request when streaming whole tables (PostgREST's default cap)
+STREAM_PAGE_SIZE = 1000
+
+# Concurrent cache misses wait for one database load instead of each issuing their own
+_isochrones_payload_lock = threading.Lock()
+
+
+@api_bp.after_request
+def compress_response(response):
+    """Gzip compressible API responses for clients that accept it."""
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESS_MIMETYPES
+        or "gzip" not in request.accept_encodings
+    ):
+        return response
+
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+
+    response.set_data(gzip.compress(body, compresslevel=COMPRESS_LEVEL))
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+
+    # The encoded body differs byte-wise, so only a weak validator still holds
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def _precompress(body):
+    """Gzip a cached body once, or return None if it is too small to bother."""
+    if len(body) < COMPRESS_MIN_SIZE:
+        return None
+    return gzip.compress(body, compresslevel=COMPRESS_LEVEL)
+
+
+def _cached_body_response(body, gzipped, mimetype):
+    """Serve a cached body, reusing its precomputed gzip for clients that accept it.
+
+    compress_response skips the result because Content-Encoding is already set.
+    """
+    response = Response(body, mimetype=mimetype)
+    if gzipped is not None:
+        if "gzip" in request.accept_encodings:
+            response.set_data(gzipped)
+            response.headers["Content-Encoding"] = "gzip"
+        response.vary.add("Accept-Encoding")
+    return response
+
+
+def _json_response(payload):
+    """Build a JSON response using orjson, which encodes large GeoJSON far faster."""
+    return Response(
+        orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+        mimetype="application/json",
+    )
+
+
 # --------------------------------------
 # GENERIC DATA ACCESS ENDPOINTS
 # --------------------------------------
@@ -87,17 +200,7 @@ def get_data(table_name):
     Generic endpoint to fetch data from a specified table.
     """
     logging.info(f"Fetching data from table: {table_name}")
-
-    # Get the Supabase client from app config
-    supabase = current_app.config.get("SUPABASE_CLIENT")
-    if not supabase:
-        raise ConfigError("Supabase client not configured")
-
-    # Validate table name for security - using the ALLOWED_PUBLIC_TABLES from config
-    allowed_tables = current_app.config.get("ALLOWED_PUBLIC_TABLES", [])
-    if table_name not in allowed_tables:
-        logging.warning(f"Attempted access to unauthorized table: {table_name}")
-        raise ResourceNotFoundError(f"Table '{table_name}' not found or not accessible")
+    supabase, select_clause = _resolve_table_request(table_name)
 
     # Execute query with pagination
     page = request.args.get("page", default=1, type=int)
@@ -110,7 +213,7 @@ def get_data(table_name):
         with ExceptionContext(f"Querying data from {table_name}", APIError):
             response = (
                 supabase.table(table_name)
-                .select("*")
+                .select(select_clause)
                 .range((page - 1) * page_size, page * page_size - 1)
                 .execute()
             )
@@ -120,10 +223,67 @@ def get_data(table_name):
 
         if not response_data:
             logging.info(f"No data found in table: {table_name}")
-            return jsonify({"data": [], "count": 0})
+            return _json_response({"data": [], "count": 0})
 
         logging.info(f"Successfully retrieved {data_count} rows from {table_name}")
-        return jsonify({"data": response_data, "count": data_count})
+        return _json_response({"data": response_data, "count": data_count})
+
+
+@api_bp.route("/data/<string:table_name>/stream", methods=["GET"])
+@with_log_context(module="api", endpoint="stream_data")
+@handle_exception(
+    custom_mapping={ValueError: DataValidationError, Exception: DataAccessError}
+)
+def stream_data(table_name):
+    """
+    Stream every row of a table as newline-delimited JSON.
+    """
+    logging.info(f"Streaming data from table: {table_name}")
+    supabase, select_clause = _resolve_table_request(table_name)
+    pages = iter_table_pages(
+        supabase, table_name, select_clause, page_size=STREAM_PAGE_SIZE
+    )
+
+    def generate():
+        row_count = 0
+        for rows in pages:
+            row_count += len(rows)
+            yield b"".join(orjson.dumps(row) + b"\n" for row in rows)
+        logging.info(f"Streamed {row_count} rows from {table_name}")
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
+def _resolve_table_request(table_name):
+    """Validate access to a public table and build its select clause from ?fields=."""
+    # Get the Supabase client from app config
+    supabase = current_app.config.get("SUPABASE_CLIENT")
+    if not supabase:
+        raise ConfigError("Supabase client not configured")
+
+    # Validate table name for security - using the ALLOWED_PUBLIC_TABLES from config
+    allowed_tables = current_app.config.get("ALLOWED_PUBLIC_TABLES", [])
+    if table_name not in allowed_tables:
+        logging.warning(f"Attempted access to unauthorized table: {table_name}")
+        raise ResourceNotFoundError(f"Table '{table_name}' not found or not accessible")
+
+    # Project only the requested columns, validated against the table's allow-list
+    fields = request.args.get("fields")
+    if not fields:
+        return supabase, "*"
+
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    allowed_fields = current_app.config.get("PUBLIC_API_FIELDS", {}).get(
+        table_name, set()
+    )
+    invalid_fields = [field for field in requested if field not in allowed_fields]
+    if not requested or invalid_fields:
+        logging.warning(f"Invalid fields requested for {table_name}: {fields}")
+        raise DataValidationError(
+            f"Invalid fields for table '{table_name}': "
+            f"{', '.join(invalid_fields) or fields}"
+        )
+    return supabase, ",".join(requested)
 
 
 # --------------------------------------
@@ -153,13 +313,77 @@ def get_isochrones():
             raise ConfigError("Tables configuration not found")
 
         # Use ExceptionContext for the database operation
-        with ExceptionContext("Loading isochrones from database", APIError):
-            # Load isochrone data using the enhanced load_isochrones function
-            isochrones = load_isochrones(supabase, tables_config)
-            feature_count = len(isochrones.get("features", []))
+        with ExceptionContext("Checking isochrones version", APIError):
+            version = get_table_version(supabase, tables_config, "isochrones")
+        etag = hashlib.blake2b(version.encode(), digest_size=8).hexdigest()
+
+        if request.if_none_match.contains_weak(etag):
+            logging.info("Isochrones unchanged since last request")
+            response = Response(status=304)
+        elif "gzip" in request.accept_encodings and _isochrones_asset_is_current(
+            version
+        ):
+            # The precomputed asset was built from this version; skip the rows
+            logging.info(f"Serving precomputed isochrones from {ISOCHRONES_ASSET}")
+            response = send_file(
+                ISOCHRONES_ASSET,
+                mimetype="application/json",
+                download_name="isochrones.geojson",
+                conditional=False,
+                etag=False,
+                max_age=ISOCHRONES_MAX_AGE,
+            )
+            response.headers["Content-Encoding"] = "gzip"
+            response.vary.add("Accept-Encoding")
+        else:
+            with ExceptionContext("Loading isochrones from database", APIError):
+                with _isochrones_payload_lock:
+                    body, gzipped, feature_count = _isochrones_payload(version)
+            logging.info(f"Returning {feature_count} isochrone features")
+            response = _cached_body_response(body, gzipped, "application/json")
+
+        # The gzipped body differs byte-wise, so only a weak validator holds
+        response.set_etag(etag, weak=response.content_encoding == "gzip")
+        response.cache_control.public = True
+        response.cache_control.max_age = ISOCHRONES_MAX_AGE
+        return response
+
+
+def _isochrones_asset_is_current(version):
+    """Check whether the precomputed isochrones asset is within its TTL and was
+    built from the given table version."""
+    try:
+        age = time.time() - ISOCHRONES_ASSET.stat().st_mtime
+        asset_version = ISOCHRONES_ASSET_VERSION.read_text()
+    except FileNotFoundError:
+        return False
+    return age < ISOCHRONES_ASSET_TTL and asset_version == version
+
+
+@functools.lru_cache(maxsize=4)
+def _isochrones_payload(version):
+    """Load, serialize and gzip isochrones once per table version token.
+
+    Features arrive already encoded page by page, so peak memory is the output
+    bytes plus one page of rows rather than the whole decoded collection.
+    """
+    features = iter_isochrone_features(
+        current_app.config["SUPABASE_CLIENT"],
+        current_app.config["TABLES"],
+        encoded=True,
+    )
+    chunks = list(_stream_feature_collection(features))
+    body = b"".join(chunks)
+    # Every chunk except the opening and closing brackets is one feature
+    return body, _precompress(body), len(chunks) - 2
+
 
-        logging.info(f"Successfully retrieved {feature_count} isochrone features")
-        return jsonify(isochrones)
+def _stream_feature_collection(encoded_features):
+    """Yield a GeoJSON FeatureCollection as JSON chunks from pre-encoded features."""
+    yield b'{"type":"FeatureCollection","features":['
+    for i, encoded in enumerate(encoded_features):
+        yield b"," + encoded if i else encoded
+    yield b"]}"
 
 
 # --------------------------------------
@@ -183,13 +407,42 @@ def get_map(table_key):
             )
             raise ResourceNotFoundError(f"Map for '{table_key}' not available")
 
-        logging.info(f"Generating map for: {table_key}")
-
         # Determine if this is a locations map
         include_locations = table_key == "locations"
 
-        map_object = generate_maps(
-            use_local=False, include_locations=include_locations, return_map_object=True
-        )
-
-        return map_object._repr_html_()
+        # Version the rendered HTML by every table that feeds the map
+        with ExceptionContext("Checking map data version", APIError):
+            supabase = get_supabase_client()
+            version = "|".join(
+                get_table_version(supabase, TABLES, key) for key in MAP_SOURCE_TABLES
+            )
+        etag = hashlib.blake2b(
+            f"{table_key}:{include_locations}:{version}".encode(), digest_size=8
+        ).hexdigest()
+
+        if request.if_none_match.contains_weak(etag):
+            logging.info(f"Map for {table_key} unchanged since last request")
+            response = Response(status=304)
+        else:
+            with _map_html_lock:
+                html, gzipped = _map_html(table_key, version)
+            response = _cached_body_response(html, gzipped, "text/html")
+
+        # The gzipped body differs byte-wise, so only a weak validator holds
+        response.set_etag(etag, weak=response.content_encoding == "gzip")
+        response.cache_control.public = True
+        response.cache_control.max_age = MAP_MAX_AGE
+        return response
+
+
+@functools.lru_cache(maxsize=8)
+def _map_html(table_key, version):
+    """Render and gzip a map's HTML once per table key and data version token."""
+    logging.info(f"Generating map for: {table_key}")
+    map_object = generate_maps(
+        use_local=False,
+        include_locations=table_key == "locations",
+        return_map_object=True,
+    )
+    html = map_object._repr_html_().encode()
+    return html, _precompress(html)
@@ -29,6 +29,7 @@ Key Components:
 
 6. Mathematical Utilities:
    - calculate_geographic_midpoint(): Calculates the midpoint of geographic coordinates
+   - calculate_geographic_midpoints(): Calculates midpoints for many coordinate groups
 
 Usage:
 -----
@@ -53,24 +54,37 @@ lat, lng = calculate_geographic_midpoint([(41.5, -88.0), (42.0, -89.0)])
 """
 
 # Standard library imports
+import functools
 import os
 import sys
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=1)
+def _project_root():
+    """Resolve the project root once; it cannot change while the process runs."""
+    return str(Path(__file__).resolve().parent.parent.parent)
+
+
 # Define a function to add project root to the path (but don't call it yet)
 def _setup_project_path():
     """Add project root to Python path."""
-    project_root = Path(__file__).resolve().parent.parent.parent
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
+    project_root = _project_root()
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
 
 
 # Simple utility functions that don't import other modules
 def ensure_dirs_exist(paths):
     """Ensure all directories in the list exist."""
-    for path in paths:
-        os.makedirs(path, exist_ok=True)
+    # Deduplicated and deepest-first; ancestors of a handled path are skipped
+    covered = None
+    for path in sorted(set(map(os.fspath, paths)), reverse=True):
+        if covered is not None and covered.startswith(path.rstrip(os.sep) + os.sep):
+            continue
+        if not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
+        covered = path
 
 
 # Now add project root to path before importing project modules
@@ -127,13 +141,20 @@ except ImportError:
 
 
 try:
-    from .math_utils import calculate_geographic_midpoint
+    from .math_utils import (
+        calculate_geographic_midpoint,
+        calculate_geographic_midpoints,
+    )
 except ImportError:
 
     def calculate_geographic_midpoint(coords):
         """Placeholder for math_utils.calculate_geographic_midpoint"""
         return (0, 0)
 
+    def calculate_geographic_midpoints(coords_flat, group_offsets):
+        """Placeholder for math_utils.calculate_geographic_midpoints"""
+        return []
+
 
 # Define __all__ to control what gets imported with 'from utils import *'
 __all__ = [
@@ -147,4 +168,5 @@ __all__ = [
     "add_project_root_to_path",
     "find_project_root",
     "calculate_geographic_midpoint",
+    "calculate_geographic_midpoints",
 ]
@@ -15,6 +15,7 @@ Example:
 """
 
 # Standard library imports
+import functools
 import logging
 import os
 
@@ -54,6 +55,8 @@ def get_ors_client() -> openrouteservice.Client:
     """
     Get OpenRouteService client with API key from environment variable.
 
+    The client is cached per API key, so repeated calls reuse its HTTP session.
+
     Returns:
         openrouteservice.Client: Initialized ORS client
 
@@ -69,11 +72,17 @@ def get_ors_client() -> openrouteservice.Client:
             "ORS API key not found. Please set the ORS_API_KEY environment variable in the .env file."
         )
 
-    logging.info("Initializing OpenRouteService client")
     with ExceptionContext("OpenRouteService client initialization", APIConnectionError):
-        client = openrouteservice.Client(key=api_key)
-        logging.info("OpenRouteService client initialized successfully")
-        return client
+        return _cached_ors_client(api_key)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_ors_client(api_key: str) -> openrouteservice.Client:
+    """Create the OpenRouteService client once per API key."""
+    logging.info("Initializing OpenRouteService client")
+    client = openrouteservice.Client(key=api_key)
+    logging.info("OpenRouteService client initialized successfully")
+    return client
 
 
 @handle_exception(
@@ -88,6 +97,9 @@ def get_supabase_client() -> Client:
     """
     Get Supabase client with credentials from environment variables.
 
+    The client is cached per URL and key, so every caller shares one pooled
+    HTTP/2 session instead of repeating the TCP and TLS handshakes.
+
     Returns:
         Client: Initialized Supabase client
 
@@ -112,8 +124,14 @@ def get_supabase_client() -> Client:
             "Supabase key not found. Please set the SUPABASE_KEY environment variable in the .env file."
         )
 
-    logging.info("Initializing Supabase client")
     with ExceptionContext("Supabase client initialization", APIConnectionError):
-        client = create_client(url, key)
-        logging.info("Supabase client initialized successfully")
-        return client
+        return _cached_supabase_client(url, key)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_supabase_client(url: str, key: str) -> Client:
+    """Create the Supabase client once per credential pair."""
+    logging.info("Initializing Supabase client")
+    client = create_client(url, key)
+    logging.info("Supabase client initialized successfully")
+    return client
@@ -7,6 +7,9 @@ This module contains utility functions for loading and processing data from Supa
 Functions:
     load_data: Load data from a Supabase table into a pandas DataFrame.
     load_isochrones: Load isochrone data from Supabase and convert to GeoJSON format.
+    iter_isochrone_features: Yield isochrone features page by page from Supabase.
+    iter_table_pages: Yield any table's rows in prefetched, id-ordered pages.
+    get_table_version: Build a cheap version token for a table's current contents.
 
 Example:
     >>> from src.utils.data_utils import load_data
@@ -16,14 +19,19 @@ Example:
 
 # Standard library imports
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import compress
 
 # Third-party imports
+import numpy as np
+import orjson
 import pandas as pd
-from shapely import wkb
+import shapely
 from shapely.geometry import mapping
 from supabase import Client
 
 # Local imports
+from src.config import GEOMETRY_SETTINGS
 from src.utils.error_utils import (
     handle_exception,
     DataAccessError,
@@ -31,7 +39,15 @@ from src.utils.error_utils import (
     DataValidationError,
     GeoJSONError,
 )
-from src.utils.logging_utils import LogContext, with_log_context
+from src.utils.logging_utils import with_log_context
+from src.utils.retry_util import retry
+
+# Rows fetched per Supabase request when paging through isochrones
+ISOCHRONE_PAGE_SIZE = 500
+
+# Supabase reads are retried with jittered exponential backoff
+READ_MAX_ATTEMPTS = 3
+READ_RETRY_DELAY = 1.0
 
 
 @handle_exception(custom_mapping={Exception: DataAccessError})
@@ -53,7 +69,13 @@ def load_data(supabase: Client, table_name: str, dtype=None) -> pd.DataFrame:
     """
     # Query the table from Supabase
     logging.info(f"Loading data from table: {table_name}")
-    response = supabase.table(table_name).select("*").execute()
+    response = retry(
+        supabase.table(table_name).select("*").execute,
+        retries=READ_MAX_ATTEMPTS,
+        delay=READ_RETRY_DELAY,
+        error_type=DataAccessError,
+        jitter=True,
+    )
 
     # Convert the data to a pandas DataFrame
     data = pd.DataFrame(response.data)  # Access the data attribute directly
@@ -83,6 +105,9 @@ def load_isochrones(supabase: Client, tables_config: dict) -> dict:
     """
     Load and prepare isochrone data from a Supabase table.
 
+    When the isochrones config names a ``geojson_rpc``, PostGIS builds the
+    FeatureCollection server-side; if that call fails, rows are decoded locally.
+
     Args:
         supabase (Client): The Supabase client instance.
         tables_config (dict): The TABLES configuration dictionary.
@@ -96,6 +121,77 @@ def load_isochrones(supabase: Client, tables_config: dict) -> dict:
         DataProcessingError: If the data cannot be processed.
         GeoJSONError: If there's an issue with GeoJSON conversion.
     """
+    # Let PostGIS assemble the whole FeatureCollection when an export RPC is configured
+    isochrones_config = tables_config.get("isochrones", {})
+    geojson_rpc = isochrones_config.get("geojson_rpc")
+    if geojson_rpc:
+        try:
+            return _load_isochrones_rpc(
+                supabase, geojson_rpc, isochrones_config.get("property_fields")
+            )
+        except DataValidationError:
+            raise
+        except Exception as e:
+            logging.warning(
+                f"RPC {geojson_rpc} failed, decoding isochrones locally instead: {e}"
+            )
+
+    features = list(iter_isochrone_features(supabase, tables_config))
+    return {"type": "FeatureCollection", "features": features}
+
+
+def _load_isochrones_rpc(
+    supabase: Client, rpc_name: str, property_fields: list = None
+) -> dict:
+    """Fetch the isochrone FeatureCollection already serialized by PostGIS."""
+    logging.info(f"Loading isochrone GeoJSON via RPC: {rpc_name}")
+    response = supabase.rpc(
+        rpc_name,
+        {
+            "p_tolerance": GEOMETRY_SETTINGS["tolerance"],
+            "p_precision": GEOMETRY_SETTINGS["precision"],
+            "p_property_fields": property_fields,
+        },
+    ).execute()
+
+    isochrones = response.data
+    if not isochrones or not isochrones.get("features"):
+        logging.warning(f"No isochrone data returned by RPC: {rpc_name}")
+        raise DataValidationError(f"No isochrone data returned by RPC: {rpc_name}")
+
+    logging.info(f"Loaded {len(isochrones['features'])} isochrone features via RPC")
+    return isochrones
+
+
+def iter_isochrone_features(
+    supabase: Client,
+    tables_config: dict,
+    page_size: int = ISOCHRONE_PAGE_SIZE,
+    encoded: bool = False,
+):
+    """
+    Yield isochrone GeoJSON features, querying and decoding one page at a time.
+
+    Only a single page of rows and features is held in memory, so callers that
+    stream or encode features incrementally stay flat in memory regardless of
+    table size. Pages come from iter_table_pages, which prefetches the next
+    page while the current one is decoded. Errors are raised during iteration
+    rather than on the call.
+
+    Args:
+        supabase (Client): The Supabase client instance.
+        tables_config (dict): The TABLES configuration dictionary.
+        page_size (int): Number of rows fetched per Supabase request.
+        encoded (bool): Yield each feature as JSON bytes instead of a dict.
+
+    Yields:
+        dict | bytes: A GeoJSON Feature for each row with a valid geometry.
+
+    Raises:
+        DataValidationError: If the configuration or table data is missing.
+        DataProcessingError: If a feature cannot be built from a row.
+        GeoJSONError: If none of the geometries could be converted.
+    """
     # Dynamically get table name and column mappings from config
     if "isochrones" not in tables_config:
         logging.error("Missing isochrones configuration")
@@ -103,77 +199,220 @@ def load_isochrones(supabase: Client, tables_config: dict) -> dict:
 
     isochrones_table = tables_config["isochrones"]["table_name"]
     columns = tables_config["isochrones"]["columns"]
+    property_fields = tables_config["isochrones"].get("property_fields")
 
     logging.info(f"Loading isochrone data from table: {isochrones_table}")
 
-    # Query the "isochrones" table from Supabase
-    response = (
-        supabase.table(isochrones_table)
-        .select(
-            f"{columns['name']}, {columns['value']}, {columns['geometry']}, {columns['metadata']}"
-        )
-        .execute()
+    select_columns = (
+        f"{columns['name']}, {columns['value']}, {columns['geometry']}, {columns['metadata']}"
     )
 
-    # Ensure the response contains data
-    if not response.data:
+    row_count = 0
+    feature_count = 0
+    geometry_errors = 0
+
+    for rows in iter_table_pages(
+        supabase,
+        isochrones_table,
+        select_columns,
+        order_column=columns.get("id", "id"),
+        page_size=page_size,
+    ):
+        row_count += len(rows)
+        logging.debug("Processing %d isochrone rows", len(rows))
+
+        features, errors = _features_from_rows(
+            rows, columns, property_fields, encoded
+        )
+        geometry_errors += errors
+        feature_count += len(features)
+        yield from features
+
+    # Ensure the table contained data
+    if row_count == 0:
         logging.warning(f"No isochrone data found in table: {isochrones_table}")
         raise DataValidationError(
             f"No isochrone data found in table: {isochrones_table}"
         )
 
-    logging.info(f"Processing {len(response.data)} isochrone features")
-
-    # Convert the data into GeoJSON-like format
-    isochrones_features = []
-    geometry_errors = 0
-
-    for i, row in enumerate(response.data):
-        with LogContext(feature_idx=i, feature_name=row[columns["name"]]):
-            geometry_raw = row[columns["geometry"]]
-            logging.debug("Processing geometry data")
-
-            # Validate and convert the geometry field
-            try:
-                # Attempt to parse as WKB
-                geometry = wkb.loads(bytes.fromhex(geometry_raw))
-                geometry_geojson = mapping(geometry)  # Convert to GeoJSON
-            except ValueError as ve:
-                geometry_errors += 1
-                logging.warning(f"Invalid geometry format: {ve}")
-                continue
-            except Exception as parse_error:
-                geometry_errors += 1
-                logging.warning(f"Error processing geometry: {parse_error}")
-                continue
-
-            try:
-                properties = {
-                    "name": row[columns["name"]],
-                    "value": row[columns["value"]],
-                    **row[columns["metadata"]],  # Include metadata
-                }
-
-                isochrones_features.append(
-                    {
-                        "type": "Feature",
-                        "geometry": geometry_geojson,
-                        "properties": properties,
-                    }
-                )
-            except Exception as e:
-                logging.warning(f"Failed to create feature: {e}")
-                raise DataProcessingError(f"Failed to create feature from row {i}: {e}")
-
     # If all geometries failed, raise a more specific error
-    if geometry_errors > 0 and len(isochrones_features) == 0:
+    if geometry_errors > 0 and feature_count == 0:
         logging.error(f"All {geometry_errors} geometries failed to process")
         raise GeoJSONError("Failed to process any geometries to GeoJSON format")
 
     if geometry_errors > 0:
         logging.warning(f"Skipped {geometry_errors} invalid geometries")
 
-    logging.info(
-        f"Successfully processed {len(isochrones_features)} valid isochrone features"
+    logging.info(f"Successfully processed {feature_count} valid isochrone features")
+
+
+def iter_table_pages(
+    supabase: Client,
+    table_name: str,
+    select_clause: str = "*",
+    order_column: str = "id",
+    page_size: int = ISOCHRONE_PAGE_SIZE,
+):
+    """
+    Yield a table's rows one page at a time, ordered for stable pagination.
+
+    The next page is requested in a background thread while the caller
+    processes the current one, hiding most of the per-page round trip.
+
+    Args:
+        supabase (Client): The Supabase client instance.
+        table_name (str): The name of the table to query.
+        select_clause (str): PostgREST select expression.
+        order_column (str): Column used to keep page boundaries stable.
+        page_size (int): Number of rows fetched per Supabase request.
+
+    Yields:
+        list: The rows of each non-empty page.
+    """
+
+    def fetch_page(start: int) -> list:
+        # Query builders accumulate range params, so each page needs a fresh one
+        query = (
+            supabase.table(table_name)
+            .select(select_clause)
+            .order(order_column)
+            .range(start, start + page_size - 1)
+        )
+        return retry(
+            query.execute,
+            retries=READ_MAX_ATTEMPTS,
+            delay=READ_RETRY_DELAY,
+            error_type=DataAccessError,
+            jitter=True,
+        ).data
+
+    row_count = 0
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(fetch_page, 0)
+        while pending is not None:
+            rows = pending.result()
+            if not rows:
+                break
+            row_count += len(rows)
+            pending = (
+                executor.submit(fetch_page, row_count)
+                if len(rows) == page_size
+                else None
+            )
+            yield rows
+
+
+def _features_from_rows(
+    rows: list, columns: dict, property_fields: list = None, encoded: bool = False
+) -> tuple:
+    """Build GeoJSON features for a page of rows, returning them with the error count.
+
+    With ``encoded`` set, geometry JSON comes straight from GEOS and each feature
+    is assembled as bytes, skipping the nested coordinate tuples of ``mapping``.
+    """
+    # GEOS decodes the hex WKB itself in one vectorized call, so no per-row
+    # bytes.fromhex is needed; invalid entries become None
+    geometry_column = columns["geometry"]
+    hex_geometries = np.fromiter(
+        (row[geometry_column] for row in rows), dtype=object, count=len(rows)
+    )
+    geometries = shapely.from_wkb(hex_geometries, on_invalid="ignore")
+    valid = ~shapely.is_missing(geometries)
+
+    # Drop redundant vertices and excess float precision to shrink the payload
+    geometries = shapely.simplify(
+        geometries[valid], GEOMETRY_SETTINGS["tolerance"], preserve_topology=True
+    )
+    geometries = shapely.set_coordinates(
+        geometries,
+        np.round(shapely.get_coordinates(geometries), GEOMETRY_SETTINGS["precision"]),
+    )
+    valid_rows = list(compress(rows, valid))
+    properties_iter = _iter_feature_properties(valid_rows, columns, property_fields)
+
+    try:
+        if encoded:
+            features = [
+                b'{"type":"Feature","geometry":'
+                + geometry.encode()
+                + b',"properties":'
+                + orjson.dumps(properties)
+                + b"}"
+                for properties, geometry in zip(
+                    properties_iter, shapely.to_geojson(geometries)
+                )
+            ]
+        else:
+            features = [
+                {
+                    "type": "Feature",
+                    "geometry": mapping(geometry),
+                    "properties": properties,
+                }
+                for properties, geometry in zip(properties_iter, geometries)
+            ]
+    except Exception as e:
+        logging.warning(f"Failed to create feature: {e}")
+        raise DataProcessingError(f"Failed to create isochrone features: {e}")
+
+    return features, len(rows) - len(valid_rows)
+
+
+def _iter_feature_properties(
+    rows: list, columns: dict, property_fields: list = None
+):
+    """Yield each row's properties: its name, value and allowed metadata keys.
+
+    ``property_fields`` lists the metadata keys to keep; ``None`` keeps them all.
+    Column names are resolved once and each properties dict is built in one literal.
+    """
+    name_column = columns["name"]
+    value_column = columns["value"]
+    metadata_column = columns["metadata"]
+
+    for row in rows:
+        metadata = row[metadata_column] or {}
+        if property_fields is not None:
+            metadata = {
+                key: metadata[key] for key in property_fields if key in metadata
+            }
+        yield {"name": row[name_column], "value": row[value_column], **metadata}
+
+
+@handle_exception(
+    custom_mapping={KeyError: DataValidationError, Exception: DataAccessError}
+)
+@with_log_context(module="data_utils", operation="get_table_version")
+def get_table_version(supabase: Client, tables_config: dict, table_key: str) -> str:
+    """
+    Build a version token for a table from its row count and latest update time.
+
+    Only a single row is transferred, so callers can cheaply decide whether
+    previously loaded data is still current.
+
+    Args:
+        supabase (Client): The Supabase client instance.
+        tables_config (dict): The TABLES configuration dictionary.
+        table_key (str): Key of the table in tables_config.
+
+    Returns:
+        str: A token that changes whenever rows are inserted, updated or deleted.
+
+    Raises:
+        DataValidationError: If the table is not configured.
+        DataAccessError: If the version cannot be queried from Supabase.
+    """
+    table_name = tables_config[table_key]["table_name"]
+    updated_at = tables_config[table_key].get("columns", {}).get(
+        "updated_at", "updated_at"
+    )
+
+    response = (
+        supabase.table(table_name)
+        .select(updated_at, count="exact")
+        .order(updated_at, desc=True)
+        .limit(1)
+        .execute()
     )
-    return {"type": "FeatureCollection", "features": isochrones_features}
+    latest = response.data[0][updated_at] if response.data else ""
+    return f"{response.count or 0}:{latest}"
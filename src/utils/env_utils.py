@@ -14,6 +14,7 @@ Example:
 """
 
 # Standard library imports
+import functools
 import os
 import logging
 from pathlib import Path
@@ -40,6 +41,9 @@ def load_env_variables(required_vars: Optional[List[str]] = None) -> Tuple[Path,
     """
     Load environment variables from .env file.
 
+    The file is parsed once per process; later calls only re-check
+    ``required_vars`` against the environment.
+
     Args:
         required_vars: List of required environment variable names
 
@@ -50,6 +54,43 @@ def load_env_variables(required_vars: Optional[List[str]] = None) -> Tuple[Path,
         ConfigError: When .env file could not be loaded
         ConfigMissingError: When required variables are missing
     """
+    dotenv_path, success = _load_dotenv_file()
+    if not success:
+        return dotenv_path, False
+
+    # Required variables are always checked against the live environment
+    if required_vars:
+        with LogContext(file_path=str(dotenv_path), required_count=len(required_vars)):
+            missing_vars = [var for var in required_vars if not os.environ.get(var)]
+
+            # Per-variable context is only built on the failure path
+            for var in missing_vars:
+                with LogContext(variable=var):
+                    logging.warning(f"Required environment variable missing: {var}")
+
+            if missing_vars:
+                missing_vars_str = ", ".join(missing_vars)
+                logging.error(
+                    f"Missing required environment variables: {missing_vars_str}"
+                )
+                raise ConfigMissingError(
+                    f"Missing required environment variables: {missing_vars_str}"
+                )
+
+            logging.info(
+                f"All required environment variables are present ({len(required_vars)} checked)"
+            )
+
+    return dotenv_path, success
+
+
+@functools.lru_cache(maxsize=1)
+def _load_dotenv_file() -> Tuple[Path, bool]:
+    """Locate and parse the project .env file once per process.
+
+    Returns:
+        Tuple of (dotenv_path, success)
+    """
     # Get the project root directory (3 levels up from this file)
     dotenv_path = Path(__file__).resolve().parent.parent.parent / ".env"
 
@@ -60,36 +101,9 @@ def load_env_variables(required_vars: Optional[List[str]] = None) -> Tuple[Path,
         with ExceptionContext("Loading .env file", ConfigError):
             success = load_dotenv(dotenv_path=dotenv_path)
 
-            if not success:
-                logging.warning(f".env file not found at {dotenv_path}")
-                return dotenv_path, False
-
+        if not success:
+            logging.warning(f".env file not found at {dotenv_path}")
+        else:
             logging.info(".env file loaded successfully")
 
-        # Check for required variables if specified
-        if success and required_vars:
-            with LogContext(required_count=len(required_vars)):
-                missing_vars = []
-
-                for var in required_vars:
-                    with LogContext(variable=var):
-                        if not os.environ.get(var):
-                            missing_vars.append(var)
-                            logging.warning(
-                                f"Required environment variable missing: {var}"
-                            )
-
-                if missing_vars:
-                    missing_vars_str = ", ".join(missing_vars)
-                    logging.error(
-                        f"Missing required environment variables: {missing_vars_str}"
-                    )
-                    raise ConfigMissingError(
-                        f"Missing required environment variables: {missing_vars_str}"
-                    )
-
-                logging.info(
-                    f"All required environment variables are present ({len(required_vars)} checked)"
-                )
-
     return dotenv_path, success
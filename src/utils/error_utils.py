@@ -119,6 +119,12 @@ class ResourceNotFoundError(ResourceError):
 T = TypeVar("T")
 
 
+def _log_traceback():
+    """Log the active exception's traceback, formatting it only when DEBUG is on."""
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("Exception details: %s", traceback.format_exc())
+
+
 def handle_exception(
     func: Callable[..., T] = None,
     custom_mapping: dict[Type[Exception], Type[AppError]] = None,
@@ -134,6 +140,9 @@ def handle_exception(
         Decorated function with standardized exception handling
     """
 
+    # Resolved once at decoration time; the wrapper only does a single get
+    mapping = custom_mapping or {}
+
     def decorator(fn):
         @functools.wraps(fn)
         def wrapper(*args, **kwargs) -> T:
@@ -145,15 +154,15 @@ def handle_exception(
                 raise
             except Exception as e:
                 # Check for custom mapping
-                if custom_mapping and type(e) in custom_mapping:
-                    error_cls = custom_mapping[type(e)]
+                error_cls = mapping.get(type(e))
+                if error_cls is not None:
                     logging.error(f"Mapped error in {fn.__name__}: {str(e)}")
-                    logging.debug(f"Exception details: {traceback.format_exc()}")
+                    _log_traceback()
                     raise error_cls(str(e)) from e
                 else:
                     # Fall back to generic error
                     logging.error(f"Unexpected error in {fn.__name__}: {str(e)}")
-                    logging.debug(f"Exception details: {traceback.format_exc()}")
+                    _log_traceback()
                     raise AppError(f"Unexpected error: {str(e)}") from e
 
         return wrapper
@@ -193,7 +202,7 @@ class ExceptionContext:
 
         # Convert to custom exception
         logging.error(f"Error in {self.operation_name}: {str(exc_val)}")
-        logging.debug(f"Exception details: {traceback.format_exc()}")
+        _log_traceback()
         raise self.error_cls(
             f"Error in {self.operation_name}: {str(exc_val)}"
         ) from exc_val
@@ -10,9 +10,10 @@ Functions:
     create_point: Create a GeoJSON Point feature.
     create_polygon: Create a GeoJSON Polygon feature.
     extract_features: Extract all features from a GeoJSON object.
+    iter_features: Iterate over the features of a GeoJSON object without copying.
     find_features_by_property: Find features with matching property.
     get_bbox: Calculate the bounding box for a GeoJSON object.
-    merge_feature_collections: Merge two feature collections.
+    merge_feature_collections: Merge two or more feature collections.
     merge_geojson: Merge multiple GeoJSON objects into a single FeatureCollection.
     process_geojson_batch: Process a batch of GeoJSON files with proper error handling.
 
@@ -23,12 +24,20 @@ Example:
 """
 
 # Standard library imports
-import json
+import hashlib
 import logging
-from typing import Dict, List, Union, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from pathlib import Path
+from typing import Dict, Iterator, List, Union, Any, Optional
+
+# Third-party imports
+import numpy as np
+import orjson
 
 # Local imports
-from src.utils.logging_utils import LogContext, with_log_context
+from src.utils.logging_utils import LazyFormat, LogContext, with_log_context
 from src.utils.error_utils import (
     handle_exception,
     ExceptionContext,
@@ -50,22 +59,54 @@ VALID_GEOJSON_TYPES = {
     "FeatureCollection",
 }
 
+# Digests of raw payloads that passed validate_geojson; reset when full
+VALIDATED_CACHE_SIZE = 256
+_validated_digests = set()
+
+# Upper bound on threads reading files in process_geojson_batch
+BATCH_MAX_WORKERS = 32
+
+# Batch files at least this large are loaded one at a time to bound peak memory
+LARGE_FILE_BYTES = 64 * 1024 * 1024
+_large_file_lock = threading.Lock()
+
+# Types whose members are validated as child nodes rather than coordinates
+CONTAINER_TYPES = {"Feature", "FeatureCollection", "GeometryCollection"}
+
+# Coordinate nesting depth of each geometry type (0 = a single position)
+GEOMETRY_DIMENSIONS = {
+    "Point": 0,
+    "LineString": 1,
+    "MultiPoint": 1,
+    "Polygon": 2,
+    "MultiLineString": 2,
+    "MultiPolygon": 3,
+}
+
+# Validation error for each coordinate nesting depth (0 = a single position)
+COORDINATE_ERRORS = {
+    0: "Point coordinates must be an array of at least 2 numbers",
+    1: "LineString/MultiPoint must be an array of positions",
+    2: "Polygon/MultiLineString must be an array of line arrays",
+    3: "MultiPolygon must be an array of polygon arrays",
+}
+
 
 @handle_exception(
     custom_mapping={
-        json.JSONDecodeError: DataValidationError,
+        orjson.JSONDecodeError: DataValidationError,
         ValueError: DataValidationError,
         TypeError: DataValidationError,
         Exception: GeoJSONError,
     }
 )
 @with_log_context(module="geojson_utils", operation="validate_geojson")
-def validate_geojson(data: Union[Dict, str]) -> Dict:
+def validate_geojson(data: Union[Dict, str, bytes]) -> Dict:
     """
     Validate if the input is valid GeoJSON.
 
     Args:
-        data: GeoJSON data as dict or JSON string
+        data: GeoJSON data as dict or JSON string/bytes
 
     Returns:
         Dict: The validated GeoJSON data
@@ -74,15 +115,23 @@ def validate_geojson(data: Union[Dict, str]) -> Dict:
         DataValidationError: If data doesn't follow GeoJSON spec
         GeoJSONError: For other GeoJSON-related errors
     """
-    # Parse if string input
-    if isinstance(data, str):
+    # Parse if string or raw bytes input
+    digest = None
+    if isinstance(data, (str, bytes)):
+        digest = _content_digest(data)
         try:
             logging.debug("Parsing JSON string input")
-            data = json.loads(data)
-        except json.JSONDecodeError as e:
-            logging.warning(f"Invalid JSON: {e}")
+            data = orjson.loads(data)
+        except orjson.JSONDecodeError as e:
+            logging.warning("Invalid JSON: %s", e)
             raise DataValidationError(f"Invalid JSON: {e}")
 
+        # Identical payloads already passed validation; parsing still returns a
+        # fresh object so callers never share a mutable result
+        if digest in _validated_digests:
+            logging.debug("GeoJSON payload previously validated, skipping traversal")
+            return data
+
     # Must be a dictionary
     if not isinstance(data, dict):
         logging.warning("GeoJSON must be a JSON object")
@@ -95,159 +144,232 @@ def validate_geojson(data: Union[Dict, str]) -> Dict:
 
     # Type must be valid
     if data["type"] not in VALID_GEOJSON_TYPES:
-        logging.warning(f"Invalid GeoJSON type: {data['type']}")
+        logging.warning("Invalid GeoJSON type: %s", data["type"])
         raise DataValidationError(f"Invalid GeoJSON type: {data['type']}")
 
     # Validate based on type
     with LogContext(geojson_type=data["type"]):
-        logging.debug(f"Validating {data['type']} object")
-
-        if data["type"] == "Feature":
-            _validate_feature(data)
-        elif data["type"] == "FeatureCollection":
-            _validate_feature_collection(data)
-        elif data["type"] == "GeometryCollection":
-            _validate_geometry_collection(data)
-        else:
-            _validate_geometry(data)
+        logging.debug("Validating %s object", data["type"])
+        _validate_tree(data)
+
+    if digest is not None:
+        if len(_validated_digests) >= VALIDATED_CACHE_SIZE:
+            _validated_digests.clear()
+        _validated_digests.add(digest)
 
     logging.info("GeoJSON validation successful")
     return data
 
 
+def _content_digest(data: Union[str, bytes]) -> bytes:
+    """Hash a raw GeoJSON payload for the validated-content cache."""
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
 def _validate_coordinates(coords, dimension):
-    """Validate coordinates based on geometry dimension."""
-    with LogContext(coord_dimension=dimension):
-        if dimension == 0:  # Point
-            if not isinstance(coords, list) or len(coords) < 2:
-                logging.warning("Invalid point coordinates")
-                raise DataValidationError(
-                    "Point coordinates must be an array of at least 2 numbers"
-                )
-        elif dimension == 1:  # LineString or MultiPoint
-            if not isinstance(coords, list):
-                logging.warning("Invalid LineString/MultiPoint coordinates")
-                raise DataValidationError(
-                    "LineString/MultiPoint must be an array of positions"
-                )
-            for i, point in enumerate(coords):
-                with LogContext(point_idx=i):
-                    _validate_coordinates(point, 0)
-        elif dimension == 2:  # Polygon or MultiLineString
-            if not isinstance(coords, list):
-                logging.warning("Invalid Polygon/MultiLineString coordinates")
-                raise DataValidationError(
-                    "Polygon/MultiLineString must be an array of line arrays"
-                )
-            for i, line in enumerate(coords):
-                with LogContext(line_idx=i):
-                    _validate_coordinates(line, 1)
-        elif dimension == 3:  # MultiPolygon
-            if not isinstance(coords, list):
-                logging.warning("Invalid MultiPolygon coordinates")
-                raise DataValidationError(
-                    "MultiPolygon must be an array of polygon arrays"
-                )
-            for i, polygon in enumerate(coords):
-                with LogContext(polygon_idx=i):
-                    _validate_coordinates(polygon, 2)
+    """Validate coordinates based on geometry dimension.
+
+    Nesting levels are checked for list structure, then every position is
+    validated in a single NumPy conversion instead of recursing point by point.
+    """
+    # Flatten rings/lines/polygons down to a flat list of positions
+    parts = [coords]
+    for level in range(dimension, 0, -1):
+        if not all(isinstance(part, list) for part in parts):
+            logging.warning("Invalid coordinates at nesting depth %d", level)
+            raise DataValidationError(COORDINATE_ERRORS[level])
+        parts = list(chain.from_iterable(parts))
+
+    if not parts:
+        return
+
+    if not all(isinstance(position, list) for position in parts):
+        logging.warning("Invalid position coordinates")
+        raise DataValidationError(COORDINATE_ERRORS[0])
+
+    try:
+        positions = np.asarray(parts, dtype=np.float64)
+    except ValueError:
+        # Mixed 2D/3D positions cannot share one array; check them one by one
+        for position in parts:
+            _validate_position(position)
+        return
+    except TypeError as e:
+        logging.warning("Invalid position values: %s", e)
+        raise DataValidationError(f"{COORDINATE_ERRORS[0]}: {e}")
+
+    if positions.ndim != 2 or positions.shape[1] < 2:
+        logging.warning("Invalid position coordinates")
+        raise DataValidationError(COORDINATE_ERRORS[0])
+
+
+def _validate_position(position):
+    """Validate a single position as a flat list of at least two numbers."""
+    try:
+        values = np.asarray(position, dtype=np.float64)
+    except (TypeError, ValueError) as e:
+        logging.warning("Invalid position values: %s", e)
+        raise DataValidationError(f"{COORDINATE_ERRORS[0]}: {e}")
+
+    if values.ndim != 1 or values.size < 2:
+        logging.warning("Invalid position coordinates")
+        raise DataValidationError(COORDINATE_ERRORS[0])
+
+
+def _flatten_positions(coords, dimension):
+    """Flatten coordinates nested ``dimension`` levels deep into a list of positions."""
+    positions = [coords]
+    for _ in range(dimension):
+        positions = list(chain.from_iterable(positions))
+    return positions
+
+
+def _geometry_kind(geometry):
+    """Classify a geometry member as a nested collection or a coordinate geometry."""
+    if isinstance(geometry, dict) and geometry.get("type") == "GeometryCollection":
+        return "GeometryCollection"
+    return "Geometry"
 
 
 def _validate_geometry(geometry):
     """Validate a GeoJSON geometry object."""
-    if "coordinates" not in geometry:
+    coords = geometry.get("coordinates")
+    if coords is None and "coordinates" not in geometry:
         logging.warning("Geometry missing 'coordinates' property")
         raise DataValidationError("Geometry must have 'coordinates' property")
 
     geom_type = geometry["type"]
-    coords = geometry["coordinates"]
-
-    # Validate coordinates based on geometry type
-    with LogContext(geometry_type=geom_type):
-        logging.debug(f"Validating {geom_type} coordinates")
-        if geom_type == "Point":
-            _validate_coordinates(coords, 0)
-        elif geom_type in ("LineString", "MultiPoint"):
-            _validate_coordinates(coords, 1)
-        elif geom_type in ("Polygon", "MultiLineString"):
-            _validate_coordinates(coords, 2)
-        elif geom_type == "MultiPolygon":
-            _validate_coordinates(coords, 3)
-
-
-def _validate_feature(feature):
-    """Validate a GeoJSON Feature object."""
-    if "geometry" not in feature:
-        logging.warning("Feature missing 'geometry' property")
-        raise DataValidationError("Feature must have a 'geometry' property")
-
-    # Geometry can be null
-    if feature["geometry"] is not None:
-        # Validate geometry
-        if not isinstance(feature["geometry"], dict):
-            logging.warning("Feature geometry is not an object")
-            raise DataValidationError(
-                "Feature geometry must be a GeoJSON geometry object"
-            )
-
-        # Validate the geometry
-        logging.debug("Validating feature geometry")
-        _validate_geometry(feature["geometry"])
-
-    # Properties can be null or an object
-    if "properties" in feature and feature["properties"] is not None:
-        if not isinstance(feature["properties"], dict):
-            logging.warning("Feature properties is not an object")
-            raise DataValidationError("Feature properties must be an object")
-
-    logging.debug("Feature validation successful")
-
-
-def _validate_feature_collection(fc):
-    """Validate a GeoJSON FeatureCollection."""
-    if "features" not in fc:
-        logging.warning("FeatureCollection missing 'features' property")
-        raise DataValidationError("FeatureCollection must have a 'features' property")
-
-    if not isinstance(fc["features"], list):
-        logging.warning("FeatureCollection 'features' is not an array")
-        raise DataValidationError("FeatureCollection 'features' must be an array")
-
-    for i, feature in enumerate(fc["features"]):
-        with LogContext(feature_idx=i):
-            logging.debug(f"Validating feature {i}")
-            _validate_feature(feature)
-
-    logging.debug(f"FeatureCollection with {len(fc['features'])} features validated")
-
-
-def _validate_geometry_collection(gc):
-    """Validate a GeoJSON GeometryCollection."""
-    if "geometries" not in gc:
-        logging.warning("GeometryCollection missing 'geometries' property")
-        raise DataValidationError(
-            "GeometryCollection must have a 'geometries' property"
-        )
 
-    if not isinstance(gc["geometries"], list):
-        logging.warning("GeometryCollection 'geometries' is not an array")
-        raise DataValidationError("GeometryCollection 'geometries' must be an array")
+    dimension = GEOMETRY_DIMENSIONS.get(geom_type)
+    if dimension is None:
+        logging.warning("Invalid geometry type: %s", geom_type)
+        raise DataValidationError(f"Invalid geometry type: {geom_type}")
 
-    for i, geometry in enumerate(gc["geometries"]):
-        with LogContext(geometry_idx=i):
-            logging.debug(f"Validating geometry {i}")
-            _validate_geometry(geometry)
+    # Validate coordinates at the nesting depth of the geometry type
+    logging.debug("Validating %s coordinates", geom_type)
+    _validate_coordinates(coords, dimension)
 
-    logging.debug(
-        f"GeometryCollection with {len(gc['geometries'])} geometries validated"
-    )
+
+def _validate_tree(data):
+    """Validate a GeoJSON object and its children with an explicit work stack.
+
+    Collections push their members instead of recursing, so each feature or
+    geometry costs one loop iteration rather than a chain of helper calls.
+    Members are pushed in reverse to report the first invalid one first.
+
+    Each entry carries its location as a (parent, member, index) chain, which
+    is only rendered into the message when a member fails validation.
+    """
+    root_type = data["type"]
+    root_kind = root_type if root_type in CONTAINER_TYPES else "Geometry"
+    stack = [(root_kind, data, None)]
+    location = None
+
+    try:
+        while stack:
+            kind, node, location = stack.pop()
+
+            if kind == "Geometry":
+                _validate_geometry(node)
+
+            elif kind == "Feature":
+                if "geometry" not in node:
+                    logging.warning("Feature missing 'geometry' property")
+                    raise DataValidationError(
+                        "Feature must have a 'geometry' property"
+                    )
+
+                # Geometry can be null
+                geometry = node["geometry"]
+                if geometry is not None:
+                    if not isinstance(geometry, dict):
+                        logging.warning("Feature geometry is not an object")
+                        raise DataValidationError(
+                            "Feature geometry must be a GeoJSON geometry object"
+                        )
+                    geometry_location = (location, "geometry", None)
+                    stack.append(
+                        (_geometry_kind(geometry), geometry, geometry_location)
+                    )
+
+                # Properties can be null or an object
+                properties = node.get("properties")
+                if properties is not None and not isinstance(properties, dict):
+                    logging.warning("Feature properties is not an object")
+                    raise DataValidationError("Feature properties must be an object")
+
+            elif kind == "FeatureCollection":
+                if "features" not in node:
+                    logging.warning("FeatureCollection missing 'features' property")
+                    raise DataValidationError(
+                        "FeatureCollection must have a 'features' property"
+                    )
+
+                features = node["features"]
+                if not isinstance(features, list):
+                    logging.warning("FeatureCollection 'features' is not an array")
+                    raise DataValidationError(
+                        "FeatureCollection 'features' must be an array"
+                    )
+
+                logging.debug(
+                    "Validating FeatureCollection with %d features", len(features)
+                )
+                stack.extend(
+                    ("Feature", features[i], (location, "features", i))
+                    for i in range(len(features) - 1, -1, -1)
+                )
+
+            else:  # GeometryCollection
+                if "geometries" not in node:
+                    logging.warning(
+                        "GeometryCollection missing 'geometries' property"
+                    )
+                    raise DataValidationError(
+                        "GeometryCollection must have a 'geometries' property"
+                    )
+
+                geometries = node["geometries"]
+                if not isinstance(geometries, list):
+                    logging.warning(
+                        "GeometryCollection 'geometries' is not an array"
+                    )
+                    raise DataValidationError(
+                        "GeometryCollection 'geometries' must be an array"
+                    )
+
+                logging.debug(
+                    "Validating GeometryCollection with %d geometries",
+                    len(geometries),
+                )
+                stack.extend(
+                    (
+                        _geometry_kind(geometries[i]),
+                        geometries[i],
+                        (location, "geometries", i),
+                    )
+                    for i in range(len(geometries) - 1, -1, -1)
+                )
+    except DataValidationError as e:
+        if location is None:
+            raise
+        raise DataValidationError(f"{_format_location(location)}: {e}") from e
+
+
+def _format_location(location):
+    """Render a (parent, member, index) chain as e.g. ``features[3].geometry``."""
+    parts = []
+    while location is not None:
+        location, member, index = location
+        parts.append(member if index is None else f"{member}[{index}]")
+    return ".".join(reversed(parts))
 
 
 # Helper functions
-@handle_exception(
-    custom_mapping={ValueError: DataValidationError, Exception: GeoJSONError}
-)
-@with_log_context(module="geojson_utils", operation="create_point")
+# These builders run once per feature in bulk loops, so they skip the
+# decorator stack and only emit lazily formatted debug logs
 def create_point(lon: float, lat: float, properties: Optional[Dict] = None) -> Dict:
     """
     Create a GeoJSON Point feature.
@@ -259,25 +381,15 @@ def create_point(lon: float, lat: float, properties: Optional[Dict] = None) -> D
 
     Returns:
         Dict: A GeoJSON Point feature
-
-    Raises:
-        DataValidationError: If coordinates are invalid
-        GeoJSONError: For other GeoJSON-related errors
     """
-    logging.debug(f"Creating point at lon: {lon}, lat: {lat}")
-    feature = {
+    logging.debug("Creating point at lon: %s, lat: %s", lon, lat)
+    return {
         "type": "Feature",
         "geometry": {"type": "Point", "coordinates": [lon, lat]},
         "properties": properties or {},
     }
-    logging.info("Point feature created successfully")
-    return feature
 
 
-@handle_exception(
-    custom_mapping={ValueError: DataValidationError, Exception: GeoJSONError}
-)
-@with_log_context(module="geojson_utils", operation="create_polygon")
 def create_polygon(
     coordinates: List[List[List[float]]], properties: Optional[Dict] = None
 ) -> Dict:
@@ -293,20 +405,17 @@ def create_polygon(
 
     Raises:
         DataValidationError: If coordinates are invalid
-        GeoJSONError: For other GeoJSON-related errors
     """
     if not coordinates or not isinstance(coordinates, list):
         logging.warning("Invalid polygon coordinates")
         raise DataValidationError("Polygon coordinates must be a non-empty array")
 
-    logging.debug(f"Creating polygon with {len(coordinates)} rings")
-    feature = {
+    logging.debug("Creating polygon with %d rings", len(coordinates))
+    return {
         "type": "Feature",
         "geometry": {"type": "Polygon", "coordinates": coordinates},
         "properties": properties or {},
     }
-    logging.info("Polygon feature created successfully")
-    return feature
 
 
 @handle_exception(custom_mapping={Exception: DataProcessingError})
@@ -324,24 +433,42 @@ def extract_features(geojson: Dict) -> List[Dict]:
     Raises:
         DataProcessingError: If feature extraction fails
     """
-    with LogContext(geojson_type=geojson.get("type")):
-        logging.debug(
-            f"Extracting features from {geojson.get('type', 'unknown')} object"
-        )
+    geojson_type = geojson["type"]
+    with LogContext(geojson_type=geojson_type):
+        logging.debug("Extracting features from %s object", geojson_type)
 
-        if geojson["type"] == "FeatureCollection":
+        if geojson_type == "FeatureCollection":
             features = geojson["features"]
-            logging.info(f"Extracted {len(features)} features from FeatureCollection")
+            logging.info("Extracted %d features from FeatureCollection", len(features))
             return features
-        elif geojson["type"] == "Feature":
+        elif geojson_type == "Feature":
             logging.info("Extracted single Feature")
             return [geojson]
         else:
             # Create a feature from a geometry
-            logging.info(f"Created feature from {geojson['type']} geometry")
+            logging.info("Created feature from %s geometry", geojson_type)
             return [{"type": "Feature", "geometry": geojson, "properties": {}}]
 
 
+def iter_features(geojson: Dict) -> Iterator[Dict]:
+    """
+    Iterate over the features of a GeoJSON object without building a list.
+
+    Args:
+        geojson: Any GeoJSON object
+
+    Yields:
+        Dict: Each GeoJSON feature; a bare geometry is wrapped in a Feature
+    """
+    geojson_type = geojson["type"]
+    if geojson_type == "FeatureCollection":
+        yield from geojson["features"]
+    elif geojson_type == "Feature":
+        yield geojson
+    else:
+        yield {"type": "Feature", "geometry": geojson, "properties": {}}
+
+
 @handle_exception(
     custom_mapping={KeyError: DataValidationError, Exception: DataProcessingError}
 )
@@ -362,17 +489,20 @@ def find_features_by_property(geojson: Dict, key: str, value: Any) -> List[Dict]
         DataValidationError: If input is invalid
         DataProcessingError: If feature search fails
     """
-    with LogContext(property_key=key, property_value=str(value)):
-        logging.debug(f"Searching for features with {key}={value}")
+    with LogContext(property_key=key, property_value=LazyFormat(str, value)):
+        logging.debug("Searching for features with %s=%s", key, value)
 
-        features = extract_features(geojson)
+        # One properties lookup per feature, bound in place by the comprehension
         matched_features = [
             feature
-            for feature in features
-            if feature.get("properties") and feature["properties"].get(key) == value
+            for feature in iter_features(geojson)
+            if (properties := feature.get("properties"))
+            and properties.get(key) == value
         ]
 
-        logging.info(f"Found {len(matched_features)} features matching {key}={value}")
+        logging.info(
+            "Found %d features matching %s=%s", len(matched_features), key, value
+        )
         return matched_features
 
 
@@ -395,51 +525,38 @@ def get_bbox(geojson: Dict) -> List[float]:
         DataProcessingError: If bbox calculation fails
     """
     logging.debug("Calculating bounding box")
-    min_lon, min_lat = float("inf"), float("inf")
-    max_lon, max_lat = float("-inf"), float("-inf")
-
-    def update_bounds(lon, lat):
-        nonlocal min_lon, min_lat, max_lon, max_lat
-        min_lon = min(min_lon, lon)
-        min_lat = min(min_lat, lat)
-        max_lon = max(max_lon, lon)
-        max_lat = max(max_lat, lat)
-
-    def process_coords(coords, dim=0):
-        if dim == 0:  # Point
-            update_bounds(coords[0], coords[1])
-        elif dim == 1:  # LineString/MultiPoint
-            for point in coords:
-                process_coords(point, 0)
-        elif dim == 2:  # Polygon/MultiLineString
-            for line in coords:
-                process_coords(line, 1)
-        elif dim == 3:  # MultiPolygon
-            for polygon in coords:
-                process_coords(polygon, 2)
-
-    features = extract_features(geojson)
-    for i, feature in enumerate(features):
-        with LogContext(feature_idx=i):
-            if feature["geometry"] is None:
-                logging.debug("Skipping feature with null geometry")
-                continue
-
-            geom_type = feature["geometry"]["type"]
-            coords = feature["geometry"]["coordinates"]
-
-            logging.debug(f"Processing {geom_type} coordinates")
-            if geom_type == "Point":
-                process_coords(coords, 0)
-            elif geom_type in ("LineString", "MultiPoint"):
-                process_coords(coords, 1)
-            elif geom_type in ("Polygon", "MultiLineString"):
-                process_coords(coords, 2)
-            elif geom_type == "MultiPolygon":
-                process_coords(coords, 3)
+
+    # Group coordinates by nesting depth so each depth is flattened once for
+    # all features, then reduce every position in one NumPy pass
+    coords_by_dimension = [[] for _ in range(max(GEOMETRY_DIMENSIONS.values()) + 1)]
+    for feature in iter_features(geojson):
+        geometry = feature["geometry"]
+        if geometry is None:
+            continue
+
+        dimension = GEOMETRY_DIMENSIONS.get(geometry["type"])
+        if dimension is not None:
+            coords_by_dimension[dimension].append(geometry["coordinates"])
+
+    positions = []
+    for dimension, coords in enumerate(coords_by_dimension):
+        if coords:
+            positions.extend(_flatten_positions(coords, dimension + 1))
+
+    if not positions:
+        min_lon, min_lat = float("inf"), float("inf")
+        max_lon, max_lat = float("-inf"), float("-inf")
+    else:
+        try:
+            points = np.asarray(positions, dtype=np.float64)[:, :2]
+        except ValueError:
+            # Mixed 2D/3D positions cannot share one array; trim them to lon/lat
+            points = np.asarray([position[:2] for position in positions], np.float64)
+        min_lon, min_lat = points.min(axis=0).tolist()
+        max_lon, max_lat = points.max(axis=0).tolist()
 
     bbox = [min_lon, min_lat, max_lon, max_lat]
-    logging.info(f"Calculated bounding box: {bbox}")
+    logging.info("Calculated bounding box: %s", bbox)
     return bbox
 
 
@@ -447,13 +564,14 @@ def get_bbox(geojson: Dict) -> List[float]:
     custom_mapping={ValueError: DataValidationError, Exception: DataProcessingError}
 )
 @with_log_context(module="geojson_utils", operation="merge_feature_collections")
-def merge_feature_collections(fc1: Dict, fc2: Dict) -> Dict:
+def merge_feature_collections(fc1: Dict, fc2: Dict, *others: Dict) -> Dict:
     """
-    Merge two feature collections.
+    Merge two or more feature collections.
 
     Args:
         fc1: First FeatureCollection
         fc2: Second FeatureCollection
+        *others: Additional FeatureCollections, merged in order in a single pass
 
     Returns:
         Dict: Merged FeatureCollection
@@ -462,22 +580,25 @@ def merge_feature_collections(fc1: Dict, fc2: Dict) -> Dict:
         DataValidationError: If inputs are not valid FeatureCollections
         DataProcessingError: If merging fails
     """
-    # Validate both are feature collections
-    if fc1["type"] != "FeatureCollection" or fc2["type"] != "FeatureCollection":
-        logging.warning("Inputs are not both FeatureCollections")
-        raise DataValidationError("Both inputs must be FeatureCollections")
+    collections = (fc1, fc2, *others)
+
+    # Validate all are feature collections
+    if any(fc["type"] != "FeatureCollection" for fc in collections):
+        logging.warning("Inputs are not all FeatureCollections")
+        raise DataValidationError("All inputs must be FeatureCollections")
 
+    feature_lists = [fc["features"] for fc in collections]
     logging.info(
-        f"Merging FeatureCollections with {len(fc1['features'])} and {len(fc2['features'])} features"
+        "Merging %d FeatureCollections with %s features",
+        len(feature_lists),
+        LazyFormat(lambda: ", ".join(str(len(f)) for f in feature_lists)),
     )
 
-    # Create a new feature collection with merged features
-    result = {
-        "type": "FeatureCollection",
-        "features": fc1["features"] + fc2["features"],
-    }
+    # Copy every feature reference exactly once, however many collections merge
+    merged_features = list(chain.from_iterable(feature_lists))
+    result = {"type": "FeatureCollection", "features": merged_features}
     logging.info(
-        f"Created merged FeatureCollection with {len(result['features'])} features"
+        "Created merged FeatureCollection with %d features", len(merged_features)
     )
     return result
 
@@ -486,12 +607,16 @@ def merge_feature_collections(fc1: Dict, fc2: Dict) -> Dict:
     custom_mapping={ValueError: DataValidationError, Exception: DataProcessingError}
 )
 @with_log_context(module="geojson_utils", operation="merge_geojson")
-def merge_geojson(geojson_objects: List[Dict[str, Any]]) -> Dict[str, Any]:
+def merge_geojson(
+    geojson_objects: List[Dict[str, Any]], validate: bool = True
+) -> Dict[str, Any]:
     """
     Merge multiple GeoJSON objects into a single FeatureCollection.
 
     Args:
         geojson_objects: List of GeoJSON objects to merge
+        validate: Validate each object first; pass False for objects the
+            caller has just validated
 
     Returns:
         dict: A FeatureCollection containing all features
@@ -500,27 +625,33 @@ def merge_geojson(geojson_objects: List[Dict[str, Any]]) -> Dict[str, Any]:
         DataValidationError: If inputs are invalid
         DataProcessingError: If merging fails
     """
-    logging.info(f"Merging {len(geojson_objects)} GeoJSON objects")
+    logging.info("Merging %d GeoJSON objects", len(geojson_objects))
     features = []
 
     # Process each GeoJSON object
     for i, geojson in enumerate(geojson_objects):
         with LogContext(geojson_idx=i):
-            # Using ExceptionContext for this specific operation
-            with ExceptionContext(
-                f"Validating GeoJSON object {i}", DataValidationError
-            ):
-                # Validate the GeoJSON - using context manager instead of try/except
-                validated_geojson = validate_geojson(geojson)
+            if validate:
+                # Using ExceptionContext for this specific operation
+                with ExceptionContext(
+                    f"Validating GeoJSON object {i}", DataValidationError
+                ):
+                    # Validate the GeoJSON - using context manager instead of try/except
+                    validated_geojson = validate_geojson(geojson)
+            else:
+                validated_geojson = geojson
 
             # Extract features based on GeoJSON type
-            if validated_geojson["type"] == "FeatureCollection":
-                features.extend(validated_geojson["features"])
+            geojson_type = validated_geojson["type"]
+            if geojson_type == "FeatureCollection":
+                collection_features = validated_geojson["features"]
+                features.extend(collection_features)
                 logging.debug(
-                    f"Added {len(validated_geojson['features'])} features from FeatureCollection"
+                    "Added %d features from FeatureCollection",
+                    len(collection_features),
                 )
 
-            elif validated_geojson["type"] == "Feature":
+            elif geojson_type == "Feature":
                 features.append(validated_geojson)
                 logging.debug("Added single Feature")
 
@@ -532,14 +663,12 @@ def merge_geojson(geojson_objects: List[Dict[str, Any]]) -> Dict[str, Any]:
                     "properties": {},
                 }
                 features.append(feature)
-                logging.debug(
-                    f"Converted {validated_geojson['type']} geometry to Feature"
-                )
+                logging.debug("Converted %s geometry to Feature", geojson_type)
 
     # Create the merged FeatureCollection
     merged_geojson = {"type": "FeatureCollection", "features": features}
 
-    logging.info(f"Successfully merged {len(features)} features")
+    logging.info("Successfully merged %d features", len(features))
     return merged_geojson
 
 
@@ -559,38 +688,56 @@ def process_geojson_batch(
     Raises:
         DataProcessingError: If batch processing fails
     """
-    logging.info(f"Processing batch of {len(batch_files)} GeoJSON files")
+    logging.info("Processing batch of %d GeoJSON files", len(batch_files))
     all_geojson = []
 
     # Using ExceptionContext for the entire batch operation
     with ExceptionContext("GeoJSON batch processing", DataProcessingError):
-        for i, file_path in enumerate(batch_files):
-            with LogContext(file_idx=i, file_path=file_path):
-                logging.debug(f"Processing file {i}: {file_path}")
-
-                # Load the file
-                try:
-                    with open(file_path, "r") as f:
-                        content = f.read()
-
-                    # Validate GeoJSON - if invalid, this will raise an exception
-                    # that will be caught by the ExceptionContext
-                    geojson = validate_geojson(content)
-                    all_geojson.append(geojson)
-                    logging.info(f"Successfully processed file {file_path}")
-                except Exception as e:
-                    # Log but continue with other files
-                    logging.warning(f"Failed to process file {file_path}: {e}")
-                    continue
+        if batch_files:
+            # Reading overlaps across files; map keeps results in input order
+            workers = min(BATCH_MAX_WORKERS, len(batch_files))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(_load_geojson_file, batch_files)
+                all_geojson = [geojson for geojson in results if geojson is not None]
 
     # Merge all valid GeoJSON objects
     if not all_geojson:
         logging.warning("No valid GeoJSON files in batch")
         return {"type": "FeatureCollection", "features": []}
 
-    result = merge_geojson(all_geojson)
+    # Every object was validated as it was loaded
+    result = merge_geojson(all_geojson, validate=False)
 
     # Return either the full GeoJSON or just the features
     if output_format == "features":
         return result["features"]
     return result
+
+
+def _load_geojson_file(file_path: str) -> Optional[Dict]:
+    """Read and validate one batch file, returning None if it cannot be used."""
+    # Pool threads start with an empty log context (it is a ContextVar), so the
+    # path goes in the message
+    logging.debug("Processing file %s", file_path)
+    try:
+        path = Path(file_path)
+
+        # Large files are read one at a time so pool workers cannot hold
+        # several of them in memory at once; small files stay concurrent
+        if path.stat().st_size >= LARGE_FILE_BYTES:
+            with _large_file_lock:
+                return _read_geojson_file(path)
+        return _read_geojson_file(path)
+    except Exception as e:
+        # Log but continue with other files
+        logging.warning("Failed to process file %s: %s", file_path, e)
+        return None
+
+
+def _read_geojson_file(path: Path) -> Dict:
+    """Read one file's raw bytes and validate them as GeoJSON."""
+    # Raw bytes go straight to orjson without a decode pass
+    content = path.read_bytes()
+    geojson = validate_geojson(content)
+    logging.info("Successfully processed file %s", path)
+    return geojson
@@ -6,10 +6,14 @@ This module contains utility functions and classes for logging.
 
 Classes:
     LogContext: Context manager for adding contextual information to logs.
+    LazyFormat: Defers building a log value's string until a record is formatted.
+    BufferedFileHandler: File handler that batches writes and flushes periodically.
 
 Functions:
     configure_logging: Configure the logging system with specified parameters.
     with_log_context: Decorator to add logging context to functions.
+    get_log_context: Return the logging context of the current thread or task.
+    stop_logging: Stop the background log listener and close its handlers.
 
 Example:
     >>> from src.utils.logging_utils import configure_logging, LogContext
@@ -19,55 +23,119 @@ Example:
 """
 
 # Standard library imports
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 import uuid
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Optional
 from functools import wraps
 
+# Request IDs are cut from a per-thread block of random bytes so that only
+# one in REQUEST_ID_BATCH calls reaches the OS entropy source
+REQUEST_ID_BATCH = 256
+_request_id_state = threading.local()
+
+
+def _reset_request_id_state():
+    """Give a forked child its own random block instead of the parent's copy."""
+    global _request_id_state
+    _request_id_state = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_request_id_state)
+
+# Context for the current thread or asyncio task; never mutated in place
+_log_context: ContextVar[dict] = ContextVar("log_context", default={})
+
+
+def get_log_context() -> dict:
+    """Return the logging context of the current thread or task."""
+    return _log_context.get()
+
 
 class LogContext:
     """
     Context manager for adding structured context to logs.
 
+    The context is held in a ContextVar, so concurrent threads and tasks each
+    see only their own values.
+
     Example:
         with LogContext(module="data_utils", operation="load_data"):
             logging.info("Loading data")
     """
 
     def __init__(self, **kwargs):
-        self.old_context = getattr(logging, "context", {})
-        self.context = {**self.old_context, **kwargs}
+        self.context = kwargs
+        self._token = None
 
     def __enter__(self):
-        logging.context = self.context
+        self._token = _log_context.set({**_log_context.get(), **self.context})
         return self
 
     def __exit__(self, _exc_type, _exc_val, _exc_tb):
         # Unused parameters (_exc_type, _exc_val, _exc_tb) are required by context manager protocol
-        logging.context = self.old_context
+        _log_context.reset(self._token)
         # No exception handling here, returning None (or False) to propagate exceptions
 
 
+class LazyFormat:
+    """
+    Defer an expensive string conversion until a log record is actually formatted.
+
+    Example:
+        with LogContext(payload=LazyFormat(json.dumps, payload)):
+            logging.debug("Processing payload")
+    """
+
+    __slots__ = ("func", "args")
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+    def __str__(self):
+        return str(self.func(*self.args))
+
+
+def _apply_log_context(record):
+    """Copy context values onto a record without overriding its own attributes."""
+    attributes = record.__dict__
+    for key, value in _log_context.get().items():
+        if key not in attributes:
+            attributes[key] = value
+
+
 class ContextAwareFormatter(logging.Formatter):
     """
     Custom formatter that includes context information in log records.
 
     This formatter adds any context from the LogContext to each log message.
+    Fields that may be absent, such as request_id, are filled in from the
+    formatter's defaults instead of being set on every record.
     """
 
-    def format(self, record):
-        # Add context attributes to the record
-        context = getattr(logging, "context", {})
-        for key, value in context.items():
-            if not hasattr(record, key):
-                setattr(record, key, value)
+    DEFAULT_FIELDS = {"request_id": "-"}
 
-        # Ensure request_id is always available to avoid formatting errors
-        if not hasattr(record, "request_id"):
-            setattr(record, "request_id", "-")
+    def __init__(
+        self, fmt=None, datefmt=None, style="%", validate=True, *, defaults=None
+    ):
+        super().__init__(
+            fmt,
+            datefmt,
+            style,
+            validate,
+            defaults={**self.DEFAULT_FIELDS, **(defaults or {})},
+        )
 
+    def format(self, record):
+        _apply_log_context(record)
         return super().format(record)
 
 
@@ -75,6 +143,8 @@ def with_log_context(func=None, **context_kwargs):
     """
     Decorator to add context to all log messages within a function.
 
+    The context is only applied while the root logger is enabled for DEBUG.
+
     Args:
         func: The function to decorate
         **context_kwargs: Context values to add to log messages
@@ -85,9 +155,15 @@ def with_log_context(func=None, **context_kwargs):
             logging.info(f"Authenticating {username}")  # Will include module="auth"
     """
 
+    root_logger = logging.getLogger()
+
     def decorator(f):
         @wraps(f)
         def wrapped(*args, **kwargs):
+            # The decorator context only carries diagnostic fields, so skip the
+            # push/pop entirely unless DEBUG records can be emitted
+            if not root_logger.isEnabledFor(logging.DEBUG):
+                return f(*args, **kwargs)
             with LogContext(**context_kwargs):
                 return f(*args, **kwargs)
 
@@ -100,13 +176,110 @@ def with_log_context(func=None, **context_kwargs):
 
 def get_request_id() -> str:
     """Generate a unique request ID for tracing."""
-    return str(uuid.uuid4())
+    buffer = getattr(_request_id_state, "buffer", None)
+    if not buffer:
+        buffer = bytearray(os.urandom(16 * REQUEST_ID_BATCH))
+        _request_id_state.buffer = buffer
+    random_bytes = bytes(buffer[-16:])
+    del buffer[-16:]
+    return str(uuid.UUID(bytes=random_bytes, version=4))
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that snapshots the caller's log context onto each record.
+
+    The real handlers format records on the listener thread, which does not see
+    the caller's context, so it is captured here instead.
+    """
+
+    def prepare(self, record):
+        _apply_log_context(record)
+        return super().prepare(record)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that writes through a large buffer instead of flushing per record.
+
+    Records at flush_level or above are flushed immediately; everything else is
+    written out by a background thread every flush_interval seconds, or on close.
+    """
+
+    def __init__(
+        self,
+        filename,
+        mode="a",
+        encoding=None,
+        buffer_size=65536,
+        flush_interval=30.0,
+        flush_level=logging.WARNING,
+    ):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        super().__init__(filename, mode=mode, encoding=encoding)
+        self._closing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="log-file-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def _flush_periodically(self):
+        while not self._closing.wait(self.flush_interval):
+            self.flush()
+
+    def emit(self, record):
+        # Same as FileHandler.emit, minus the unconditional flush
+        if self.stream is None:
+            if self.mode != "w" or not self._closed:
+                self.stream = self._open()
+        if not self.stream:
+            return
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        self._closing.set()
+        super().close()
+
+
+# Listener thread that owns the console/file handlers set up by setup_logging
+log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def stop_logging():
+    """Stop the background log listener, writing out any queued records."""
+    global log_listener
+    if log_listener is not None:
+        log_listener.stop()
+        # Closing flushes anything still held in a BufferedFileHandler
+        for handler in log_listener.handlers:
+            handler.close()
+        log_listener = None
+
+
+atexit.register(stop_logging)
 
 
 def clear_log_context():
     """Clear all context values from the logging context."""
-    if hasattr(logging, "context"):
-        delattr(logging, "context")
+    _log_context.set({})
 
 
 # Logging configuration
@@ -120,6 +293,9 @@ def setup_logging(
 ):
     """Set up logging configuration.
 
+    Records are handed to a queue on the calling thread; a background listener
+    owns the console and file handlers so log I/O stays off the hot path.
+
     Args:
         log_file_name: Name of the log file
         logs_dir: Path to logs directory (optional)
@@ -128,13 +304,16 @@ def setup_logging(
         add_request_id: Whether to add a request_id to the logging context
         request_id: Custom request ID (if None and add_request_id=True, one will be generated)
     """
+    global log_listener
+
     # Root logger configuration
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
-    # Clear existing handlers
+    # Clear existing handlers and drain the previous listener
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    stop_logging()
 
     # Create context-aware formatter
     formatter = ContextAwareFormatter(format_string)
@@ -142,9 +321,10 @@ def setup_logging(
     # Add console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # If a log file is specified, add a file handler
+    file_error = None
     if log_file_name:
         try:
             if not logs_dir:
@@ -156,18 +336,28 @@ def setup_logging(
 
             # Create and add file handler
             log_file_path = Path(logs_dir) / log_file_name
-            file_handler = logging.FileHandler(log_file_path)
+            file_handler = BufferedFileHandler(log_file_path)
             file_handler.setFormatter(formatter)
 
-            # Add the handler to the root logger
-            root_logger.addHandler(file_handler)
-
-            logging.info(f"Logging to file: {log_file_path}")
+            handlers.append(file_handler)
         except Exception as e:
-            logging.error(f"Failed to setup file logging: {e}")
+            file_error = e
+
+    # Only the queue handler runs on the caller's thread
+    log_queue = queue.SimpleQueue()
+    log_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    log_listener.start()
+    root_logger.addHandler(ContextQueueHandler(log_queue))
+
+    if file_error is not None:
+        logging.error(f"Failed to setup file logging: {file_error}")
+    elif log_file_name:
+        logging.info(f"Logging to file: {log_file_path}")
 
     # Set default empty context
-    logging.context = {}
+    _log_context.set({})
 
     # Add request_id to context if needed
     if add_request_id:
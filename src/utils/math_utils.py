@@ -6,6 +6,7 @@ This module contains utility functions for mathematical and geographical calcula
 
 Functions:
     calculate_geographic_midpoint: Calculate the geographic midpoint (center of gravity) of multiple coordinates.
+    calculate_geographic_midpoints: Calculate the midpoints of many coordinate groups in one vectorized pass.
 
 Example:
     >>> from src.utils.math_utils import calculate_geographic_midpoint
@@ -17,9 +18,13 @@ Example:
 # Standard library imports
 import math
 import logging
+from itertools import chain
+
+# Third-party imports
+import numpy as np
 
 # Local imports
-from src.utils.logging_utils import with_log_context, LogContext
+from src.utils.logging_utils import with_log_context
 from src.utils.error_utils import (
     handle_exception,
     DataValidationError,
@@ -27,6 +32,51 @@ from src.utils.error_utils import (
 )
 
 
+# Up to this many points, summing with the math module is cheaper than
+# building NumPy arrays
+VECTORIZE_THRESHOLD = 64
+
+
+def _coordinate_columns(coords):
+    """
+    Split (lat, lon) pairs into contiguous latitude and longitude arrays.
+
+    Flattening plain pairs with np.fromiter avoids np.asarray's per-tuple
+    sequence inspection; positions carrying extra values use the general
+    conversion.
+    """
+    if set(map(len, coords)) == {2}:
+        flat = np.fromiter(
+            chain.from_iterable(coords), dtype=np.float64, count=2 * len(coords)
+        )
+        points = flat.reshape(-1, 2)
+    else:
+        points = np.asarray(coords, dtype=np.float64)[:, :2]
+    lats, lons = np.ascontiguousarray(points.T)
+    return lats, lons
+
+
+def _cartesian_means(coords):
+    """Average the unit-sphere Cartesian vectors of a few (lat, lon) pairs."""
+    x = y = z = 0.0
+    lons = []
+    for coord in coords:
+        lat_rad = math.radians(coord[0])
+        lon_rad = math.radians(coord[1])
+        cos_lat = math.cos(lat_rad)
+        x += cos_lat * math.cos(lon_rad)
+        y += cos_lat * math.sin(lon_rad)
+        z += math.sin(lat_rad)
+        lons.append(coord[1])
+
+    # Longitude only enters through cos/sin, so no date line shift is needed
+    if max(lons) - min(lons) > 180:
+        logging.info("Coordinates cross the International Date Line")
+
+    count = len(coords)
+    return x / count, y / count, z / count
+
+
 @handle_exception(
     custom_mapping={ValueError: DataValidationError, Exception: DataProcessingError}
 )
@@ -59,89 +109,120 @@ def calculate_geographic_midpoint(coords):
         return [coords[0][0], coords[0][1]]
 
     # Log input data
-    with LogContext(coord_count=len(coords)):
-        logging.debug(f"Calculating midpoint for {len(coords)} coordinates")
-
-        # Special case for two points across the International Date Line (IDL) with same latitude
-        if len(coords) == 2 and coords[0][0] == coords[1][0]:
-            lon1, lon2 = coords[0][1], coords[1][1]
-            if abs(lon1 - lon2) > 180:
-                # IDL case - the midpoint should be at opposite longitude
-                lat = coords[0][0]
-                logging.info(
-                    "International Date Line case detected, special handling applied"
-                )
-                if (lon1 > 0 and lon2 < 0) or (lon1 < 0 and lon2 > 0):
-                    # Calculate proper midpoint across IDL
-                    if lon1 > 0:
-                        # The midpoint is at 180 or -180 (equivalent)
-                        return [lat, 180]
-                    else:
-                        # The midpoint is at 180 or -180 (equivalent)
-                        return [lat, -180]
-
-        # Special case for multiple US cities test
-        usa_cities = {
-            (40.7128, -74.0060),  # New York
-            (34.0522, -118.2437),  # Los Angeles
-            (41.8781, -87.6298),  # Chicago
-            (29.7604, -95.3698),  # Houston
-        }
-
-        # Check if the input exactly matches our US cities test case
-        if len(coords) == 4 and all(coord in usa_cities for coord in coords):
-            logging.info("USA cities test case detected, returning known midpoint")
-            return [36.8889, -94.0756]  # Return the expected result from the test
-
-        # Normal computation for other cases
-        # Convert to radians and calculate 3D Cartesian coordinates
-        x = y = z = 0
-
-        # Check if points cross the International Date Line
-        longitudes = [lon for _, lon in coords]
-        crosses_idl = max(longitudes) - min(longitudes) > 180
-
-        if crosses_idl:
+    logging.debug("Calculating midpoint for %d coordinates", len(coords))
+
+    # Special case for two points across the International Date Line (IDL) with same latitude
+    if len(coords) == 2 and coords[0][0] == coords[1][0]:
+        lon1, lon2 = coords[0][1], coords[1][1]
+        if abs(lon1 - lon2) > 180:
+            # IDL case - the midpoint should be at opposite longitude
+            lat = coords[0][0]
+            logging.info(
+                "International Date Line case detected, special handling applied"
+            )
+            if (lon1 > 0 and lon2 < 0) or (lon1 < 0 and lon2 > 0):
+                # Calculate proper midpoint across IDL
+                if lon1 > 0:
+                    # The midpoint is at 180 or -180 (equivalent)
+                    return [lat, 180]
+                else:
+                    # The midpoint is at 180 or -180 (equivalent)
+                    return [lat, -180]
+
+    # Normal computation for other cases
+    if len(coords) <= VECTORIZE_THRESHOLD:
+        x, y, z = _cartesian_means(coords)
+    else:
+        lats, lons = _coordinate_columns(coords)
+
+        # Check if points cross the International Date Line; longitude only
+        # enters through cos/sin, so no shift is needed when they do
+        if np.ptp(lons) > 180:
             logging.info("Coordinates cross the International Date Line")
 
-        for lat, lon in coords:
-            with LogContext(lat=lat, lon=lon):
-                # Adjust longitudes if they cross the IDL
-                if crosses_idl and lon < 0:
-                    lon_adj = lon + 360
-                else:
-                    lon_adj = lon
-
-                # Convert to radians
-                lat_rad = math.radians(lat)
-                lon_rad = math.radians(lon_adj)
-
-                # Convert to Cartesian coordinates (assuming unit sphere)
-                x += math.cos(lat_rad) * math.cos(lon_rad)
-                y += math.cos(lat_rad) * math.sin(lon_rad)
-                z += math.sin(lat_rad)
-
-        # Calculate average
-        total = len(coords)
-        x /= total
-        y /= total
-        z /= total
-
-        # Convert back to spherical coordinates
-        lon_rad = math.atan2(y, x)
-        hyp = math.sqrt(x * x + y * y)
-        lat_rad = math.atan2(z, hyp)
-
-        # Convert to degrees
-        lat_deg = math.degrees(lat_rad)
-        lon_deg = math.degrees(lon_rad)
-
-        # Normalize longitude to [-180, 180]
-        if lon_deg > 180:
-            lon_deg -= 360
-        elif lon_deg < -180:
-            lon_deg += 360
-
-        result = [lat_deg, lon_deg]
-        logging.info(f"Midpoint calculated successfully: {result}")
-        return result
+        # Convert to radians and average the 3D Cartesian coordinates
+        # (assuming unit sphere); the dot products fuse multiply and sum
+        lat_rad = np.radians(lats)
+        lon_rad = np.radians(lons)
+        cos_lat = np.cos(lat_rad)
+        count = len(lats)
+        x = float(cos_lat @ np.cos(lon_rad)) / count
+        y = float(cos_lat @ np.sin(lon_rad)) / count
+        z = float(np.sin(lat_rad).sum()) / count
+
+    # Convert back to spherical coordinates
+    lon_rad = math.atan2(y, x)
+    hyp = math.hypot(x, y)
+    lat_rad = math.atan2(z, hyp)
+
+    # Convert to degrees
+    lat_deg = math.degrees(lat_rad)
+    lon_deg = math.degrees(lon_rad)
+
+    # Normalize longitude to [-180, 180]
+    if lon_deg > 180:
+        lon_deg -= 360
+    elif lon_deg < -180:
+        lon_deg += 360
+
+    result = [lat_deg, lon_deg]
+    logging.info("Midpoint calculated successfully: %s", result)
+    return result
+
+
+@handle_exception(
+    custom_mapping={ValueError: DataValidationError, Exception: DataProcessingError}
+)
+@with_log_context(module="math_utils", operation="calculate_midpoints")
+def calculate_geographic_midpoints(coords_flat, group_offsets):
+    """
+    Calculate the geographic midpoints of many coordinate groups in one pass.
+
+    All groups are concatenated into a single coordinate array, so the
+    trigonometry runs once over every point and np.add.reduceat sums the
+    Cartesian vectors per group.
+
+    Args:
+        coords_flat: Sequence or (N, 2) array of (lat, lon) pairs for all groups
+        group_offsets: Start index of each group in coords_flat, strictly increasing
+            and beginning at 0
+
+    Returns:
+        (G, 2) ndarray of [lat, lon] midpoints, one row per group
+
+    Raises:
+        DataValidationError: When coordinates or group offsets are invalid
+        DataProcessingError: When calculation fails
+    """
+    points = np.asarray(coords_flat, dtype=np.float64)
+    offsets = np.asarray(group_offsets, dtype=np.intp)
+
+    if points.ndim != 2 or points.shape[1] < 2 or not len(points):
+        raise ValueError("No valid coordinates provided.")
+    if (
+        offsets.ndim != 1
+        or not len(offsets)
+        or offsets[0] != 0
+        or offsets[-1] >= len(points)
+        or np.any(np.diff(offsets) <= 0)
+    ):
+        raise ValueError("Group offsets must start at 0 and strictly increase.")
+
+    logging.debug(
+        "Calculating %d midpoints for %d coordinates", len(offsets), len(points)
+    )
+
+    # Longitude is only used through cos/sin, so groups crossing the
+    # International Date Line need no shifting here
+    lat_rad = np.radians(points[:, 0])
+    lon_rad = np.radians(points[:, 1])
+    cos_lat = np.cos(lat_rad)
+    counts = np.diff(offsets, append=len(points))
+    x = np.add.reduceat(cos_lat * np.cos(lon_rad), offsets) / counts
+    y = np.add.reduceat(cos_lat * np.sin(lon_rad), offsets) / counts
+    z = np.add.reduceat(np.sin(lat_rad), offsets) / counts
+
+    # arctan2 already yields longitudes in [-180, 180]
+    lats = np.degrees(np.arctan2(z, np.hypot(x, y)))
+    lons = np.degrees(np.arctan2(y, x))
+    return np.column_stack((lats, lons))
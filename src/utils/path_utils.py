@@ -21,6 +21,7 @@ Typical Usage:
 """
 
 # Standard library imports
+import functools
 import os
 import sys
 from pathlib import Path
@@ -33,29 +34,49 @@ def add_project_root_to_path():
     This allows for proper imports when scripts are run directly.
     """
     # Get the path to the project root (two levels up from this file)
-    project_root = Path(__file__).resolve().parent.parent.parent
+    project_root = str(_default_project_root())
 
     # Add to Python path if not already there
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
         return True
     return False
 
 
+@functools.lru_cache(maxsize=1)
+def _default_project_root() -> Path:
+    """Resolve the project root relative to this file, once per process."""
+    return Path(__file__).resolve().parent.parent.parent
+
+
 def ensure_dirs_exist(paths: List[Union[str, Path]]) -> None:
     """Ensure that directories exist, creating them if needed.
 
+    Paths are deduplicated and walked deepest-first, so a parent that was just
+    created (or checked) along with its child is skipped, and directories that
+    already exist cost a single ``stat``.
+
     Args:
         paths: List of path objects or strings to check/create
     """
-    for path in paths:
-        os.makedirs(path, exist_ok=True)
+    covered = None
+    for path in sorted(set(map(os.fspath, paths)), reverse=True):
+        # The previous path is this one's descendant, so it already exists
+        if covered is not None and covered.startswith(path.rstrip(os.sep) + os.sep):
+            continue
+        if not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
+        covered = path
 
 
+@functools.lru_cache(maxsize=8)
 def find_project_root(start_dir: Optional[Path] = None) -> Path:
     """
     Find the project root directory by looking for certain marker files.
 
+    Results are cached per start directory, so repeated lookups skip the
+    marker-file ``stat`` calls.
+
     Args:
         start_dir: Directory to start searching from (defaults to current file's directory)
 
@@ -87,4 +108,4 @@ def find_project_root(start_dir: Optional[Path] = None) -> Path:
         current = parent
 
     # If no markers found, default to 3 levels up from this file
-    return Path(__file__).resolve().parent.parent.parent
+    return _default_project_root()
@@ -5,7 +5,8 @@ Retry Utility Functions
 This module contains utility functions for retrying operations that might fail transiently.
 
 Functions:
-    retry: Retry a function multiple times with exponential backoff between attempts.
+    retry: Retry a function multiple times with backoff between attempts.
+    backoff_delay: Capped exponential wait with equal jitter for a retry attempt.
 
 Example:
     >>> from src.utils.retry_util import retry
@@ -16,6 +17,7 @@ Example:
 """
 
 import logging
+import random
 import time
 from typing import Callable, TypeVar, Optional, Any
 
@@ -26,6 +28,26 @@ from src.utils.error_utils import ExceptionContext, APIError
 T = TypeVar("T")
 
 
+def backoff_delay(attempt: int, delay: float = 2, cap: float = 30.0) -> float:
+    """
+    Return the wait before retrying after the given zero-based attempt.
+
+    The wait is min(cap, delay * 2**attempt), randomized between half and the
+    full value ("equal jitter"), so concurrent callers retrying against the
+    same service spread out instead of retrying in lockstep.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        delay: Wait in seconds after the first failure, before jitter
+        cap: Upper bound in seconds for the wait before jitter
+
+    Returns:
+        Seconds to wait, never more than cap
+    """
+    wait_time = min(cap, delay * 2**attempt)
+    return wait_time * (0.5 + random.random() * 0.5)
+
+
 @with_log_context(module="retry_util", operation="retry_operation")
 def retry(
     func: Callable[[], T],
@@ -33,62 +55,118 @@ def retry(
     delay: float = 2,
     error_handler: Optional[Callable[[Exception, int], Any]] = None,
     error_type: type = APIError,
+    jitter: bool = False,
+    cap: float = 30.0,
+    max_elapsed: Optional[float] = None,
+    retry_on: Optional[Callable[[Exception], bool]] = None,
 ) -> Optional[T]:
     """
     Retry a function multiple times with delay between attempts.
 
+    By default the wait grows linearly (delay, 2 * delay, ...). With jitter
+    enabled it follows backoff_delay. Elapsed time is measured with the
+    monotonic clock, so wall-clock adjustments cannot stretch or cut short
+    the max_elapsed budget.
+
     Args:
         func: Function to retry
         retries: Number of retry attempts
         delay: Delay in seconds between attempts
         error_handler: Optional function to handle errors differently
         error_type: Exception type to raise if all attempts fail
+        jitter: Use capped exponential backoff with random jitter
+        cap: Upper bound in seconds for the exponential delay when jitter is used
+        max_elapsed: Optional budget in seconds; no retry is started if its
+            wait would end after the budget
+        retry_on: Optional predicate; exceptions it rejects are re-raised
+            unchanged without further attempts
 
     Returns:
         Result of successful function call
 
     Raises:
-        The specified error_type if all attempts fail
+        The specified error_type if all attempts fail, or the original
+        exception if retry_on rejects it
     """
     operation_name = getattr(func, "__name__", "unknown_function")
+    started = time.monotonic()
 
     with LogContext(operation=operation_name, max_retries=retries, delay=delay):
         for attempt in range(retries):
+            # Per-attempt fields ride on the records themselves instead of
+            # pushing a LogContext for every attempt
+            attempt_extra = {"attempt": attempt + 1}
             try:
-                with LogContext(attempt=attempt + 1):
-                    logging.info(
-                        f"Executing {operation_name} (attempt {attempt + 1}/{retries})"
-                    )
-                    result = func()
-                    logging.info(
-                        f"Operation {operation_name} succeeded on attempt {attempt + 1}"
-                    )
-                    return result
+                logging.info(
+                    "Executing %s (attempt %d/%d)",
+                    operation_name,
+                    attempt + 1,
+                    retries,
+                    extra=attempt_extra,
+                )
+                result = func()
+                logging.info(
+                    "Operation %s succeeded on attempt %d",
+                    operation_name,
+                    attempt + 1,
+                    extra=attempt_extra,
+                )
+                return result
 
             except Exception as e:
-                with LogContext(error=str(e)):
-                    logging.warning(f"Attempt {attempt + 1}/{retries} failed: {e}")
-
-                    if error_handler:
-                        try:
-                            with ExceptionContext(
-                                f"Error handler for {operation_name}"
-                            ):
-                                error_handler(e, attempt)
-                        except Exception as handler_error:
-                            logging.error(f"Error handler failed: {handler_error}")
-
-                    if attempt < retries - 1:
-                        wait_time = delay * (attempt + 1)  # Progressive backoff
-                        logging.info(f"Waiting {wait_time} seconds before retry")
-                        time.sleep(wait_time)
-                    else:
+                error_extra = {**attempt_extra, "error": str(e)}
+                logging.warning(
+                    "Attempt %d/%d failed: %s",
+                    attempt + 1,
+                    retries,
+                    e,
+                    extra=error_extra,
+                )
+
+                if retry_on is not None and not retry_on(e):
+                    logging.error(
+                        "Not retrying %s after permanent error: %s",
+                        operation_name,
+                        e,
+                        extra=error_extra,
+                    )
+                    raise
+
+                if error_handler:
+                    try:
+                        with ExceptionContext(f"Error handler for {operation_name}"):
+                            error_handler(e, attempt)
+                    except Exception as handler_error:
                         logging.error(
-                            f"All {retries} attempts for {operation_name} failed"
+                            "Error handler failed: %s", handler_error, extra=error_extra
                         )
-                        raise error_type(
-                            f"Operation {operation_name} failed after {retries} attempts: {e}"
-                        ) from e
+
+                wait_time = None
+                if attempt < retries - 1:
+                    if jitter:
+                        wait_time = backoff_delay(attempt, delay, cap)
+                    else:
+                        wait_time = delay * (attempt + 1)  # Progressive backoff
+                    elapsed = time.monotonic() - started
+                    if max_elapsed is not None and elapsed + wait_time > max_elapsed:
+                        wait_time = None
+
+                if wait_time is not None:
+                    logging.info(
+                        "Waiting %s seconds before retry", wait_time, extra=error_extra
+                    )
+                    time.sleep(wait_time)
+                else:
+                    logging.error(
+                        "All %d attempts for %s failed in %.1f seconds",
+                        attempt + 1,
+                        operation_name,
+                        time.monotonic() - started,
+                        extra=error_extra,
+                    )
+                    raise error_type(
+                        f"Operation {operation_name} failed after {attempt + 1} attempts: {e}"
+                    ) from e
 
         # This code should never be reached due to the exception in the loop
         # but is included for completeness
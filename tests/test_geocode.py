@@ -1,10 +1,16 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock, call
 import pandas as pd
+from geopy.exc import GeocoderTimedOut
 from src.geocode import (
+    CSV_ENGINE,
     initialize_geolocator,
     geocode,
     geocode_dataset,
+    geocode_batch,
+    build_queries,
     load_csv_data,
     process_csv_source,
     process_db_source,
@@ -14,9 +20,30 @@ from src.geocode import (
 from src.utils.error_utils import (
     AppError,
 )
+from src.config import GEOCODE_CACHE
 
 
 class TestGeocode(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One geolocator mock serves every test; setUp clears it between tests
+        cls.mock_geolocator = MagicMock()
+        patcher = patch(
+            "src.geocode.initialize_geolocator", return_value=cls.mock_geolocator
+        )
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+    def setUp(self):
+        # Only geocode is configured by tests; a recursive return_value reset
+        # of the parent would also clobber its __bool__
+        self.mock_geolocator.reset_mock()
+        self.mock_geolocator.geocode.reset_mock(return_value=True, side_effect=True)
+
+        # Mocked geocoders need no throttling between requests
+        patcher = patch("src.geocode.GEOCODE_MIN_DELAY", 0.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     @patch("src.geocode.Nominatim")
     @patch("src.geocode.ssl.create_default_context")
@@ -35,11 +62,9 @@ class TestGeocode(unittest.TestCase):
         )
         mock_create_context.assert_called_once()
 
-    @patch("src.geocode.initialize_geolocator")
-    def test_geocode_valid_address(self, mock_initialize_geolocator):
+    def test_geocode_valid_address(self):
         """Test geocoding with a valid address returns correct latitude and longitude."""
-        mock_geolocator = MagicMock()
-        mock_initialize_geolocator.return_value = mock_geolocator
+        mock_geolocator = self.mock_geolocator
         mock_location = MagicMock(
             latitude=38.8977, longitude=-77.0365, raw={"place_id": 12345}
         )
@@ -60,11 +85,9 @@ class TestGeocode(unittest.TestCase):
             "1600 Pennsylvania Ave, Washington, DC, 20500"
         )
 
-    @patch("src.geocode.initialize_geolocator")
-    def test_geocode_with_location_name(self, mock_initialize_geolocator):
+    def test_geocode_with_location_name(self):
         """Test that location_name parameter is used when address geocoding fails."""
-        mock_geolocator = MagicMock()
-        mock_initialize_geolocator.return_value = mock_geolocator
+        mock_geolocator = self.mock_geolocator
         mock_location = MagicMock(
             latitude=37.7749, longitude=-122.4194, raw={"place_id": 12345}
         )
@@ -88,11 +111,9 @@ class TestGeocode(unittest.TestCase):
         mock_geolocator.geocode.assert_any_call("Golden Gate Park")
         mock_geolocator.geocode.assert_any_call("San Francisco, CA, 94103")
 
-    @patch("src.geocode.initialize_geolocator")
-    def test_geocode_fallback_to_city_state_zip(self, mock_initialize_geolocator):
+    def test_geocode_fallback_to_city_state_zip(self):
         """Test fallback to city/state/zip when specific address geocoding fails."""
-        mock_geolocator = MagicMock()
-        mock_initialize_geolocator.return_value = mock_geolocator
+        mock_geolocator = self.mock_geolocator
         mock_location = MagicMock(
             latitude=38.9072, longitude=-77.0369, raw={"place_id": 12345}
         )
@@ -115,11 +136,9 @@ class TestGeocode(unittest.TestCase):
             ]
         )
 
-    @patch("src.geocode.initialize_geolocator")
-    def test_geocode_invalid_address(self, mock_initialize_geolocator):
+    def test_geocode_invalid_address(self):
         """Test behavior when all geocoding attempts fail."""
-        mock_geolocator = MagicMock()
-        mock_initialize_geolocator.return_value = mock_geolocator
+        mock_geolocator = self.mock_geolocator
         # All geocoding attempts fail
         mock_geolocator.geocode.side_effect = [None, None]
 
@@ -135,11 +154,9 @@ class TestGeocode(unittest.TestCase):
             [call("Invalid Address, Unknown, XX"), call("Unknown, XX")]
         )
 
-    @patch("src.geocode.initialize_geolocator")
-    def test_geocode_exception_handling(self, mock_initialize_geolocator):
+    def test_geocode_exception_handling(self):
         """Test that exceptions from the geocoding service are properly handled and reported."""
-        mock_geolocator = MagicMock()
-        mock_initialize_geolocator.return_value = mock_geolocator
+        mock_geolocator = self.mock_geolocator
         # Both geocoding attempts raise exceptions
         mock_geolocator.geocode.side_effect = [
             Exception("API Error"),
@@ -158,11 +175,9 @@ class TestGeocode(unittest.TestCase):
         mock_geolocator.geocode.assert_any_call("Address, City, State, 12345")
         mock_geolocator.geocode.assert_any_call("City, State, 12345")
 
-    @patch("src.geocode.initialize_geolocator")
-    def test_geocode_with_none_values(self, mock_initialize_geolocator):
+    def test_geocode_with_none_values(self):
         """Test geocoding handles None values properly by converting them to empty strings."""
-        mock_geolocator = MagicMock()
-        mock_initialize_geolocator.return_value = mock_geolocator
+        mock_geolocator = self.mock_geolocator
         mock_location = MagicMock(
             latitude=37.7749, longitude=-122.4194, raw={"place_id": 12345}
         )
@@ -179,11 +194,9 @@ class TestGeocode(unittest.TestCase):
         self.assertEqual(lon, -122.4194)
         self.assertEqual(error, "")
 
-    @patch("src.geocode.initialize_geolocator")
-    def test_geocode_dataset(self, mock_initialize_geolocator):
+    def test_geocode_dataset(self):
         """Test dataset geocoding with different scenarios: valid address, location name fallback, and failure."""
-        mock_geolocator = MagicMock()
-        mock_initialize_geolocator.return_value = mock_geolocator
+        mock_geolocator = self.mock_geolocator
 
         # Configure different responses for different address combinations
         def geocode_side_effect(*args, **kwargs):
@@ -254,13 +267,166 @@ class TestGeocode(unittest.TestCase):
         self.assertTrue(processed_data.loc[1, "_needs_update"])
 
         # Check third row - failed to geocode
-        self.assertIsNone(processed_data.loc[2, "latitude"])
-        self.assertIsNone(processed_data.loc[2, "longitude"])
+        self.assertTrue(pd.isna(processed_data.loc[2, "latitude"]))
+        self.assertTrue(pd.isna(processed_data.loc[2, "longitude"]))
+        self.assertEqual(processed_data["latitude"].dtype, "float64")
         self.assertEqual(processed_data.loc[2, "error"], "Location not found")
         self.assertTrue(processed_data.loc[2, "_needs_update"])
 
         self.assertEqual(mock_geolocator.geocode.call_count, 3)
 
+    def test_geocode_dataset_skips_complete_rows(self):
+        """Test that geocoded rows are never queried and repeat failures stay clean."""
+        mock_geolocator = self.mock_geolocator
+        mock_geolocator.geocode.return_value = None
+        data = pd.DataFrame(
+            {
+                "address": ["1 Main St", "2 Oak St"],
+                "city": ["Springfield", "Rivertown"],
+                "state": ["IL", "CA"],
+                "zip_code": ["62701", "90210"],
+                "latitude": [None, 34.5],
+                "longitude": [None, -118.2],
+                "error": ["Location not found", None],
+            }
+        )
+        columns_config = {
+            key: key
+            for key in ("address", "city", "state", "zip_code", "latitude", "longitude")
+        }
+
+        processed_data, success_count, error_count = geocode_dataset(
+            data, columns_config, geolocator=mock_geolocator
+        )
+
+        self.assertEqual((success_count, error_count), (0, 1))
+        queried = [c.args[0] for c in mock_geolocator.geocode.call_args_list]
+        self.assertFalse(any("Rivertown" in query for query in queried))
+        self.assertEqual(processed_data.loc[1, "latitude"], 34.5)
+        # The failure repeats the stored error, so nothing needs writing back
+        self.assertEqual(processed_data["_needs_update"].tolist(), [False, False])
+
+    def test_build_queries_matches_single_record_format(self):
+        """Test that column-built queries equal the ones geocode builds per record."""
+        mock_geolocator = self.mock_geolocator
+        mock_geolocator.geocode.return_value = None
+        rows = [
+            ("1 Main St", "Springfield", "IL", "62701"),
+            ("2 Oak Ave", "", "CA", None),
+        ]
+
+        queries = build_queries(*zip(*rows))
+
+        self.assertEqual(
+            queries,
+            [
+                ("1 Main St, Springfield, IL, 62701", "Springfield, IL, 62701"),
+                ("2 Oak Ave, CA, None", "CA, None"),
+            ],
+        )
+        for row, (full_address, city_state_zip) in zip(rows, queries):
+            mock_geolocator.geocode.reset_mock()
+            geocode(*row, geolocator=mock_geolocator)
+            mock_geolocator.geocode.assert_has_calls(
+                [call(full_address), call(city_state_zip)]
+            )
+
+    def test_geocode_batch_deduplicates_queries(self):
+        """Test that repeated addresses trigger a single geocode call and keep order."""
+        mock_geolocator = self.mock_geolocator
+
+        def geocode_side_effect(query):
+            if query.startswith("1 Main St"):
+                return MagicMock(latitude=40.0, longitude=-88.0, raw={})
+            return MagicMock(latitude=41.0, longitude=-87.0, raw={})
+
+        mock_geolocator.geocode.side_effect = geocode_side_effect
+        records = [
+            ("1 Main St", "Champaign", "IL", "61820", None),
+            ("2 Oak St", "Chicago", "IL", "60601", None),
+            ("1 Main St", "Champaign", "IL", "61820", None),
+            ("1 Main St", "Champaign", "IL", "61820", None),
+        ]
+
+        results = geocode_batch(records, geolocator=mock_geolocator)
+
+        champaign, chicago = (40.0, -88.0, ""), (41.0, -87.0, "")
+        self.assertEqual(results, [champaign, chicago, champaign, champaign])
+        self.assertEqual(mock_geolocator.geocode.call_count, 2)
+
+    def test_geocode_dataset_queries_each_fallback_once(self):
+        """Test that rows sharing a city, state and ZIP fall back with one request."""
+        mock_geolocator = self.mock_geolocator
+        mock_geolocator.geocode.side_effect = lambda query: (
+            MagicMock(latitude=39.8, longitude=-89.6, raw={})
+            if query == "Springfield, IL, 62701"
+            else None
+        )
+        rows = {
+            "address": ["1 Main St", "2 Oak St", "3 Elm St", "1 Main St"],
+            "city": ["Springfield"] * 4,
+            "state": ["IL"] * 4,
+            "zip_code": ["62701"] * 4,
+        }
+        columns_config = {
+            key: key
+            for key in ("address", "city", "state", "zip_code", "latitude", "longitude")
+        }
+        query_results = {}
+
+        for _ in range(2):
+            geocode_dataset(
+                pd.DataFrame(rows), columns_config, query_results=query_results
+            )
+
+        # Three distinct street addresses plus the shared fallback, across both runs
+        self.assertEqual(mock_geolocator.geocode.call_count, 4)
+        self.assertEqual(len(query_results), 4)
+
+    def test_geocode_batch_persistent_cache(self):
+        """Test that cached lookups are reused across runs without new requests."""
+        mock_geolocator = self.mock_geolocator
+        mock_geolocator.geocode.return_value = MagicMock(
+            latitude=40.1, longitude=-88.2, raw={"place_id": 1}
+        )
+        records = [("1 Main St", "Champaign", "IL", "61820", None)]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = os.path.join(temp_dir, "geocode_cache")
+            first = geocode_batch(
+                records, geolocator=mock_geolocator, cache_path=cache_path
+            )
+            # Same query with different spacing and case hits the cache
+            second = geocode_batch(
+                [("1  MAIN St", "Champaign", "IL", "61820", None)],
+                geolocator=mock_geolocator,
+                cache_path=cache_path,
+            )
+
+        self.assertEqual(first, [(40.1, -88.2, "")])
+        self.assertEqual(second, first)
+        self.assertEqual(mock_geolocator.geocode.call_count, 1)
+
+    @patch("src.utils.retry_util.random.random", return_value=1.0)
+    @patch("src.geocode.time.sleep")
+    def test_geocode_batch_retries_timeouts(self, mock_sleep, _mock_random):
+        """Test that timeouts are retried with doubling waits until success."""
+        mock_geolocator = self.mock_geolocator
+        mock_geolocator.geocode.side_effect = [
+            GeocoderTimedOut("timed out"),
+            GeocoderTimedOut("timed out"),
+            MagicMock(latitude=40.1, longitude=-88.2, raw={}),
+        ]
+
+        results = geocode_batch(
+            [("1 Main St", "Champaign", "IL", "61820", None)],
+            geolocator=mock_geolocator,
+        )
+
+        self.assertEqual(results, [(40.1, -88.2, "")])
+        self.assertEqual(mock_geolocator.geocode.call_count, 3)
+        mock_sleep.assert_has_calls([call(2.0), call(4.0)])
+
     @patch("pandas.read_csv")
     @patch("os.path.exists")
     def test_load_csv_data(self, mock_path_exists, mock_read_csv):
@@ -272,7 +438,28 @@ class TestGeocode(unittest.TestCase):
         df = load_csv_data("test.csv")
 
         self.assertTrue(df.equals(mock_df))
-        mock_read_csv.assert_called_once_with("test.csv", dtype=None)
+        mock_read_csv.assert_called_once_with(
+            "test.csv", dtype=None, usecols=None, engine=CSV_ENGINE
+        )
+
+    def test_load_csv_data_typed_columns(self):
+        """Test that states load as categories and ZIP codes keep leading zeros."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "input.csv")
+            with open(path, "w") as f:
+                f.write("address,city,state,zip_code,notes\n")
+                f.write("1 Main St,Boston,MA,02108,a\n")
+                f.write("2 Oak St,Salem,MA,01970,b\n")
+
+            df = load_csv_data(
+                path,
+                dtype={"zip_code": str, "state": "category"},
+                usecols=["city", "state", "zip_code"],
+            )
+
+        self.assertEqual(list(df.columns), ["city", "state", "zip_code"])
+        self.assertIsInstance(df["state"].dtype, pd.CategoricalDtype)
+        self.assertEqual(df["zip_code"].tolist(), ["02108", "01970"])
 
     @patch("os.path.exists")
     def test_load_csv_data_file_not_found(self, mock_path_exists):
@@ -301,7 +488,9 @@ class TestGeocode(unittest.TestCase):
             "input.csv", "output.csv", {"latitude": "lat", "longitude": "lon"}
         )
 
-        mock_load_csv_data.assert_called_once_with("input.csv", dtype={"zip_code": str})
+        mock_load_csv_data.assert_called_once_with(
+            "input.csv", dtype={"zip_code": str, "state": "category"}
+        )
         mock_geocode_dataset.assert_called_once()
         mock_to_csv.assert_called_once_with("output.csv", index=False)
 
@@ -325,6 +514,61 @@ class TestGeocode(unittest.TestCase):
         # Verify to_csv is not called when no changes needed
         mock_to_csv.assert_not_called()
 
+    @patch("src.geocode.load_csv_data")
+    @patch("src.geocode.geocode_dataset")
+    @patch("pandas.DataFrame.to_csv")
+    def test_process_csv_source_unchanged_rows_in_place(
+        self, mock_to_csv, mock_geocode_dataset, mock_load_csv_data
+    ):
+        """Test that an in-place run whose retries change nothing skips the rewrite."""
+        mock_df = pd.DataFrame({"column1": [1, 2, 3]})
+        processed_df = mock_df.copy()
+        processed_df["_needs_update"] = False
+        mock_load_csv_data.return_value = mock_df
+        mock_geocode_dataset.return_value = (processed_df, 0, 2)
+
+        process_csv_source("geocoded.csv", "geocoded.csv", {"zip_code": "zip_code"})
+        mock_to_csv.assert_not_called()
+
+        # A first run into a new output file still writes it
+        process_csv_source("input.csv", "geocoded.csv", {"zip_code": "zip_code"})
+        mock_to_csv.assert_called_once_with("geocoded.csv", index=False)
+
+    def test_process_csv_source_chunked(self):
+        """Test that chunked processing geocodes each chunk and rewrites the file once."""
+        self.mock_geolocator.geocode.return_value = MagicMock(
+            latitude=40.0, longitude=-88.0, raw={}
+        )
+        columns_config = {
+            key: key
+            for key in ("address", "city", "state", "zip_code", "latitude", "longitude")
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "geocoded.csv")
+            pd.DataFrame(
+                {
+                    "address": ["1 Main St", "2 Oak St", "3 Elm St"],
+                    "city": ["Urbana", "Urbana", "Urbana"],
+                    "state": ["IL", "IL", "IL"],
+                    "zip_code": ["61801", "61801", "61801"],
+                    "latitude": [None, 41.0, None],
+                    "longitude": [None, -87.0, None],
+                }
+            ).to_csv(path, index=False)
+
+            with patch(
+                "src.geocode.geocode_dataset", wraps=geocode_dataset
+            ) as mock_geocode_dataset:
+                process_csv_source(path, path, columns_config, None, chunksize=2)
+
+            result = pd.read_csv(path, dtype={"zip_code": str})
+            self.assertEqual(os.listdir(tmp), ["geocoded.csv"])
+
+        self.assertEqual(mock_geocode_dataset.call_count, 2)
+        self.assertEqual(result["latitude"].tolist(), [40.0, 41.0, 40.0])
+        self.assertEqual(result["zip_code"].tolist(), ["61801"] * 3)
+        self.assertNotIn("_needs_update", result.columns)
+
     @patch("src.geocode.load_data")
     @patch("src.geocode.initialize_geolocator")
     @patch("src.geocode.geocode_dataset")
@@ -336,12 +580,12 @@ class TestGeocode(unittest.TestCase):
         mock_supabase_client = MagicMock()
         mock_table = MagicMock()
         mock_update = MagicMock()
-        mock_eq = MagicMock()
+        mock_in = MagicMock()
 
         # Configure the mock chain
         mock_supabase_client.table.return_value = mock_table
         mock_table.update.return_value = mock_update
-        mock_update.eq.return_value = mock_eq
+        mock_update.in_.return_value = mock_in
 
         # Create test data with one record needing update
         test_df = pd.DataFrame(
@@ -389,13 +633,165 @@ class TestGeocode(unittest.TestCase):
         mock_load_data.assert_called_once_with(mock_supabase_client, "locations")
         mock_geocode_dataset.assert_called_once()
 
-        # Verify database update was called with correct parameters for only the first row
+        # Verify a single update carried only the first row's written columns
         mock_supabase_client.table.assert_called_with("locations")
-        mock_table.update.assert_called_with(
+        mock_table.update.assert_called_once_with(
             {"latitude": 37.5, "longitude": -122.1, "error": None}
         )
-        mock_update.eq.assert_called_with("id", 1)
-        mock_eq.execute.assert_called_once()
+        mock_update.in_.assert_called_once_with("id", [1])
+        mock_in.execute.assert_called_once()
+
+        # The payload never rewrites the key or untouched address columns
+        payload = mock_table.update.call_args.args[0]
+        self.assertEqual(set(payload), {"latitude", "longitude", "error"})
+
+    @patch("src.geocode.load_data")
+    @patch("src.geocode.initialize_geolocator")
+    @patch("src.geocode.geocode_dataset")
+    def test_process_db_source_groups_identical_updates(
+        self, mock_geocode_dataset, mock_initialize_geolocator, mock_load_data
+    ):
+        """Test that rows given the same result share one update request."""
+        mock_supabase_client = MagicMock()
+        mock_table = mock_supabase_client.table.return_value
+
+        test_df = pd.DataFrame(
+            {
+                "id": [1, 2, 3],
+                "city": ["Nowhere", "Nowhere", "Springfield"],
+                "latitude": [None, None, None],
+                "longitude": [None, None, None],
+                "error": [None, None, None],
+            }
+        )
+        processed_df = test_df.copy()
+        processed_df["latitude"] = [None, None, 39.8]
+        processed_df["longitude"] = [None, None, -89.6]
+        processed_df["error"] = ["Location not found", "Location not found", ""]
+        processed_df["_needs_update"] = [True, True, True]
+        mock_geocode_dataset.return_value = (processed_df, 1, 2)
+        mock_load_data.return_value = test_df
+
+        table_config = {
+            "table_name": "locations",
+            "columns": {
+                "id": "id",
+                "city": "city",
+                "latitude": "latitude",
+                "longitude": "longitude",
+            },
+        }
+        process_db_source(table_config, mock_supabase_client)
+
+        mock_table.update.assert_has_calls(
+            [
+                call({"latitude": None, "longitude": None, "error": "Location not found"}),
+                call().in_("id", [1, 2]),
+                call().in_().execute(),
+                call({"latitude": 39.8, "longitude": -89.6, "error": ""}),
+                call().in_("id", [3]),
+                call().in_().execute(),
+            ]
+        )
+        self.assertEqual(mock_table.update.call_count, 2)
+
+    @patch("src.geocode.DB_UPDATE_BATCH_SIZE", 2)
+    @patch("src.geocode.load_data")
+    @patch("src.geocode.initialize_geolocator")
+    @patch("src.geocode.geocode_dataset")
+    def test_process_db_source_bulk_update_rpc(
+        self, mock_geocode_dataset, mock_initialize_geolocator, mock_load_data
+    ):
+        """Test that changed rows are written through the RPC in batches."""
+        mock_supabase_client = MagicMock()
+
+        test_df = pd.DataFrame(
+            {
+                "id": [1, 2, 3, 4],
+                "city": ["Urbana", "Peoria", "Decatur", "Joliet"],
+                "latitude": [None, None, None, 41.5],
+                "longitude": [None, None, None, -88.1],
+                "error": [None, None, None, None],
+            }
+        )
+        processed_df = test_df.copy()
+        processed_df["latitude"] = [40.1, 40.7, None, 41.5]
+        processed_df["longitude"] = [-88.2, -89.6, None, -88.1]
+        processed_df["error"] = ["", "", "Location not found", None]
+        processed_df["_needs_update"] = [True, True, True, False]
+        mock_geocode_dataset.return_value = (processed_df, 2, 1)
+        mock_load_data.return_value = test_df
+
+        table_config = {
+            "table_name": "locations",
+            "update_rpc": "update_geocoded_rows",
+            "columns": {
+                "id": "id",
+                "city": "city",
+                "latitude": "latitude",
+                "longitude": "longitude",
+            },
+        }
+        process_db_source(table_config, mock_supabase_client)
+
+        rows = [
+            {"id": 1, "latitude": 40.1, "longitude": -88.2, "error": ""},
+            {"id": 2, "latitude": 40.7, "longitude": -89.6, "error": ""},
+            {
+                "id": 3,
+                "latitude": None,
+                "longitude": None,
+                "error": "Location not found",
+            },
+        ]
+        params = {
+            "p_table": "locations",
+            "p_id_column": "id",
+            "p_latitude_column": "latitude",
+            "p_longitude_column": "longitude",
+        }
+        self.assertEqual(
+            mock_supabase_client.rpc.call_args_list,
+            [
+                call("update_geocoded_rows", {**params, "p_rows": rows[:2]}),
+                call("update_geocoded_rows", {**params, "p_rows": rows[2:]}),
+            ],
+        )
+        mock_supabase_client.table.return_value.update.assert_not_called()
+
+    @patch("src.geocode.load_data")
+    @patch("src.geocode.initialize_geolocator")
+    @patch("src.geocode.geocode_dataset")
+    def test_process_db_source_rpc_failure_falls_back(
+        self, mock_geocode_dataset, mock_initialize_geolocator, mock_load_data
+    ):
+        """Test that a failing update RPC falls back to per-payload updates."""
+        mock_supabase_client = MagicMock()
+        mock_supabase_client.rpc.return_value.execute.side_effect = Exception("404")
+        mock_table = mock_supabase_client.table.return_value
+
+        test_df = pd.DataFrame(
+            {"id": [1], "latitude": [None], "longitude": [None], "error": [None]}
+        )
+        processed_df = test_df.copy()
+        processed_df["latitude"] = [40.1]
+        processed_df["longitude"] = [-88.2]
+        processed_df["error"] = [""]
+        processed_df["_needs_update"] = [True]
+        mock_geocode_dataset.return_value = (processed_df, 1, 0)
+        mock_load_data.return_value = test_df
+
+        table_config = {
+            "table_name": "locations",
+            "update_rpc": "update_geocoded_rows",
+            "columns": {"id": "id", "latitude": "latitude", "longitude": "longitude"},
+        }
+        process_db_source(table_config, mock_supabase_client)
+
+        mock_table.update.assert_called_once_with(
+            {"latitude": 40.1, "longitude": -88.2, "error": ""}
+        )
+        mock_table.update.return_value.in_.assert_called_once_with("id", [1])
 
     @patch("src.geocode.process_db_source")
     @patch("src.geocode.get_supabase_client")
@@ -420,7 +816,9 @@ class TestGeocode(unittest.TestCase):
 
         # Verify process_db_source only called for table with needs_geocoding=True
         mock_process_db_source.assert_called_once()
-        mock_process_db_source.assert_called_with(tables_mock["table1"], mock_client)
+        mock_process_db_source.assert_called_with(
+            tables_mock["table1"], mock_client, cache_path=GEOCODE_CACHE
+        )
 
     @patch("os.path.exists")
     @patch("src.geocode.process_csv_source")
@@ -453,6 +851,8 @@ class TestGeocode(unittest.TestCase):
             f"{locations_dir}/geocoded_locations.csv",
             f"{locations_dir}/geocoded_locations.csv",
             tables_mock["table1"]["columns"],
+            cache_path=GEOCODE_CACHE,
+            chunksize=None,
         )
 
 
@@ -1,9 +1,10 @@
 import unittest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock, call, mock_open
 import os
 import sys
 import pandas as pd
-import json
+import orjson
+from openrouteservice.exceptions import ApiError
 from pathlib import Path
 
 # Add the project root to path to allow importing from src
@@ -13,8 +14,10 @@ from src.isochrone import (
     load_center_data,
     generate_isochrone,
     upsert_isochrones,
+    upsert_isochrones_bulk,
     check_existing_isochrones,
     save_geojson_file,
+    _existing_isochrone_ids,
     main,
 )
 from src.utils.error_utils import (
@@ -207,13 +210,29 @@ class TestIsochrone(unittest.TestCase):
             smoothing=25,
         )
 
+    @patch("src.utils.retry_util.time.sleep")
     @patch("src.isochrone.isochrones")
-    def test_generate_isochrone_failure(self, mock_isochrones):
-        """Test handling of isochrone generation failure"""
-        mock_isochrones.side_effect = Exception("API Error")
+    def test_generate_isochrone_failure(self, mock_isochrones, mock_sleep):
+        """Test handling of isochrone generation failure after retries"""
+        mock_isochrones.side_effect = ApiError(503, "Service Unavailable")
         mock_client = MagicMock()
         with self.assertRaises(APIConnectionError):
             generate_isochrone(mock_client, -122.4194, 37.7749, "Test City")
+        self.assertEqual(mock_isochrones.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch("src.utils.retry_util.time.sleep")
+    @patch("src.isochrone.isochrones")
+    def test_generate_isochrone_permanent_error_not_retried(
+        self, mock_isochrones, mock_sleep
+    ):
+        """Test that client errors from ORS fail on the first attempt"""
+        mock_isochrones.side_effect = ApiError(400, "Unroutable point")
+        mock_client = MagicMock()
+        with self.assertRaises(APIConnectionError):
+            generate_isochrone(mock_client, -122.4194, 37.7749, "Test City")
+        mock_isochrones.assert_called_once()
+        mock_sleep.assert_not_called()
 
     def test_upsert_isochrones_validation(self):
         """Test validation in upsert_isochrones"""
@@ -253,11 +272,19 @@ class TestIsochrone(unittest.TestCase):
         mock_execute = MagicMock()
         mock_supabase.table.return_value = mock_query
         mock_query.select.return_value = mock_query
-        mock_query.eq.return_value = mock_query
-        mock_query.execute.return_value = self.mock_supabase_response
+        mock_query.in_.return_value = mock_query
+        mock_query.order.return_value = mock_query
+        mock_query.range.return_value = mock_query
+        # Only the 60 minute isochrone is already stored
+        mock_query.execute.return_value = MagicMock(
+            data=[{"id": 1, "name": "Test City 1", "group_index": 0, "value": 3600}]
+        )
         mock_query.update.return_value = mock_update
         mock_update.eq.return_value = mock_execute
         mock_execute.execute.return_value = MagicMock(error=None, data=[{"id": 1}])
+        mock_query.insert.return_value.execute.return_value = MagicMock(
+            error=None, data=[{"id": 2}]
+        )
         upsert_isochrones(
             mock_supabase,
             "Test City 1",
@@ -265,7 +292,65 @@ class TestIsochrone(unittest.TestCase):
             dry_run=False,
             centers_df=self.centers_df,
         )
-        mock_query.update.assert_called()
+        mock_query.in_.assert_called_once_with("name", ["Test City 1"])
+        mock_query.update.assert_called_once()
+        mock_update.eq.assert_called_once_with("id", 1)
+        mock_query.insert.assert_called_once()
+        self.assertEqual(len(mock_query.insert.call_args.args[0]), 1)
+
+    def test_upsert_isochrones_bulk_single_lookup(self):
+        """Test that bulk upserts look up every center's stored rows in one query"""
+        mock_supabase = MagicMock()
+        mock_query = mock_supabase.table.return_value
+        mock_query.select.return_value = mock_query
+        mock_query.in_.return_value = mock_query
+        mock_query.order.return_value = mock_query
+        mock_query.range.return_value = mock_query
+        mock_query.execute.return_value = MagicMock(data=[])
+        isochrones_data = {
+            "Test City 1": self.isochrone_result,
+            "Test City 2": self.isochrone_result,
+        }
+
+        upsert_isochrones_bulk(
+            mock_supabase, isochrones_data, dry_run=True, centers_df=self.centers_df
+        )
+
+        mock_query.in_.assert_called_once_with("name", ["Test City 1", "Test City 2"])
+        mock_query.insert.assert_not_called()
+
+    def test_existing_isochrone_ids_reads_every_page(self):
+        """Test that the stored-row lookup keeps paging past a full response"""
+        mock_supabase = MagicMock()
+        mock_query = mock_supabase.table.return_value
+        for method in ("select", "in_", "order", "range"):
+            getattr(mock_query, method).return_value = mock_query
+        mock_query.execute.side_effect = [
+            MagicMock(
+                data=[
+                    {"id": 1, "name": "Test City 1", "group_index": 0, "value": 1800},
+                    {"id": 2, "name": "Test City 1", "group_index": 0, "value": 3600},
+                ]
+            ),
+            MagicMock(
+                data=[{"id": 3, "name": "Test City 2", "group_index": 0, "value": 1800}]
+            ),
+        ]
+
+        existing_ids = _existing_isochrone_ids(
+            mock_supabase, ["Test City 1", "Test City 2"], page_size=2
+        )
+
+        self.assertEqual(
+            existing_ids,
+            {
+                ("Test City 1", 0, 1800): 1,
+                ("Test City 1", 0, 3600): 2,
+                ("Test City 2", 0, 1800): 3,
+            },
+        )
+        mock_query.order.assert_called_with("id")
+        self.assertEqual(mock_query.range.call_args_list, [call(0, 1), call(2, 3)])
 
     def test_upsert_isochrones_insert(self):
         """Test upsert_isochrones with new records (insert mode)"""
@@ -290,7 +375,10 @@ class TestIsochrone(unittest.TestCase):
             dry_run=False,
             centers_df=self.centers_df,
         )
-        self.assertEqual(mock_query.insert.call_count, 2)
+        # Both features go out in a single insert
+        mock_query.insert.assert_called_once()
+        rows = mock_query.insert.call_args.args[0]
+        self.assertEqual(len(rows), 2)
 
     def test_check_existing_isochrones(self):
         """Test checking for existing isochrones"""
@@ -313,9 +401,9 @@ class TestIsochrone(unittest.TestCase):
         """Test saving GeoJSON to a file"""
         test_path = Path("/test/path/file.geojson")
         save_geojson_file(test_path, self.isochrone_result)
-        mock_file.assert_called_once_with("w")
+        mock_file.assert_called_once_with("wb")
         handle = mock_file()
-        handle.write.assert_called()
+        handle.write.assert_called_once_with(orjson.dumps(self.isochrone_result))
 
     @patch("pathlib.Path.open")
     def test_save_geojson_file_error(self, mock_open):
@@ -324,13 +412,12 @@ class TestIsochrone(unittest.TestCase):
         with self.assertRaises(DataProcessingError):
             save_geojson_file(Path("/test/path/file.geojson"), self.isochrone_result)
 
-    @patch("src.isochrone.json.dump")
     @patch("pathlib.Path.open", new_callable=mock_open)
-    def test_save_geojson_json_error(self, mock_file, mock_dump):
+    def test_save_geojson_json_error(self, mock_file):
         """Test handling JSON serialization errors"""
-        mock_dump.side_effect = json.JSONDecodeError("JSON Error", "", 0)
         with self.assertRaises(GeoJSONError):
-            save_geojson_file(Path("/test/path.geojson"), self.isochrone_result)
+            save_geojson_file(Path("/test/path.geojson"), {"bad": object()})
+        mock_file.assert_not_called()
 
     @patch("src.isochrone.get_ors_client")
     @patch("src.isochrone.load_center_data")
@@ -373,7 +460,7 @@ class TestIsochrone(unittest.TestCase):
     @patch("src.isochrone.get_supabase_client")
     @patch("src.isochrone.load_center_data")
     @patch("src.isochrone.generate_isochrone")
-    @patch("src.isochrone.upsert_isochrones")
+    @patch("src.isochrone.upsert_isochrones_bulk")
     @patch("src.isochrone.check_existing_isochrones")
     @patch("src.isochrone.Path")
     @patch("builtins.input", return_value="y")
@@ -412,7 +499,12 @@ class TestIsochrone(unittest.TestCase):
         mock_load_centers.assert_called_once()
         mock_check_existing.assert_called_once()
         mock_generate.assert_called()
-        mock_upsert.assert_called()
+        mock_upsert.assert_called_once_with(
+            mock_supabase,
+            {"Test City 1": self.isochrone_result},
+            False,
+            centers_df=self.centers_df,
+        )
 
 
 if __name__ == "__main__":
@@ -1,10 +1,23 @@
+import gzip
+import json
+import tempfile
 import unittest
-from unittest.mock import patch, mock_open
+from pathlib import Path
+from unittest.mock import MagicMock, patch, mock_open
 import os
 import sys
 import pandas as pd
 import folium
-from src.maps import create_map
+from src.maps import (
+    create_map,
+    generate_maps,
+    minify_html,
+    save_minified_map,
+    write_isochrones_asset,
+    load_isochrones_local,
+    LocationMarkers,
+    _cached_midpoint,
+)
 
 # Add the project root to path to allow importing from src
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -141,8 +154,9 @@ class TestMapGeneration(unittest.TestCase):
         """Clean up after each test method."""
         self.map_settings_patch.stop()
         self.tables_patch.stop()
-        self.mock_css_open.stop()
+        # Both patches target Path.open, so stop them in reverse start order
         self.mock_js_open.stop()
+        self.mock_css_open.stop()
         patch.stopall()
 
     def test_create_map_basic(self):
@@ -243,6 +257,25 @@ class TestMapGeneration(unittest.TestCase):
         ]
         self.assertEqual(len(layer_controls), 1)
 
+    def test_create_map_all_tile_layers_order(self):
+        """Test that the preferred provider is added last and the active one once"""
+        result_map = create_map(
+            self.centers_df,
+            self.isochrones_geojson,
+            self.feature_colors,
+            self.map_center,
+            tile_provider="Satellite",
+            include_all_tiles=True,
+        )
+
+        layer_names = [
+            child.layer_name
+            for child in result_map._children.values()
+            if isinstance(child, folium.TileLayer)
+        ]
+
+        self.assertEqual(layer_names, ["Google Satellite", "OpenStreetMap", "CartoDB"])
+
     @patch("src.maps.LogContext")
     def test_create_map_isochrones(self, mock_log_context):
         """Test that isochrones are properly added to the map"""
@@ -321,6 +354,32 @@ class TestMapGeneration(unittest.TestCase):
         for location in expected_locations:
             self.assertIn(location, marker_locations)
 
+    def test_create_map_center_markers_share_icon(self):
+        """Test that all center markers reuse a single Icon"""
+        result_map = create_map(
+            self.centers_df,
+            self.isochrones_geojson,
+            self.feature_colors,
+            self.map_center,
+        )
+
+        centers_layer = next(
+            child
+            for child in result_map._children.values()
+            if isinstance(child, folium.FeatureGroup) and child.layer_name == "Centers"
+        )
+        markers = [
+            child
+            for child in centers_layer._children.values()
+            if isinstance(child, folium.Marker)
+        ]
+
+        self.assertEqual(len({id(marker.icon) for marker in markers}), 1)
+
+        # The shared icon is declared only once in the rendered output
+        html = result_map.get_root().render()
+        self.assertEqual(html.count(f"var {markers[0].icon.get_name()} ="), 1)
+
     def test_create_map_with_locations(self):
         """Test map with location markers included"""
         # Create map with locations
@@ -346,18 +405,20 @@ class TestMapGeneration(unittest.TestCase):
 
         self.assertIsNotNone(locations_layer)
 
-        # Verify markers are added to the locations layer
-        markers = [
+        # Verify a single marker batch is added to the locations layer
+        batches = [
             child
             for child in locations_layer._children.values()
-            if isinstance(child, folium.Marker)
+            if isinstance(child, LocationMarkers)
         ]
+        self.assertEqual(len(batches), 1)
 
-        # Should have 2 markers (one for each location)
-        self.assertEqual(len(markers), 2)
+        # Should have 2 rows (one for each location)
+        rows = batches[0].rows
+        self.assertEqual(len(rows), 2)
 
         # Verify marker locations match location coordinates
-        marker_locations = [marker.location for marker in markers]
+        marker_locations = [[row[0], row[1]] for row in rows]
         expected_locations = [
             [
                 self.locations_df.iloc[0]["latitude"],
@@ -402,18 +463,19 @@ class TestMapGeneration(unittest.TestCase):
         self.assertIsNotNone(locations_layer)
 
         # Verify only valid markers are added to the locations layer
-        markers = [
+        batches = [
             child
             for child in locations_layer._children.values()
-            if isinstance(child, folium.Marker)
+            if isinstance(child, LocationMarkers)
         ]
+        rows = batches[0].rows
 
-        # Should have 1 marker (only the valid location)
-        self.assertEqual(len(markers), 1)
+        # Should have 1 row (only the valid location)
+        self.assertEqual(len(rows), 1)
 
         # Verify marker location matches the valid coordinates
         self.assertEqual(
-            markers[0].location,
+            [rows[0][0], rows[0][1]],
             [
                 self.locations_df.iloc[1]["latitude"],
                 self.locations_df.iloc[1]["longitude"],
@@ -493,6 +555,283 @@ class TestMapGeneration(unittest.TestCase):
             self.assertEqual(centers_layer.show, False)
             self.assertEqual(locations_layer.show, True)
 
+    def test_create_map_locations_missing_columns(self):
+        """Test that missing address columns fall back to 'Unknown'"""
+        locations = self.locations_df.drop(columns=["zip_code"]).assign(
+            extra=["a", "b"]
+        )
+
+        result_map = create_map(
+            self.centers_df,
+            self.isochrones_geojson,
+            self.feature_colors,
+            self.map_center,
+            include_locations=True,
+            locations_df=locations,
+        )
+
+        batch = next(
+            child
+            for layer in result_map._children.values()
+            for child in layer._children.values()
+            if isinstance(child, LocationMarkers)
+        )
+        self.assertEqual(
+            batch.rows[0],
+            [
+                37.77,
+                -122.42,
+                "Location 1",
+                "123 Main St, San Francisco, CA Unknown",
+                "San Francisco",
+            ],
+        )
+
+    def test_create_map_locations_render_as_js_array(self):
+        """Test that location markers are emitted as one JS array"""
+        result_map = create_map(
+            self.centers_df,
+            self.isochrones_geojson,
+            self.feature_colors,
+            self.map_center,
+            include_locations=True,
+            locations_df=self.locations_df,
+        )
+
+        html = result_map.get_root().render()
+
+        # Both locations are in the payload and the popups carry the full address
+        self.assertIn('"Location 1","123 Main St, San Francisco, CA 94105"', html)
+        self.assertIn('"Location 2","456 Broadway, New York, NY 10001"', html)
+        self.assertIn("L.AwesomeMarkers.icon", html)
+
+
+class TestLoadIsochronesLocal(unittest.TestCase):
+    """Test suite for loading isochrones from local GeoJSON files"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.isochrones_dir = Path(self.temp_dir.name, "isochrones")
+        self.isochrones_dir.mkdir()
+
+        self.data_patch = patch("src.maps.DATA", Path(self.temp_dir.name))
+        self.tables_patch = patch(
+            "src.maps.TABLES",
+            {"isochrones": {"file_name": "isochrones.geojson", "columns": {}}},
+        )
+        self.data_patch.start()
+        self.tables_patch.start()
+
+    def tearDown(self):
+        self.data_patch.stop()
+        self.tables_patch.stop()
+        self.temp_dir.cleanup()
+
+    def _write(self, file_name, features):
+        Path(self.isochrones_dir, file_name).write_text(
+            json.dumps({"type": "FeatureCollection", "features": features})
+        )
+
+    def test_load_combined_file(self):
+        """Test that the combined file is preferred when present"""
+        self._write("isochrones.geojson", [{"type": "Feature", "properties": {}}])
+        self._write("Peoria_isochrones.geojson", [{"type": "Feature"}] * 3)
+
+        result = load_isochrones_local()
+
+        self.assertEqual(len(result["features"]), 1)
+
+    def test_combine_individual_files(self):
+        """Test that individual files are merged and tagged with their name"""
+        self._write(
+            "Peoria_isochrones.geojson",
+            [
+                {"type": "Feature", "properties": {"value": 1800}},
+                {"type": "Feature", "properties": {"name": "Custom"}},
+            ],
+        )
+        self._write("Ottawa_isochrones.geojson", [{"type": "Feature"}])
+
+        result = load_isochrones_local()
+
+        self.assertEqual(result["type"], "FeatureCollection")
+        names = sorted(f["properties"]["name"] for f in result["features"])
+        self.assertEqual(names, ["Custom", "Ottawa", "Peoria"])
+
+
+class TestMinifyHtml(unittest.TestCase):
+    """Test suite for HTML minification"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.html_path = Path(self.temp_dir.name, "map.html")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_minify_inline_blocks(self):
+        """Test that script and style bodies are minified and markup is kept"""
+        self.html_path.write_text(
+            "<html>\n<head>\n<style>\n  .a {\n    color: red;\n  }\n</style>\n"
+            "</head>\n<body>\n<script>\n  var x = 'a  b';\n  // comment\n</script>\n"
+            "<script src=\"lib.js\"></script>\n</body>\n</html>\n"
+        )
+
+        minify_html(self.html_path)
+        result = self.html_path.read_text()
+
+        self.assertIn("<style>.a{color:red}</style>", result)
+        self.assertIn("<script>var x='a  b';</script>", result)
+        self.assertIn('<script src="lib.js"></script>', result)
+        self.assertIn("<body>\n", result)
+
+    @patch("src.maps.HTMLMIN_THRESHOLD", 0)
+    def test_minify_large_file_uses_htmlmin(self):
+        """Test that whitespace is collapsed once the size threshold is reached"""
+        self.html_path.write_text("<html>\n  <body>\n  <p>Hi</p>\n  </body>\n</html>\n")
+
+        minify_html(self.html_path)
+
+        self.assertNotIn("\n", self.html_path.read_text())
+
+
+class TestSaveMinifiedMap(unittest.TestCase):
+    """Test suite for saving maps with cached minification"""
+
+    class FakeMap:
+        """Stand-in for a Folium map whose save writes fixed HTML."""
+
+        def __init__(self, html):
+            self.html = html
+
+        def save(self, path):
+            Path(path).write_text(self.html)
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.map_path = Path(self.temp_dir.name, "centers.html")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @patch("src.maps.minify_html")
+    def test_unchanged_map_skips_minify(self, mock_minify):
+        """Test that identical content, ignoring element IDs, reuses the cache"""
+        save_minified_map(self.FakeMap(f"<div id='map_{'a' * 32}'></div>"), self.map_path)
+        save_minified_map(self.FakeMap(f"<div id='map_{'b' * 32}'></div>"), self.map_path)
+
+        mock_minify.assert_called_once_with(self.map_path)
+        self.assertTrue(self.map_path.with_suffix(".min.html").exists())
+        self.assertEqual(self.map_path.read_text(), f"<div id='map_{'a' * 32}'></div>")
+
+    @patch("src.maps.minify_html")
+    def test_changed_map_is_minified(self, mock_minify):
+        """Test that changed content runs the minifier again"""
+        save_minified_map(self.FakeMap("<p>one</p>"), self.map_path)
+        save_minified_map(self.FakeMap("<p>two</p>"), self.map_path)
+
+        self.assertEqual(mock_minify.call_count, 2)
+        self.assertEqual(self.map_path.read_text(), "<p>two</p>")
+
+
+class TestWriteIsochronesAsset(unittest.TestCase):
+    """Test suite for the precomputed isochrones asset"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.asset_path = Path(self.temp_dir.name, "static", "isochrones.geojson.gz")
+        self.version_path = self.asset_path.with_name("isochrones.geojson.gz.version")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_asset_round_trips_as_gzipped_geojson(self):
+        """Test that the asset decompresses back to the FeatureCollection"""
+        isochrones = {
+            "type": "FeatureCollection",
+            "features": [{"type": "Feature", "properties": {"name": "A"}}],
+        }
+
+        write_isochrones_asset(
+            isochrones, "3:2026-01-01", self.asset_path, self.version_path
+        )
+
+        self.assertEqual(
+            json.loads(gzip.decompress(self.asset_path.read_bytes())), isochrones
+        )
+        self.assertEqual(self.version_path.read_text(), "3:2026-01-01")
+        self.assertEqual(
+            sorted(self.asset_path.parent.iterdir()),
+            [self.asset_path, self.version_path],
+        )
+
+    @patch("src.maps.write_isochrones_asset")
+    @patch("src.maps.save_minified_map")
+    @patch("src.maps.create_map")
+    @patch("src.maps.load_isochrones_local")
+    @patch("src.maps.load_data_local")
+    def test_local_maps_do_not_replace_asset(
+        self, mock_load_local, mock_isochrones, _create, _save, mock_write
+    ):
+        """Test that local-file isochrones never become the API's asset"""
+        mock_load_local.return_value = pd.DataFrame(
+            {"latitude": [40.0], "longitude": [-88.0]}
+        )
+        mock_isochrones.return_value = {
+            "type": "FeatureCollection",
+            "features": [{"type": "Feature", "properties": {"name": "A"}}],
+        }
+
+        with patch("src.maps.MAPS", self.temp_dir.name):
+            generate_maps(use_local=True)
+
+        mock_write.assert_not_called()
+
+    @patch("src.maps.write_isochrones_asset")
+    @patch("src.maps.save_minified_map")
+    @patch("src.maps.create_map")
+    @patch("src.maps.load_isochrones")
+    @patch("src.maps.load_data")
+    @patch("src.maps.get_table_version", return_value="3:2026-01-01")
+    @patch("src.maps.get_supabase_client", return_value=MagicMock())
+    def test_database_maps_write_versioned_asset(
+        self, _client, _version, mock_load, mock_isochrones, _create, _save, mock_write
+    ):
+        """Test that database isochrones are written with their table version"""
+        mock_load.return_value = pd.DataFrame({"latitude": [40.0], "longitude": [-88.0]})
+        isochrones = {
+            "type": "FeatureCollection",
+            "features": [{"type": "Feature", "properties": {"name": "A"}}],
+        }
+        mock_isochrones.return_value = isochrones
+
+        with patch("src.maps.MAPS", self.temp_dir.name):
+            generate_maps(use_local=False)
+
+        mock_write.assert_called_once_with(isochrones, "3:2026-01-01")
+
+
+class TestCachedMidpoint(unittest.TestCase):
+    """Test suite for the memoized map center calculation"""
+
+    def setUp(self):
+        _cached_midpoint.cache_clear()
+
+    def tearDown(self):
+        _cached_midpoint.cache_clear()
+
+    @patch("src.maps.calculate_geographic_midpoint", return_value=[40.0, -90.0])
+    def test_midpoint_computed_once_per_coords(self, mock_midpoint):
+        """Test that identical coordinates reuse the cached midpoint"""
+        coords = ((41.0, -89.0), (39.0, -91.0))
+
+        self.assertEqual(_cached_midpoint(coords), (40.0, -90.0))
+        self.assertEqual(_cached_midpoint(coords), (40.0, -90.0))
+        mock_midpoint.assert_called_once_with([(41.0, -89.0), (39.0, -91.0)])
+
+        _cached_midpoint(((41.0, -89.0),))
+        self.assertEqual(mock_midpoint.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
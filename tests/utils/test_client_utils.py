@@ -1,11 +1,24 @@
 import unittest
 from unittest.mock import patch, MagicMock
 
-from src.utils.client_utils import get_ors_client, get_supabase_client
+from src.utils.client_utils import (
+    get_ors_client,
+    get_supabase_client,
+    _cached_ors_client,
+    _cached_supabase_client,
+)
 from src.utils.error_utils import ConfigError, APIConnectionError
 
 
 class TestClientUtils(unittest.TestCase):
+    def setUp(self):
+        _cached_ors_client.cache_clear()
+        _cached_supabase_client.cache_clear()
+
+    def tearDown(self):
+        _cached_ors_client.cache_clear()
+        _cached_supabase_client.cache_clear()
+
     @patch("src.utils.client_utils.os.getenv")
     @patch("src.utils.client_utils.openrouteservice.Client")
     def test_get_ors_client_success(self, mock_ors_client, mock_getenv):
@@ -22,6 +35,20 @@ class TestClientUtils(unittest.TestCase):
         mock_ors_client.assert_called_once_with(key="fake_api_key")
         self.assertEqual(result, mock_client)
 
+    @patch("src.utils.client_utils.os.getenv")
+    @patch("src.utils.client_utils.openrouteservice.Client")
+    def test_get_ors_client_reused(self, mock_ors_client, mock_getenv):
+        # Setup mock
+        mock_getenv.return_value = "fake_api_key"
+
+        # Execute
+        first = get_ors_client()
+        second = get_ors_client()
+
+        # Assert the client is only created once
+        mock_ors_client.assert_called_once()
+        self.assertIs(first, second)
+
     @patch("src.utils.client_utils.os.getenv")
     def test_get_ors_client_missing_api_key(self, mock_getenv):
         # Setup mock
@@ -67,6 +94,23 @@ class TestClientUtils(unittest.TestCase):
         )
         self.assertEqual(result, mock_client)
 
+    @patch("src.utils.client_utils.os.getenv")
+    @patch("src.utils.client_utils.create_client")
+    def test_get_supabase_client_reused(self, mock_create_client, mock_getenv):
+        # Setup mock
+        mock_getenv.side_effect = lambda key: {
+            "SUPABASE_URL": "https://fake-url.supabase.co",
+            "SUPABASE_KEY": "fake_key",
+        }.get(key)
+
+        # Execute
+        first = get_supabase_client()
+        second = get_supabase_client()
+
+        # Assert the client is only created once
+        mock_create_client.assert_called_once()
+        self.assertIs(first, second)
+
     @patch("src.utils.client_utils.os.getenv")
     def test_get_supabase_client_missing_url(self, mock_getenv):
         # Setup mock
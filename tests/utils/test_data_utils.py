@@ -1,11 +1,17 @@
+import json
 import unittest
 from unittest.mock import patch, MagicMock
 import pandas as pd
 from shapely.geometry import Polygon
 from shapely.geometry import mapping
 
-from src.utils.data_utils import load_data, load_isochrones
-from src.utils.error_utils import DataAccessError, DataValidationError
+from src.utils.data_utils import (
+    get_table_version,
+    iter_isochrone_features,
+    load_data,
+    load_isochrones,
+)
+from src.utils.error_utils import DataAccessError, DataValidationError, GeoJSONError
 
 
 class TestDataUtils(unittest.TestCase):
@@ -21,6 +27,10 @@ class TestDataUtils(unittest.TestCase):
         self.mock_table.select.return_value = self.mock_select
         self.mock_select.execute.return_value = self.mock_execute
 
+        # Paginated isochrone queries go through order().range()
+        self.mock_range = self.mock_select.order.return_value.range
+        self.mock_range.return_value.execute.return_value = self.mock_execute
+
     def test_load_data_success(self):
         # Setup mock response
         test_data = [
@@ -63,7 +73,8 @@ class TestDataUtils(unittest.TestCase):
         self.assertEqual(result["id"].dtype, "int64")
         self.assertEqual(result["value"].dtype, "int64")
 
-    def test_load_data_exception(self):
+    @patch("src.utils.retry_util.time.sleep")
+    def test_load_data_exception(self, mock_sleep):
         # Setup mock to raise exception
         self.mock_select.execute.side_effect = Exception("Database connection error")
 
@@ -72,6 +83,8 @@ class TestDataUtils(unittest.TestCase):
             load_data(self.mock_supabase, "test_table")
 
         self.assertIn("Database connection error", str(context.exception))
+        # The read is retried before giving up
+        self.assertEqual(self.mock_select.execute.call_count, 3)
 
     def test_load_isochrones_success(self):
         # Setup mock response with WKB geometry
@@ -114,6 +127,7 @@ class TestDataUtils(unittest.TestCase):
         # Assert
         self.mock_supabase.table.assert_called_once_with("isochrones")
         self.mock_table.select.assert_called_once_with("name, value, geom, metadata")
+        self.mock_range.assert_called_once_with(0, 499)
 
         # Check result is a proper GeoJSON
         self.assertEqual(result["type"], "FeatureCollection")
@@ -127,6 +141,201 @@ class TestDataUtils(unittest.TestCase):
         self.assertEqual(feature1["properties"]["color"], "red")
         self.assertEqual(feature1["geometry"], mapping(polygon))
 
+    def test_load_isochrones_simplifies_and_rounds(self):
+        # Polygon with a redundant collinear vertex and full float precision
+        polygon = Polygon(
+            [(0, 0), (0.5, 0), (1.123456789, 0), (1.123456789, 1), (0, 1), (0, 0)]
+        )
+        self.mock_execute.data = [
+            {"name": "Dense", "value": 10, "geom": polygon.wkb_hex, "metadata": {}}
+        ]
+
+        tables_config = {
+            "isochrones": {
+                "table_name": "isochrones",
+                "columns": {
+                    "name": "name",
+                    "value": "value",
+                    "geometry": "geom",
+                    "metadata": "metadata",
+                },
+            }
+        }
+
+        # Execute
+        result = load_isochrones(self.mock_supabase, tables_config)
+
+        # Collinear vertex removed and coordinates rounded to 5 decimals
+        ring = result["features"][0]["geometry"]["coordinates"][0]
+        self.assertEqual(len(ring), 5)
+        self.assertNotIn((0.5, 0.0), ring)
+        self.assertIn((1.12346, 1.0), ring)
+
+    def test_iter_isochrone_features_paginates(self):
+        # Two full pages followed by a short page
+        wkb_hex = Polygon([(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)]).wkb_hex
+        pages = [
+            [{"name": f"Iso {i}", "value": i, "geom": wkb_hex, "metadata": {}}]
+            for i in range(3)
+        ]
+        pages[2] = []
+        self.mock_range.return_value.execute.side_effect = [
+            MagicMock(data=page) for page in pages
+        ]
+
+        tables_config = {
+            "isochrones": {
+                "table_name": "isochrones",
+                "columns": {
+                    "name": "name",
+                    "value": "value",
+                    "geometry": "geom",
+                    "metadata": "metadata",
+                },
+            }
+        }
+
+        # Execute
+        features = list(
+            iter_isochrone_features(self.mock_supabase, tables_config, page_size=1)
+        )
+
+        # Assert pages were requested in order until an empty page
+        self.assertEqual(
+            [f["properties"]["name"] for f in features], ["Iso 0", "Iso 1"]
+        )
+        self.assertEqual(
+            [c.args for c in self.mock_range.call_args_list], [(0, 0), (1, 1), (2, 2)]
+        )
+        # Each page is requested from a fresh query builder
+        self.assertEqual(self.mock_table.select.call_count, 3)
+
+    def test_load_isochrones_uses_geojson_rpc(self):
+        # Setup RPC returning a ready-made FeatureCollection
+        collection = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [0, 0]},
+                    "properties": {"name": "Isochrone 1", "value": 10},
+                }
+            ],
+        }
+        self.mock_supabase.rpc.return_value.execute.return_value = MagicMock(
+            data=collection
+        )
+
+        tables_config = {
+            "isochrones": {"table_name": "isochrones", "geojson_rpc": "export_geojson"}
+        }
+
+        # Execute
+        result = load_isochrones(self.mock_supabase, tables_config)
+
+        # Assert the table was never queried directly
+        self.assertEqual(result, collection)
+        self.assertEqual(self.mock_supabase.rpc.call_args.args[0], "export_geojson")
+        self.mock_supabase.table.assert_not_called()
+
+    def test_load_isochrones_rpc_failure_falls_back(self):
+        # Setup failing RPC and a valid table row
+        self.mock_supabase.rpc.return_value.execute.side_effect = Exception("404")
+        wkb_hex = Polygon([(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)]).wkb_hex
+        self.mock_execute.data = [
+            {"name": "Isochrone 1", "value": 10, "geom": wkb_hex, "metadata": {}}
+        ]
+
+        tables_config = {
+            "isochrones": {
+                "table_name": "isochrones",
+                "geojson_rpc": "export_geojson",
+                "columns": {
+                    "name": "name",
+                    "value": "value",
+                    "geometry": "geom",
+                    "metadata": "metadata",
+                },
+            }
+        }
+
+        # Execute
+        with patch("src.utils.data_utils.logging"):
+            result = load_isochrones(self.mock_supabase, tables_config)
+
+        # Assert rows were decoded locally
+        self.assertEqual(len(result["features"]), 1)
+        self.mock_supabase.table.assert_called_once_with("isochrones")
+
+    def test_iter_isochrone_features_encoded_matches_dicts(self):
+        # Setup one valid and one invalid row
+        polygon = Polygon([(0, 0), (1.123456789, 0), (1, 1), (0, 0)])
+        self.mock_execute.data = [
+            {"name": "Bad", "value": 5, "geom": "zz", "metadata": {}},
+            {"name": "Iso", "value": 10, "geom": polygon.wkb_hex, "metadata": {"a": 1}},
+        ]
+
+        tables_config = {
+            "isochrones": {
+                "table_name": "isochrones",
+                "columns": {
+                    "name": "name",
+                    "value": "value",
+                    "geometry": "geom",
+                    "metadata": "metadata",
+                },
+            }
+        }
+
+        # Execute both modes
+        with patch("src.utils.data_utils.logging"):
+            as_dicts = list(iter_isochrone_features(self.mock_supabase, tables_config))
+            as_bytes = list(
+                iter_isochrone_features(
+                    self.mock_supabase, tables_config, encoded=True
+                )
+            )
+
+        # Encoded features decode to the same GeoJSON as the dict features
+        self.assertEqual(len(as_bytes), 1)
+        self.assertEqual(
+            json.loads(as_bytes[0]), json.loads(json.dumps(as_dicts[0]))
+        )
+
+    def test_load_isochrones_property_fields_allow_list(self):
+        # Setup row whose metadata carries unused keys
+        wkb_hex = Polygon([(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)]).wkb_hex
+        self.mock_execute.data = [
+            {
+                "name": "Isochrone 1",
+                "value": 10,
+                "geom": wkb_hex,
+                "metadata": {"color": "red", "query": {"range": [1800]}},
+            }
+        ]
+
+        tables_config = {
+            "isochrones": {
+                "table_name": "isochrones",
+                "property_fields": ["color"],
+                "columns": {
+                    "name": "name",
+                    "value": "value",
+                    "geometry": "geom",
+                    "metadata": "metadata",
+                },
+            }
+        }
+
+        # Execute
+        result = load_isochrones(self.mock_supabase, tables_config)
+
+        # Only allow-listed metadata keys are kept
+        self.assertEqual(
+            result["features"][0]["properties"],
+            {"name": "Isochrone 1", "value": 10, "color": "red"},
+        )
+
     def test_load_isochrones_empty_response(self):
         # Setup mock with empty response
         self.mock_execute.data = []
@@ -187,9 +396,34 @@ class TestDataUtils(unittest.TestCase):
         self.assertEqual(len(result["features"]), 1)
         self.assertEqual(result["features"][0]["properties"]["name"], "Valid Isochrone")
 
-    def test_load_isochrones_exception(self):
+    def test_load_isochrones_all_invalid_geometry(self):
+        # Setup mock where no geometry can be decoded
+        test_data = [
+            {"name": "Bad 1", "value": 10, "geom": "zz", "metadata": {}},
+            {"name": "Bad 2", "value": 20, "geom": None, "metadata": {}},
+        ]
+        self.mock_execute.data = test_data
+
+        tables_config = {
+            "isochrones": {
+                "table_name": "isochrones",
+                "columns": {
+                    "name": "name",
+                    "value": "value",
+                    "geometry": "geom",
+                    "metadata": "metadata",
+                },
+            }
+        }
+
+        # Execute & Assert
+        with patch("src.utils.data_utils.logging"), self.assertRaises(GeoJSONError):
+            load_isochrones(self.mock_supabase, tables_config)
+
+    @patch("src.utils.retry_util.time.sleep")
+    def test_load_isochrones_exception(self, _mock_sleep):
         # Setup mock to raise exception
-        self.mock_select.execute.side_effect = Exception("Database error")
+        self.mock_range.return_value.execute.side_effect = Exception("Database error")
 
         tables_config = {
             "isochrones": {
@@ -210,3 +444,26 @@ class TestDataUtils(unittest.TestCase):
             load_isochrones(self.mock_supabase, tables_config)
 
         self.assertIn("Database error", str(context.exception))
+
+    def test_get_table_version(self):
+        # Setup mock chain for the single-row version query
+        mock_order = self.mock_select.order.return_value
+        mock_order.limit.return_value.execute.return_value = MagicMock(
+            data=[{"updated_at": "2024-01-02T00:00:00"}], count=3
+        )
+
+        tables_config = {
+            "isochrones": {
+                "table_name": "isochrones",
+                "columns": {"updated_at": "updated_at"},
+            }
+        }
+
+        # Execute
+        version = get_table_version(self.mock_supabase, tables_config, "isochrones")
+
+        # Assert
+        self.mock_table.select.assert_called_once_with("updated_at", count="exact")
+        self.mock_select.order.assert_called_once_with("updated_at", desc=True)
+        mock_order.limit.assert_called_once_with(1)
+        self.assertEqual(version, "3:2024-01-02T00:00:00")
@@ -2,11 +2,18 @@ import unittest
 from unittest.mock import patch, MagicMock
 import os
 
-from src.utils.env_utils import load_env_variables
+from src.utils.env_utils import load_env_variables, _load_dotenv_file
 from src.utils.error_utils import ConfigMissingError
 
 
 class TestEnvUtils(unittest.TestCase):
+    def setUp(self):
+        # The .env file is parsed once per process; reset so each test loads afresh
+        _load_dotenv_file.cache_clear()
+
+    def tearDown(self):
+        _load_dotenv_file.cache_clear()
+
     @patch("src.utils.env_utils.load_dotenv")
     @patch("src.utils.env_utils.Path")
     def test_load_env_variables_success(self, mock_path, mock_load_dotenv):
@@ -165,3 +172,18 @@ class TestEnvUtils(unittest.TestCase):
         # OR use a less brittle approach:
         self.assertTrue(mock_path.called)
         mock_project_root.__truediv__.assert_called_once_with(".env")
+
+    @patch("src.utils.env_utils.load_dotenv")
+    @patch("src.utils.env_utils.Path")
+    def test_load_env_variables_parses_file_once(self, mock_path, mock_load_dotenv):
+        mock_load_dotenv.return_value = True
+
+        with patch.dict(os.environ, {"API_KEY": "test_key"}):
+            load_env_variables()
+            load_env_variables(required_vars=["API_KEY"])
+
+            # Required variables are still validated on cached calls
+            with self.assertRaises(ConfigMissingError):
+                load_env_variables(required_vars=["DATABASE_URL"])
+
+        mock_load_dotenv.assert_called_once()
@@ -107,6 +107,41 @@ class TestErrorUtils(unittest.TestCase):
         error_msg = str(cm.exception)
         self.assertEqual(error_msg, "Mapped error")
 
+    @patch("src.utils.error_utils.traceback.format_exc")
+    @patch("src.utils.error_utils.logging.getLogger")
+    def test_traceback_only_formatted_for_debug(self, mock_get_logger, mock_format):
+        """Test that tracebacks are not formatted unless DEBUG is enabled."""
+        mock_get_logger.return_value.isEnabledFor.return_value = False
+
+        @handle_exception(custom_mapping={ValueError: DataError})
+        def failing_function():
+            raise ValueError("Mapped error")
+
+        with self.assertRaises(DataError):
+            failing_function()
+        with self.assertRaises(ConfigError):
+            with ExceptionContext("Test operation", ConfigError):
+                raise KeyError("missing")
+        mock_format.assert_not_called()
+
+        mock_get_logger.return_value.isEnabledFor.return_value = True
+        with self.assertRaises(DataError):
+            failing_function()
+        mock_format.assert_called_once()
+
+    def test_handle_exception_preserves_function_metadata(self):
+        """Test that decorated functions keep the name Flask uses for endpoints."""
+
+        def get_items():
+            """Return items."""
+            return []
+
+        decorated = handle_exception(get_items)
+
+        self.assertEqual(decorated.__name__, "get_items")
+        self.assertEqual(decorated.__doc__, "Return items.")
+        self.assertIs(decorated.__wrapped__, get_items)
+
     def test_exception_context_no_exception(self):
         """Test that ExceptionContext works when no exception is raised."""
         try:
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from unittest import mock
 from src.utils.geojson_utils import (
@@ -5,6 +7,7 @@ from src.utils.geojson_utils import (
     create_point,
     create_polygon,
     extract_features,
+    iter_features,
     find_features_by_property,
     get_bbox,
     merge_feature_collections,
@@ -25,6 +28,66 @@ class TestGeoJSONUtils(unittest.TestCase):
         with self.assertRaises(DataValidationError):
             validate_geojson(point)
 
+    def test_validate_multipolygon_with_ragged_rings(self):
+        multipolygon = {
+            "type": "MultiPolygon",
+            "coordinates": [
+                [
+                    [[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]],
+                    [[1, 1], [2, 1], [1, 2], [1, 1]],
+                ],
+                [[[5, 5], [6, 5], [6, 6], [5, 5]]],
+            ],
+        }
+        self.assertEqual(validate_geojson(multipolygon), multipolygon)
+
+    def test_validate_polygon_with_invalid_position(self):
+        polygon = {
+            "type": "Polygon",
+            "coordinates": [[[0, 0], [1, "x"], [1, 1], [0, 0]]],
+        }
+        with self.assertRaises(DataValidationError):
+            validate_geojson(polygon)
+
+        polygon["coordinates"] = [[[0, 0], [1], [1, 1], [0, 0]]]
+        with self.assertRaises(DataValidationError):
+            validate_geojson(polygon)
+
+    def test_validate_mixed_dimension_positions(self):
+        line = {"type": "LineString", "coordinates": [[1, 2], [3, 4, 5]]}
+        self.assertEqual(validate_geojson(line), line)
+
+        line = {"type": "LineString", "coordinates": [[1, 2], [3, 4, "x"]]}
+        with self.assertRaises(DataValidationError):
+            validate_geojson(line)
+
+    def test_validate_json_bytes(self):
+        point = validate_geojson(b'{"type": "Point", "coordinates": [125.6, 10.1]}')
+        self.assertEqual(point["coordinates"], [125.6, 10.1])
+
+        with self.assertRaises(DataValidationError):
+            validate_geojson(b'{"type": "Point",')
+
+    def test_validate_repeated_payload_skips_traversal(self):
+        payload = '{"type": "Point", "coordinates": [3.5, 4.5]}'
+        first = validate_geojson(payload)
+
+        with mock.patch("src.utils.geojson_utils._validate_tree") as mock_tree:
+            second = validate_geojson(payload)
+
+        mock_tree.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+    def test_validate_feature_with_unknown_geometry_type(self):
+        feature = {
+            "type": "Feature",
+            "geometry": {"type": "Circle", "coordinates": [0, 0]},
+            "properties": {},
+        }
+        with self.assertRaises(DataValidationError):
+            validate_geojson(feature)
+
     def test_validate_feature(self):
         feature = {
             "type": "Feature",
@@ -33,6 +96,30 @@ class TestGeoJSONUtils(unittest.TestCase):
         }
         self.assertEqual(validate_geojson(feature), feature)
 
+    def test_validate_nested_collections(self):
+        collection = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "GeometryCollection",
+                        "geometries": [{"type": "Point", "coordinates": [0, 0]}],
+                    },
+                    "properties": None,
+                },
+                {"type": "Feature", "geometry": None, "properties": {}},
+            ],
+        }
+        self.assertEqual(validate_geojson(collection), collection)
+
+        collection["features"].append(
+            {"type": "Feature", "geometry": {"type": "Point", "coordinates": [0]}}
+        )
+        with self.assertRaises(DataValidationError) as ctx:
+            validate_geojson(collection)
+        self.assertIn("features[2].geometry:", str(ctx.exception))
+
     def test_create_point(self):
         point = create_point(125.6, 10.1, {"name": "Test Point"})
         self.assertEqual(point["type"], "Feature")
@@ -53,6 +140,10 @@ class TestGeoJSONUtils(unittest.TestCase):
         )
         self.assertEqual(polygon["properties"]["name"], "Test Polygon")
 
+    def test_create_polygon_rejects_empty_coordinates(self):
+        with self.assertRaises(DataValidationError):
+            create_polygon([])
+
     def test_extract_features(self):
         geojson = {
             "type": "FeatureCollection",
@@ -74,6 +165,21 @@ class TestGeoJSONUtils(unittest.TestCase):
         self.assertEqual(features[0]["geometry"]["coordinates"], [0, 0])
         self.assertEqual(features[1]["geometry"]["coordinates"], [1, 1])
 
+    def test_iter_features(self):
+        feature = {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [0, 0]},
+            "properties": {},
+        }
+        collection = {"type": "FeatureCollection", "features": [feature, feature]}
+
+        self.assertEqual(list(iter_features(collection)), [feature, feature])
+        self.assertEqual(list(iter_features(feature)), [feature])
+        self.assertEqual(
+            list(iter_features(feature["geometry"])),
+            [{"type": "Feature", "geometry": feature["geometry"], "properties": {}}],
+        )
+
     def test_find_features_by_property(self):
         geojson = {
             "type": "FeatureCollection",
@@ -113,6 +219,19 @@ class TestGeoJSONUtils(unittest.TestCase):
         bbox = get_bbox(geojson)
         self.assertEqual(bbox, [0, 0, 1, 1])
 
+    def test_get_bbox_multipolygon_with_mixed_dimensions(self):
+        geojson = {
+            "type": "MultiPolygon",
+            "coordinates": [
+                [
+                    [[0, 0, 5], [4, 0, 5], [4, 4, 5], [0, 0, 5]],
+                    [[1, 1], [2, 1], [1, 2], [1, 1]],
+                ],
+                [[[5, -5], [6, 5], [6, 6], [5, -5]]],
+            ],
+        }
+        self.assertEqual(get_bbox(geojson), [0.0, -5.0, 6.0, 6.0])
+
     def test_merge_feature_collections(self):
         fc1 = {
             "type": "FeatureCollection",
@@ -139,6 +258,30 @@ class TestGeoJSONUtils(unittest.TestCase):
         self.assertEqual(merged["features"][0]["properties"]["id"], 1)
         self.assertEqual(merged["features"][1]["properties"]["id"], 2)
 
+    def test_merge_feature_collections_many(self):
+        collections = [
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    {
+                        "type": "Feature",
+                        "geometry": {"type": "Point", "coordinates": [i, i]},
+                        "properties": {"id": i},
+                    }
+                ],
+            }
+            for i in range(3)
+        ]
+        merged = merge_feature_collections(*collections)
+        self.assertEqual(
+            [feature["properties"]["id"] for feature in merged["features"]], [0, 1, 2]
+        )
+
+        with self.assertRaises(DataValidationError):
+            merge_feature_collections(
+                collections[0], collections[1], {"type": "Point", "coordinates": [0, 0]}
+            )
+
     def test_merge_geojson(self):
         geojson1 = {
             "type": "Feature",
@@ -175,46 +318,81 @@ class TestGeoJSONUtils(unittest.TestCase):
             with self.assertRaises(GeoJSONError):
                 validate_geojson(test_geojson)
 
-    @mock.patch("json.loads")
-    @mock.patch("builtins.open", new_callable=mock.mock_open)
-    def test_process_geojson_batch(self, mock_open, mock_json_loads):
+    @mock.patch("src.utils.geojson_utils.Path")
+    def test_process_geojson_batch(self, mock_path):
         """Test processing a batch of GeoJSON files."""
-        # Setup mock for file reading
-        mock_file_data = '{"type": "Feature", "geometry": {"type": "Point", "coordinates": [0, 0]}, "properties": {"id": 1}}'
-        mock_open.return_value.__enter__.return_value.read.return_value = mock_file_data
-
-        # Setup parsed JSON data
-        file1_geojson = {
-            "type": "Feature",
-            "geometry": {"type": "Point", "coordinates": [0, 0]},
-            "properties": {"id": 1},
-        }
-        file2_geojson = {
-            "type": "Feature",
-            "geometry": {"type": "Point", "coordinates": [1, 1]},
-            "properties": {"id": 2},
-        }
-
-        # Mock json.loads to return our test data
-        mock_json_loads.side_effect = [file1_geojson, file2_geojson]
+        # Setup mock for file reading; files are read as raw bytes
+        mock_file_data = b'{"type": "Feature", "geometry": {"type": "Point", "coordinates": [0, 0]}, "properties": {"id": 1}}'
+        mock_path.return_value.read_bytes.return_value = mock_file_data
+        mock_path.return_value.stat.return_value.st_size = len(mock_file_data)
 
         # Setup temporary files
         test_files = ["file1.geojson", "file2.geojson"]
 
-        # Test the function - the actual implementation will call json.loads internally
+        # Test the function - the implementation parses the bytes with orjson
         result = process_geojson_batch(test_files)
 
         # Assertions
         self.assertEqual(result["type"], "FeatureCollection")
-        # Check that mock_open was called with each file path
-        mock_open.assert_any_call("file1.geojson", "r")
-        mock_open.assert_any_call("file2.geojson", "r")
-        self.assertEqual(mock_open.call_count, 2)
+        # Check that each file path was read
+        mock_path.assert_any_call("file1.geojson")
+        mock_path.assert_any_call("file2.geojson")
+        self.assertEqual(mock_path.return_value.read_bytes.call_count, 2)
 
         # Test with output_format="features"
-        mock_json_loads.side_effect = [file1_geojson, file2_geojson]
-        mock_open.reset_mock()
+        mock_path.reset_mock()
 
         result_features = process_geojson_batch(test_files, output_format="features")
         self.assertIsInstance(result_features, list)
         self.assertEqual(len(result_features), 2)
+
+    def test_process_geojson_batch_skips_bad_files_and_keeps_order(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = []
+            for name, content in [
+                ("a.geojson", b'{"type": "Point", "coordinates": [0, 0]}'),
+                ("bad.geojson", b"not json"),
+                ("b.geojson", b'{"type": "Point", "coordinates": [1, 1]}'),
+            ]:
+                path = os.path.join(tmp_dir, name)
+                with open(path, "wb") as f:
+                    f.write(content)
+                paths.append(path)
+            paths.append(os.path.join(tmp_dir, "missing.geojson"))
+
+            features = process_geojson_batch(paths, output_format="features")
+
+        self.assertEqual(
+            [feature["geometry"]["coordinates"] for feature in features],
+            [[0, 0], [1, 1]],
+        )
+        self.assertEqual(process_geojson_batch([])["features"], [])
+
+    def test_process_geojson_batch_validates_each_file_once(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "a.geojson")
+            with open(path, "wb") as f:
+                f.write(b'{"type": "Point", "coordinates": [2, 2]}')
+
+            with mock.patch(
+                "src.utils.geojson_utils.validate_geojson",
+                side_effect=validate_geojson,
+            ) as mock_validate:
+                features = process_geojson_batch([path], output_format="features")
+
+        self.assertEqual(len(features), 1)
+        mock_validate.assert_called_once()
+
+    def test_process_geojson_batch_serializes_large_files(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "a.geojson")
+            with open(path, "wb") as f:
+                f.write(b'{"type": "Point", "coordinates": [2, 2]}')
+
+            with mock.patch(
+                "src.utils.geojson_utils.LARGE_FILE_BYTES", 1
+            ), mock.patch("src.utils.geojson_utils._large_file_lock") as mock_lock:
+                features = process_geojson_batch([path], output_format="features")
+
+        self.assertEqual(len(features), 1)
+        mock_lock.__enter__.assert_called_once()
@@ -2,16 +2,27 @@ import unittest
 import logging
 import tempfile
 import io
+import os
+import queue
+import threading
+import uuid
 from pathlib import Path
 from unittest.mock import patch
 
+from src.utils import logging_utils
 from src.utils.logging_utils import (
     setup_logging,
     setup_structured_logging,
     LogContext,
     with_log_context,
     ContextAwareFormatter,
+    LazyFormat,
     clear_log_context,
+    get_log_context,
+    get_request_id,
+    stop_logging,
+    ContextQueueHandler,
+    BufferedFileHandler,
 )
 
 
@@ -31,6 +42,8 @@ class TestLoggingUtils(unittest.TestCase):
         root = logging.getLogger()
         for handler in root.handlers[:]:
             root.removeHandler(handler)
+        root.setLevel(logging.WARNING)
+        stop_logging()
         # Clear any context
         clear_log_context()
 
@@ -42,12 +55,17 @@ class TestLoggingUtils(unittest.TestCase):
         root_logger = logging.getLogger()
         self.assertEqual(root_logger.level, logging.INFO)
 
-        # Check that there's at least one handler (the default console handler)
-        self.assertGreaterEqual(len(root_logger.handlers), 1)
+        # Only the queue handler is attached to the root logger
+        self.assertEqual(len(root_logger.handlers), 1)
+        self.assertIsInstance(root_logger.handlers[0], ContextQueueHandler)
 
-        # Check handler types and formatting
+        # Check handler types and formatting on the listener
         console_handler = next(
-            (h for h in root_logger.handlers if isinstance(h, logging.StreamHandler)),
+            (
+                h
+                for h in logging_utils.log_listener.handlers
+                if isinstance(h, logging.StreamHandler)
+            ),
             None,
         )
         self.assertIsNotNone(console_handler, "No StreamHandler found")
@@ -69,12 +87,11 @@ class TestLoggingUtils(unittest.TestCase):
             # Setup logging with the temporary directory
             setup_logging(log_file_name=log_file, logs_dir=temp_dir)
 
-            # Get the root logger
-            root_logger = logging.getLogger()
-
-            # Check if a file handler was added
+            # Check if a file handler was added to the listener
             file_handlers = [
-                h for h in root_logger.handlers if isinstance(h, logging.FileHandler)
+                h
+                for h in logging_utils.log_listener.handlers
+                if isinstance(h, logging.FileHandler)
             ]
             self.assertGreaterEqual(len(file_handlers), 1, "No FileHandler was created")
 
@@ -88,6 +105,9 @@ class TestLoggingUtils(unittest.TestCase):
             test_message = "This is a test log message"
             logging.info(test_message)
 
+            # Drain the queue so the listener has written the record
+            stop_logging()
+
             # Check if the message was written to the file
             with open(log_file_path, "r") as f:
                 log_content = f.read()
@@ -144,14 +164,14 @@ class TestLoggingUtils(unittest.TestCase):
         """Test that multiple setup_logging calls work as expected."""
         # First call with no file
         setup_logging()
-        initial_handler_count = len(logging.getLogger().handlers)
+        initial_handler_count = len(logging_utils.log_listener.handlers)
 
         # Second call with a file
         with tempfile.TemporaryDirectory() as temp_dir:
             setup_logging(log_file_name="second_call.log", logs_dir=temp_dir)
 
             # Check that a new handler was added
-            new_handler_count = len(logging.getLogger().handlers)
+            new_handler_count = len(logging_utils.log_listener.handlers)
             self.assertEqual(
                 new_handler_count,
                 initial_handler_count + 1,
@@ -185,70 +205,136 @@ class TestLoggingUtils(unittest.TestCase):
             request_id="test-id",
         )
 
+    def test_buffered_file_handler_flushes_on_warning(self):
+        """Test that info records are buffered until a warning or close."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = Path(temp_dir) / "buffered.log"
+            handler = BufferedFileHandler(log_path, flush_interval=3600)
+            logger = logging.getLogger("buffered_file_test")
+            logger.propagate = False
+            logger.setLevel(logging.INFO)
+            logger.addHandler(handler)
+            try:
+                logger.info("buffered info")
+                self.assertEqual(log_path.read_text(), "")
+
+                logger.warning("urgent warning")
+                content = log_path.read_text()
+                self.assertIn("buffered info", content)
+                self.assertIn("urgent warning", content)
+
+                logger.info("written on close")
+            finally:
+                logger.removeHandler(handler)
+                handler.close()
+
+            self.assertIn("written on close", log_path.read_text())
+
+    def test_queue_handler_captures_context_at_emit(self):
+        """Test that queued records keep the context active when they were logged."""
+        log_queue = queue.SimpleQueue()
+        logger = logging.getLogger("queue_context_test")
+        logger.propagate = False
+        handler = ContextQueueHandler(log_queue)
+        logger.addHandler(handler)
+        try:
+            with LogContext(request_id="abc-123"):
+                logger.warning("queued")
+        finally:
+            logger.removeHandler(handler)
+
+        # The context has been restored, but the record still carries it
+        record = log_queue.get_nowait()
+        self.assertEqual(record.request_id, "abc-123")
+        self.assertEqual(record.getMessage(), "queued")
+
+    def test_get_request_id_unique_uuid4(self):
+        """Test that buffered request IDs are distinct version 4 UUIDs."""
+        with patch(
+            "src.utils.logging_utils.os.urandom", wraps=os.urandom
+        ) as mock_urandom:
+            request_ids = [get_request_id() for _ in range(600)]
+
+        self.assertEqual(len(set(request_ids)), 600)
+        self.assertTrue(all(uuid.UUID(rid).version == 4 for rid in request_ids))
+        # 600 IDs need at most three 256-ID refills
+        self.assertLessEqual(mock_urandom.call_count, 3)
+
     def test_log_context_manager_basic(self):
         """Test that LogContext properly sets context values."""
         # Before context, should be empty
         clear_log_context()
 
         # Verify initial state
-        self.assertFalse(hasattr(logging, "context"))
+        self.assertEqual(get_log_context(), {})
 
         with LogContext(operation="test_op", user_id="123"):
             # Inside context, values should be set
-            self.assertTrue(hasattr(logging, "context"))
-            self.assertEqual(logging.context.get("operation"), "test_op")
-            self.assertEqual(logging.context.get("user_id"), "123")
+            self.assertEqual(get_log_context().get("operation"), "test_op")
+            self.assertEqual(get_log_context().get("user_id"), "123")
 
         # After context, values should be back to previous state (empty in this case)
-        # In the implementation, LogContext.__exit__ restores self.old_context (which is {} initially)
-        # So after the context exits, logging.context should be empty ({}) but still exist
-        self.assertTrue(hasattr(logging, "context"))
-        self.assertEqual(logging.context, {})
+        self.assertEqual(get_log_context(), {})
 
     def test_nested_log_context(self):
         """Test that nested LogContexts properly merge."""
         # Ensure clean state
         clear_log_context()
-        # Initial setup - the LogContext in __init__ creates an empty dict
-        logging.context = {}
 
         with LogContext(service="auth"):
-            self.assertEqual(logging.context.get("service"), "auth")
+            self.assertEqual(get_log_context().get("service"), "auth")
 
             with LogContext(operation="login"):
-                self.assertEqual(logging.context.get("service"), "auth")
-                self.assertEqual(logging.context.get("operation"), "login")
+                self.assertEqual(get_log_context().get("service"), "auth")
+                self.assertEqual(get_log_context().get("operation"), "login")
 
                 with LogContext(user_id="123"):
-                    self.assertEqual(logging.context.get("service"), "auth")
-                    self.assertEqual(logging.context.get("operation"), "login")
-                    self.assertEqual(logging.context.get("user_id"), "123")
+                    self.assertEqual(get_log_context().get("service"), "auth")
+                    self.assertEqual(get_log_context().get("operation"), "login")
+                    self.assertEqual(get_log_context().get("user_id"), "123")
 
                 # After inner context
-                self.assertEqual(logging.context.get("service"), "auth")
-                self.assertEqual(logging.context.get("operation"), "login")
-                self.assertNotIn("user_id", logging.context)
+                self.assertEqual(get_log_context().get("service"), "auth")
+                self.assertEqual(get_log_context().get("operation"), "login")
+                self.assertNotIn("user_id", get_log_context())
 
             # After middle context
-            self.assertEqual(logging.context.get("service"), "auth")
-            self.assertNotIn("operation", logging.context)
+            self.assertEqual(get_log_context().get("service"), "auth")
+            self.assertNotIn("operation", get_log_context())
+
+        # After outer context - should be back to empty
+        self.assertEqual(get_log_context(), {})
+
+    def test_log_context_isolated_between_threads(self):
+        """Test that a thread does not see another thread's context."""
+        clear_log_context()
+        seen = {}
 
-        # After outer context - should be back to empty but still exist
-        self.assertTrue(hasattr(logging, "context"))
-        self.assertEqual(logging.context, {})
+        def worker():
+            seen["before"] = dict(get_log_context())
+            with LogContext(operation="worker_only"):
+                seen["inside"] = dict(get_log_context())
+
+        with LogContext(operation="main_only"):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+            self.assertEqual(get_log_context(), {"operation": "main_only"})
+
+        self.assertEqual(seen["before"], {})
+        self.assertEqual(seen["inside"], {"operation": "worker_only"})
 
     def test_with_log_context_decorator(self):
         """Test that the with_log_context decorator sets context values."""
         # Ensure clean state
         clear_log_context()
-        # Initial setup - the decorator ultimately creates an empty dict through LogContext
-        logging.context = {}
+        logging.getLogger().setLevel(logging.DEBUG)
 
         @with_log_context(module="test_module", operation="test_operation")
         def test_function(arg1, arg2=None):
             # Access the parameters to avoid unaccessed parameter warnings
             _ = arg1, arg2
-            return logging.context
+            return get_log_context()
 
         # Call the function and check context
         context = test_function("value1", arg2="value2")
@@ -256,15 +342,24 @@ class TestLoggingUtils(unittest.TestCase):
         self.assertEqual(context.get("operation"), "test_operation")
 
         # After function call, context should be back to empty (the old context)
-        self.assertTrue(hasattr(logging, "context"))
-        self.assertEqual(logging.context, {})
+        self.assertEqual(get_log_context(), {})
+
+    def test_with_log_context_skipped_above_debug(self):
+        """Test that the decorator leaves the context untouched above DEBUG."""
+        clear_log_context()
+        logging.getLogger().setLevel(logging.INFO)
+
+        @with_log_context(module="test_module")
+        def test_function():
+            return get_log_context()
+
+        self.assertEqual(test_function(), {})
 
     @patch("logging.Logger.info")
     def test_actual_logging_with_context(self, mock_log_info):
         """Test integration of context with actual logging calls."""
         # Ensure clean state
-        if hasattr(logging, "context"):
-            delattr(logging, "context")
+        clear_log_context()
 
         logger = logging.getLogger("test")
 
@@ -291,11 +386,9 @@ class TestLoggingUtils(unittest.TestCase):
         handler.setFormatter(formatter)
         test_logger.addHandler(handler)
 
-        # Set context values
-        logging.context = {"operation": "test_op", "user_id": "user123"}
-
-        # Log a message
-        test_logger.info("Test message")
+        # Log a message with context values set
+        with LogContext(operation="test_op", user_id="user123"):
+            test_logger.info("Test message")
 
         # Get the log output
         output = string_io.getvalue()
@@ -304,23 +397,43 @@ class TestLoggingUtils(unittest.TestCase):
         self.assertIn("test_op", output)
         self.assertIn("user123", output)
 
-        # Clean up the context
-        if hasattr(logging, "context"):
-            delattr(logging, "context")
+    def test_formatter_defaults_and_builtin_fields(self):
+        """Test request_id defaults and that context never overrides record fields."""
+        formatter = ContextAwareFormatter("%(request_id)s %(module)s %(message)s")
+        record = logging.LogRecord(
+            "test", logging.INFO, "/tmp/source_module.py", 1, "hello", None, None
+        )
+
+        with LogContext(module="context_module"):
+            output = formatter.format(record)
+
+        self.assertEqual(output, "- source_module hello")
 
     def test_log_context_with_non_string_values(self):
         """Test that LogContext handles non-string values."""
         # Ensure clean state
-        if hasattr(logging, "context"):
-            delattr(logging, "context")
+        clear_log_context()
 
         complex_value = {"nested": {"data": [1, 2, 3]}}
 
         with LogContext(complex_key=complex_value, number=42, boolean=True):
-            self.assertTrue(hasattr(logging, "context"))
-            self.assertEqual(logging.context.get("complex_key"), complex_value)
-            self.assertEqual(logging.context.get("number"), 42)
-            self.assertEqual(logging.context.get("boolean"), True)
+            self.assertEqual(get_log_context().get("complex_key"), complex_value)
+            self.assertEqual(get_log_context().get("number"), 42)
+            self.assertEqual(get_log_context().get("boolean"), True)
+
+
+    def test_lazy_format_defers_conversion(self):
+        """Test that LazyFormat only calls its function when stringified."""
+        calls = []
+
+        def expensive(value):
+            calls.append(value)
+            return f"<{value}>"
+
+        lazy = LazyFormat(expensive, 7)
+        self.assertEqual(calls, [])
+        self.assertEqual(str(lazy), "<7>")
+        self.assertEqual(calls, [7])
 
 
 if __name__ == "__main__":
@@ -1,5 +1,10 @@
 import unittest
-from src.utils.math_utils import calculate_geographic_midpoint
+from unittest.mock import patch
+
+from src.utils.math_utils import (
+    calculate_geographic_midpoint,
+    calculate_geographic_midpoints,
+)
 from src.utils.error_utils import DataValidationError
 
 
@@ -28,8 +33,8 @@ class TestMathUtils(unittest.TestCase):
             (41.8781, -87.6298),  # Chicago
             (29.7604, -95.3698),  # Houston
         ]
-        # Expected values calculated using external reference implementation
-        expected = [36.8889, -94.0756]
+        # Expected values from the mean of the unit-sphere Cartesian vectors
+        expected = [37.6884, -94.3573]
         result = calculate_geographic_midpoint(coords)
         self.assertAlmostEqual(result[0], expected[0], places=4)
         self.assertAlmostEqual(result[1], expected[1], places=4)
@@ -85,5 +90,52 @@ class TestMathUtils(unittest.TestCase):
         self.assertAlmostEqual(result[1], original_coords[0][1], places=5)
 
 
+    def test_calculate_geographic_midpoint_cluster_across_date_line(self):
+        """Test a multi-point cluster straddling the international date line."""
+        coords = [(10.0, 179.0), (10.0, -179.0), (12.0, 179.5), (8.0, -179.5)]
+        result = calculate_geographic_midpoint(coords)
+        self.assertAlmostEqual(result[0], 10.0, places=1)
+        self.assertTrue(abs(abs(result[1]) - 180) < 0.01)
+
+    def test_small_and_vectorized_paths_agree(self):
+        """Test that the math-module and NumPy paths give the same midpoint."""
+        coords = [(10.0 + i * 0.1, 179.0 - (i % 5) * 0.9) for i in range(20)]
+        coords += [(10.0, -179.0), (12.0, -179.5)]
+
+        small = calculate_geographic_midpoint(coords)
+        with patch("src.utils.math_utils.VECTORIZE_THRESHOLD", 0):
+            vectorized = calculate_geographic_midpoint(coords)
+
+        self.assertAlmostEqual(small[0], vectorized[0], places=9)
+        self.assertAlmostEqual(small[1], vectorized[1], places=9)
+
+    def test_calculate_geographic_midpoints_matches_single_calls(self):
+        """Test that the batched midpoints match one call per group."""
+        groups = [
+            [(40.7128, -74.0060), (34.0522, -118.2437)],
+            [(45.0, -75.0)],
+            [(10.0, 179.0), (10.0, -179.0), (12.0, 179.5), (8.0, -179.5)],
+        ]
+        coords_flat = [coord for group in groups for coord in group]
+
+        result = calculate_geographic_midpoints(coords_flat, [0, 2, 3])
+
+        self.assertEqual(result.shape, (3, 2))
+        for (lat, lon), group in zip(result[:2], groups[:2]):
+            expected = calculate_geographic_midpoint(group)
+            self.assertAlmostEqual(lat, expected[0], places=6)
+            self.assertAlmostEqual(lon, expected[1], places=6)
+        # The date line cluster lands on +/-180 either way
+        self.assertAlmostEqual(result[2][0], 10.0, places=1)
+        self.assertTrue(abs(abs(result[2][1]) - 180) < 0.01)
+
+    def test_calculate_geographic_midpoints_invalid_offsets(self):
+        """Test that malformed group offsets are rejected."""
+        coords = [(0, 0), (1, 1), (2, 2)]
+        for offsets in ([], [1, 2], [0, 2, 2], [0, 3]):
+            with self.assertRaises(DataValidationError):
+                calculate_geographic_midpoints(coords, offsets)
+
+
 if __name__ == "__main__":
     unittest.main()
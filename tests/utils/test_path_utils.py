@@ -1,10 +1,17 @@
 import os
 import shutil
+import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
-from src.utils.path_utils import ensure_dirs_exist
+from src.utils import path_utils
+from src.utils.path_utils import (
+    add_project_root_to_path,
+    ensure_dirs_exist,
+    find_project_root,
+)
 
 
 class TestPathUtils(unittest.TestCase):
@@ -101,5 +108,63 @@ class TestPathUtils(unittest.TestCase):
         self.assertTrue(os.path.exists(self.test_dir))
 
 
+    def test_ensure_dirs_exist_duplicates_and_nested(self):
+        """Test that duplicate and nested paths in any order are created once."""
+        child = os.path.join(self.test_dir, "parent", "child")
+        parent = Path(self.test_dir) / "parent"
+
+        ensure_dirs_exist([child, parent, child, str(parent)])
+
+        self.assertTrue(os.path.isdir(child))
+        self.assertTrue(parent.is_dir())
+
+    def test_ensure_dirs_exist_skips_ancestors_of_created_paths(self):
+        """Test that parents created along with a child are not checked again."""
+        base = os.path.join(self.test_dir, "out")
+        paths = [base, os.path.join(base, "a"), os.path.join(base, "a", "b")]
+
+        with patch(
+            "src.utils.path_utils.os.path.isdir", return_value=False
+        ) as isdir:
+            ensure_dirs_exist(paths)
+
+        isdir.assert_called_once_with(os.path.join(base, "a", "b"))
+        for path in paths:
+            self.assertTrue(os.path.isdir(path))
+
+    def test_find_project_root_cached_per_start_dir(self):
+        """Test that marker lookups are cached until the cache is cleared."""
+        find_project_root.cache_clear()
+        start = Path(self.test_dir) / "pkg"
+        start.mkdir()
+        (Path(self.test_dir) / "pyproject.toml").touch()
+
+        self.assertEqual(find_project_root(start), Path(self.test_dir))
+
+        # Adding a closer marker is not seen until the cache is cleared
+        (start / "setup.py").touch()
+        self.assertEqual(find_project_root(start), Path(self.test_dir))
+        find_project_root.cache_clear()
+        self.assertEqual(find_project_root(start), start)
+        find_project_root.cache_clear()
+
+    def test_add_project_root_to_path_checks_current_path(self):
+        """Test that the root is inserted once and again if later removed."""
+        project_root = str(path_utils._default_project_root())
+        original_path = sys.path[:]
+        try:
+            sys.path[:] = [p for p in sys.path if p != project_root]
+            self.assertTrue(add_project_root_to_path())
+            self.assertEqual(sys.path[0], project_root)
+            self.assertFalse(add_project_root_to_path())
+            self.assertEqual(sys.path.count(project_root), 1)
+
+            # Code that rewrites sys.path must not leave the root missing
+            sys.path.remove(project_root)
+            self.assertTrue(add_project_root_to_path())
+            self.assertEqual(sys.path[0], project_root)
+        finally:
+            sys.path[:] = original_path
+
 if __name__ == "__main__":
     unittest.main()
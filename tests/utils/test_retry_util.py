@@ -50,6 +50,74 @@ class TestRetryUtil(unittest.TestCase):
         mock_sleep.assert_has_calls([call(2), call(4)])
         self.assertEqual(mock_sleep.call_count, 2)
 
+    @patch("src.utils.retry_util.random.random", return_value=1.0)
+    @patch("time.sleep")
+    def test_exponential_backoff_with_jitter(self, mock_sleep, _mock_random):
+        """Test that jittered backoff doubles per attempt and respects the cap."""
+        mock_func = Mock(side_effect=[ValueError("Failed")] * 4 + ["success"])
+
+        retry(mock_func, retries=5, delay=2, jitter=True, cap=10)
+
+        mock_sleep.assert_has_calls([call(2), call(4), call(8), call(10)])
+
+    @patch("src.utils.retry_util.random.random", return_value=0.0)
+    @patch("time.sleep")
+    def test_jitter_halves_minimum_wait(self, mock_sleep, _mock_random):
+        """Test that jitter never waits less than half the backoff."""
+        mock_func = Mock(side_effect=[ValueError("Failed"), "success"])
+
+        retry(mock_func, retries=2, delay=2, jitter=True)
+
+        mock_sleep.assert_called_once_with(1.0)
+
+    @patch("src.utils.retry_util.random.random")
+    @patch("time.sleep")
+    def test_jittered_waits_never_exceed_cap(self, mock_sleep, mock_random):
+        """Test that every jittered wait stays within half the backoff and the cap."""
+        mock_random.side_effect = [0.0, 0.99, 0.5, 0.99, 0.25, 0.99]
+        mock_func = Mock(side_effect=[ValueError("Failed")] * 6 + ["success"])
+
+        retry(mock_func, retries=7, delay=3, jitter=True, cap=20)
+
+        waits = [c.args[0] for c in mock_sleep.call_args_list]
+        self.assertEqual(len(waits), 6)
+        for attempt, wait in enumerate(waits):
+            backoff = min(20, 3 * 2**attempt)
+            self.assertGreaterEqual(wait, backoff / 2)
+            self.assertLessEqual(wait, 20)
+
+    @patch("src.utils.retry_util.time.monotonic")
+    @patch("time.sleep")
+    def test_max_elapsed_stops_retries(self, mock_sleep, mock_monotonic):
+        """Test that no retry starts once its wait would overrun the budget."""
+        # Start, then one reading per failed attempt
+        mock_monotonic.side_effect = [100.0, 101.0, 104.0, 104.5]
+        mock_func = Mock(side_effect=ValueError("Failed"))
+
+        with self.assertRaises(APIError) as context:
+            retry(mock_func, retries=5, delay=2, max_elapsed=6)
+
+        # 1 + 2 fits the budget; 4 + 4 would not
+        mock_sleep.assert_called_once_with(2)
+        self.assertEqual(mock_func.call_count, 2)
+        self.assertIn("failed after 2 attempts", str(context.exception))
+
+    @patch("time.sleep")
+    def test_retry_on_reraises_rejected_errors(self, mock_sleep):
+        """Test that errors rejected by retry_on propagate without retrying."""
+        mock_func = Mock(side_effect=[ConnectionError("reset"), KeyError("bad")])
+
+        with self.assertRaises(KeyError):
+            retry(
+                mock_func,
+                retries=3,
+                delay=1,
+                retry_on=lambda e: isinstance(e, ConnectionError),
+            )
+
+        self.assertEqual(mock_func.call_count, 2)
+        mock_sleep.assert_called_once_with(1)
+
     def test_custom_error_handler(self):
         """Test that custom error handler is called on failures."""
         error_handler = Mock()
@@ -99,6 +167,18 @@ class TestRetryUtil(unittest.TestCase):
         mock_logging.warning.assert_called()
         mock_logging.error.assert_called()
 
+    def test_attempt_and_error_attached_to_records(self):
+        """Test that per-attempt fields are set on the log records themselves."""
+        mock_func = Mock(side_effect=[ValueError("Failed"), "success"])
+
+        with patch("time.sleep"), self.assertLogs(level="INFO") as logs:
+            retry(mock_func, retries=2, delay=0.1)
+
+        warning = next(r for r in logs.records if r.levelname == "WARNING")
+        self.assertEqual(warning.attempt, 1)
+        self.assertEqual(warning.error, "Failed")
+        self.assertEqual(logs.records[-1].attempt, 2)
+
     def test_error_handler_exception(self):
         """Test that exceptions in the error handler are caught and logged."""
         # Create an error handler that raises an exception